@@ -0,0 +1,13 @@
+import os
+
+def get_app_data_path():
+    """
+    Uygulama verilerinin tutulduğu klasör.
+    Windows'ta '%LOCALAPPDATA%/VidExtract', diğer sistemlerde '~/.local/share/VidExtract'.
+    """
+    base_path = os.getenv('LOCALAPPDATA') or os.path.join(os.path.expanduser("~"), ".local", "share")
+    return os.path.join(base_path, 'VidExtract')
+
+APP_DATA_PATH = get_app_data_path()
+TARGET_PATH = os.path.join(APP_DATA_PATH, "ffmpeg")
+TARGET_BIN_PATH = os.path.join(TARGET_PATH, "bin")
@@ -0,0 +1,154 @@
+"""
+Arayüzsüz toplu indirme: python -m vidextract batch urls.txt --workers 4 --format mp3
+
+Bu modül ve içe aktardıkları PySide6 yüklemez; sunucularda ve cron görevlerinde çalışabilir.
+VIDEXTRACT_JSON_LOG=1 ile kayıtlar ayrıca iş numarasıyla etiketli JSON satırları olarak yazılır.
+"""
+import argparse
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from download_runner import DownloadRunner, AUDIO_FORMATS, VIDEO_FORMATS
+from info_cache import cache_key
+from languages import LANGUAGES
+from logger_setup import logger
+from progress import format_eta, format_progress, format_speed
+from rate_estimator import queue_eta
+
+CLI_LANGUAGE = "en"
+
+def parse_url_lines(lines, playlist=False):
+    """ Her satırda bir URL; boş satırlar ve '#' ile başlayan satırlar atlanır, aynı videoya giden tekrarlar bir kez alınır. """
+    urls = []
+    seen = set()
+    for line in lines:
+        url = line.strip()
+        if not url or url.startswith('#'):
+            continue
+        key = cache_key(url, playlist=playlist)
+        if key in seen:
+            continue
+        seen.add(key)
+        urls.append(url)
+    return urls
+
+def read_url_list(path, playlist=False):
+    with open(path, encoding='utf-8-sig') as f:
+        return parse_url_lines(f, playlist=playlist)
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="vidextract batch", description="VidExtract arayüzsüz toplu indirme")
+    parser.add_argument("url_file", help="Her satırda bir URL içeren metin dosyası ('-' = stdin)")
+    parser.add_argument("--workers", type=int, default=3, help="Aynı anda çalışacak indirme sayısı (varsayılan: 3)")
+    parser.add_argument("--format", dest="output_format", default="mp4", choices=AUDIO_FORMATS + VIDEO_FORMATS,
+                        help="Çıktı formatı (varsayılan: mp4)")
+    parser.add_argument("--quality", default="best", help="Video kalitesi, ör. 1080 veya best (varsayılan: best)")
+    parser.add_argument("--output", "-o", default="downloads", help="İndirme klasörü (varsayılan: downloads)")
+    parser.add_argument("--playlist", action="store_true", help="URL'leri playlist olarak indir")
+    parser.add_argument("--playlist-workers", type=int, default=3, help="Playlist başına paralel video sayısı")
+    parser.add_argument("--subs", action="store_true", help="Altyazıları indir ve göm")
+    parser.add_argument("--sub-langs", default="", help="Altyazı dilleri, ör. en,tr")
+    parser.add_argument("--cookies", default="", help="cookies.txt dosya yolu")
+    parser.add_argument("--discard-partial", action="store_true", help="İptalde yarım dosyaları sil")
+    parser.add_argument("--progress-interval", type=float, default=2.0,
+                        help="Konsola ilerleme yazma aralığı, saniye (varsayılan: 2)")
+    parser.add_argument("--no-archive", action="store_true", help="İndirme arşivini yok say, her şeyi yeniden indir")
+    return parser
+
+def make_runner(url, args, job_id=None):
+    lang = LANGUAGES[CLI_LANGUAGE]
+    is_audio = args.output_format in AUDIO_FORMATS
+    quality = args.quality if args.quality == "best" else args.quality.rstrip("p") + "p"
+    return DownloadRunner(
+        url, args.output, quality,
+        lang["list_type_audio"] if is_audio else lang["list_type_video"],
+        lang[args.output_format],
+        "playlist" if args.playlist else "video",
+        CLI_LANGUAGE, args.subs, args.sub_langs, args.cookies,
+        playlist_workers=args.playlist_workers,
+        keep_partial_files=not args.discard_partial,
+        use_archive=not args.no_archive,
+        job_id=job_id, service="batch",
+    )
+
+def run_batch(urls, args):
+    total = len(urls)
+    runners = {index: make_runner(url, args, job_id=index) for index, url in enumerate(urls, start=1)}
+
+    def report(index, message):
+        print(f"[{index}/{total}] {message.replace('**', '')}", flush=True)
+
+    def download(index):
+        report(index, f"Başlatılıyor: {runners[index].url}")
+        return runners[index].run()
+
+    failed = 0
+    finished_sizes = []
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        futures = {pool.submit(download, index): index for index in runners}
+        pending = set(futures)
+        try:
+            while pending:
+                done, pending = wait(pending, timeout=args.progress_interval, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = futures[future]
+                    succeeded, message = future.result()
+                    job_total = runners[index].transfer.totals()[1]
+                    if not succeeded:
+                        failed += 1
+                    elif job_total:
+                        finished_sizes.append(job_total)
+                    report(index, message.splitlines()[0])
+                job_totals = []
+                for future in pending:
+                    runner = runners[futures[future]]
+                    snapshot = runner.progress.poll()
+                    if snapshot is not None:
+                        _, text = format_progress(snapshot, CLI_LANGUAGE)
+                        report(futures[future], " | ".join(text.splitlines()))
+                    if future.running():
+                        job_downloaded, job_total, speed, _ = runner.transfer.totals()
+                        job_totals.append((job_downloaded, job_total, speed))
+                if job_totals:
+                    queued = sum(1 for future in pending if not future.running())
+                    average = sum(finished_sizes) / len(finished_sizes) if finished_sizes else None
+                    eta = queue_eta(job_totals, queued, average)
+                    print(f"Kuyruk: {format_speed(sum(speed for _, _, speed in job_totals))} | "
+                          f"aktif {len(job_totals)}, sırada {queued} | kalan ~{format_eta(eta)}", flush=True)
+        except KeyboardInterrupt:
+            print("İptal ediliyor...", file=sys.stderr, flush=True)
+            for future in futures:
+                future.cancel()
+            for runner in runners.values():
+                runner.cancel()
+            raise
+
+    print(f"Bitti: {total - failed}/{total} başarılı.", flush=True)
+    return 0 if failed == 0 else 1
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    try:
+        if args.url_file == "-":
+            urls = parse_url_lines(sys.stdin, playlist=args.playlist)
+        else:
+            urls = read_url_list(args.url_file, playlist=args.playlist)
+    except OSError as e:
+        print(f"URL dosyası okunamadı: {e}", file=sys.stderr)
+        return 2
+
+    if not urls:
+        print("İndirilecek URL bulunamadı.", file=sys.stderr)
+        return 2
+
+    os.makedirs(args.output, exist_ok=True)
+    logger.info(f"Toplu indirme: {len(urls)} URL, {args.workers} işçi, format={args.output_format}")
+    try:
+        return run_batch(urls, args)
+    except KeyboardInterrupt:
+        return 130
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""
+Performans ölçümleri (gerilemeleri yakalamak için).
+
+    python benchmarks.py import [--runs 5] [--budget-ms 1500]
+    python benchmarks.py paint [--frames 500]
+
+'import': vidextract modülünün temiz bir yorumlayıcıda içe aktarılma süresini ölçer ve
+açılışta yüklenmemesi gereken ağır modüllerin (yt_dlp, requests, QtMultimedia) yüklenip yüklenmediğini denetler.
+'paint': ShimmerProgressBar'ın kare başına çizim maliyetini (aktif ve boşta) ölçer; boşta zamanlayıcı çalışıyorsa gerilemedir.
+Gerileme bulunursa 1 ile çıkar.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+PROJECT_PATH = os.path.dirname(os.path.abspath(__file__))
+LAZY_MODULES = ("yt_dlp", "requests", "PySide6.QtMultimedia")
+
+IMPORT_PROBE = (
+    "import json, sys, time\n"
+    "started = time.perf_counter()\n"
+    "import vidextract\n"
+    "elapsed = time.perf_counter() - started\n"
+    "print(json.dumps({'ms': elapsed * 1000, 'loaded': [m for m in %r if m in sys.modules]}))\n"
+)
+
+def bench_import(runs=5):
+    """ (süreler_ms, açılışta_yüklenen_ağır_modüller) döndürür. """
+    timings = []
+    loaded = set()
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", IMPORT_PROBE % (LAZY_MODULES,)],
+            capture_output=True, text=True, cwd=PROJECT_PATH, check=True
+        )
+        measurement = json.loads(result.stdout.strip().splitlines()[-1])
+        timings.append(measurement['ms'])
+        loaded.update(measurement['loaded'])
+    return timings, sorted(loaded)
+
+def run_import_benchmark(args):
+    try:
+        timings, loaded = bench_import(args.runs)
+    except subprocess.CalledProcessError as e:
+        error_lines = (e.stderr or "").strip().splitlines()
+        print(f"vidextract içe aktarılamadı: {error_lines[-1] if error_lines else e}")
+        return 2
+    median = statistics.median(timings)
+    print(f"vidextract içe aktarma: medyan {median:.0f} ms (en az {min(timings):.0f}, en çok {max(timings):.0f}, {len(timings)} ölçüm)")
+
+    failed = False
+    if loaded:
+        print(f"GERİLEME: açılışta yüklenmemesi gereken modüller yüklendi: {', '.join(loaded)}")
+        failed = True
+    if args.budget_ms and median > args.budget_ms:
+        print(f"GERİLEME: medyan süre {args.budget_ms:.0f} ms sınırını aşıyor.")
+        failed = True
+    return 1 if failed else 0
+
+def bench_paint(frames=500, width=420, height=48):
+    """ Ekransız (offscreen) Qt ile ShimmerProgressBar çizim süresini ölçer; kare başına µs döndürür. """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sys.path.insert(0, PROJECT_PATH)
+    from PySide6.QtGui import QImage
+    from PySide6.QtWidgets import QApplication
+    from vidextract import ShimmerProgressBar
+
+    app = QApplication.instance() or QApplication([])
+    bar = ShimmerProgressBar()
+    bar.resize(width, height)
+    bar.show()
+    image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+
+    def measure(value, text):
+        bar.setValue(value)
+        bar.setFormat(text)
+        app.processEvents()
+        started = time.perf_counter()
+        for _ in range(frames):
+            bar.update_shimmer()
+            bar.render(image)
+        return (time.perf_counter() - started) / frames * 1e6, bar.is_animating()
+
+    active_us, _ = measure(42, "**📥 İndiriliyor: %42**\n🔹 12.0MB / 28.5MB\n🚀 Hız: 2.1MB/s | ⏳ 8s")
+    idle_us, idle_animating = measure(0, "")
+    bar.close()
+    return active_us, idle_us, idle_animating
+
+def run_paint_benchmark(args):
+    active_us, idle_us, idle_animating = bench_paint(args.frames)
+    print(f"ShimmerProgressBar çizimi: aktif {active_us:.0f} µs/kare, boşta {idle_us:.0f} µs/kare ({args.frames} kare)")
+    if idle_animating:
+        print("GERİLEME: ilerleme yokken parıltı zamanlayıcısı çalışıyor.")
+        return 1
+    if args.budget_us and active_us > args.budget_us:
+        print(f"GERİLEME: aktif çizim {args.budget_us:.0f} µs/kare sınırını aşıyor.")
+        return 1
+    return 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="VidExtract performans ölçümleri")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    import_parser = subparsers.add_parser("import", help="vidextract içe aktarma süresi")
+    import_parser.add_argument("--runs", type=int, default=5)
+    import_parser.add_argument("--budget-ms", type=float, default=None, help="Aşılırsa gerileme sayılacak medyan süre")
+    import_parser.set_defaults(func=run_import_benchmark)
+
+    paint_parser = subparsers.add_parser("paint", help="ShimmerProgressBar çizim maliyeti")
+    paint_parser.add_argument("--frames", type=int, default=500)
+    paint_parser.add_argument("--budget-us", type=float, default=None, help="Aşılırsa gerileme sayılacak kare süresi")
+    paint_parser.set_defaults(func=run_paint_benchmark)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
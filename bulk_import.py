@@ -0,0 +1,97 @@
+import threading
+
+from PySide6.QtCore import QObject, Signal
+
+from fetch_executor import get_fetch_executor
+from info_cache import cache_key
+from logger_setup import logger
+from url_classifier import is_playlist_url
+
+class BulkImporter(QObject):
+    """
+    Toplu yapıştırılan / içe aktarılan URL'lerin bilgisini paylaşılan bilgi havuzunda sırayla çıkarır.
+    Aynı anda en fazla 'max_in_flight' URL işlenir; böylece havuzda tekil doğrulamalara da yer kalır.
+    Bilgisi hazır olan her URL 'entry_ready' ile hemen bildirilir, pencere onu kuyruğa ekler ve
+    sonraki URL'lerin çıkarılması sürerken önceki indirmeler başlar.
+    'backlog()' 'max_backlog' değerine ulaştığında (kuyrukta bekleyen iş çoksa) çıkarma durur, resume() ile sürer;
+    böylece önbelleğe alınan bilgiler indirme sırası gelmeden bayatlamaz.
+    """
+    entry_ready = Signal(str, object)
+    entry_failed = Signal(str, str)
+    progress = Signal(int, int, int)   # hazır, hatalı, toplam
+    finished = Signal(int, int)        # hazır, hatalı
+
+    def __init__(self, urls, fetch, group=None, max_in_flight=2, backlog=None, max_backlog=32, parent=None):
+        super().__init__(parent)
+        seen = set()
+        self.urls = []
+        for url in urls:
+            key = cache_key(url, playlist=is_playlist_url(url))
+            if key not in seen:
+                seen.add(key)
+                self.urls.append(url)
+        self.fetch = fetch
+        self.group = group
+        self.max_in_flight = max(1, max_in_flight)
+        self.backlog = backlog
+        self.max_backlog = max_backlog
+        self._lock = threading.Lock()
+        self._next_index = 0
+        self._in_flight = 0
+        self._ready = 0
+        self._failed = 0
+        self._cancelled = False
+
+    def start(self):
+        logger.info(f"Toplu içe aktarma başladı: {len(self.urls)} URL.")
+        self._submit_more()
+
+    def resume(self):
+        self._submit_more()
+
+    def cancel(self):
+        with self._lock:
+            self._cancelled = True
+        get_fetch_executor().cancel(self)
+
+    def _submit_more(self):
+        to_submit = []
+        backlog = self.backlog() if self.backlog else 0
+        with self._lock:
+            while (not self._cancelled and self._in_flight < self.max_in_flight
+                   and self._next_index < len(self.urls)
+                   and backlog + self._in_flight < self.max_backlog):
+                to_submit.append(self.urls[self._next_index])
+                self._next_index += 1
+                self._in_flight += 1
+        for url in to_submit:
+            get_fetch_executor().request(
+                self, url, self.fetch, lambda info, url=url: self._on_fetched(url, info),
+                group=self.group, supersede=False,
+            )
+
+    def _on_fetched(self, url, info):
+        """ Havuz iş parçacığında çağrılır; sonuç sinyalle ana iş parçacığına geçer. """
+        with self._lock:
+            self._in_flight -= 1
+            if self._cancelled:
+                return
+            error = info.get("error") if isinstance(info, dict) else "bilgi alınamadı"
+            if error:
+                self._failed += 1
+            else:
+                self._ready += 1
+            ready, failed = self._ready, self._failed
+            done = self._next_index >= len(self.urls) and self._in_flight == 0
+
+        if error:
+            logger.warning(f"Toplu içe aktarma: bilgi alınamadı ({url}): {error}")
+            self.entry_failed.emit(url, str(error))
+        else:
+            self.entry_ready.emit(url, info)
+        self.progress.emit(ready, failed, len(self.urls))
+        if done:
+            logger.info(f"Toplu içe aktarma bitti: {ready} hazır, {failed} hatalı.")
+            self.finished.emit(ready, failed)
+        else:
+            self._submit_more()
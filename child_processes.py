@@ -0,0 +1,113 @@
+import os
+import threading
+
+from logger_setup import logger
+
+_lock = threading.Lock()
+_processes = {}
+_outputs = {}
+_local = threading.local()
+_installed = False
+
+def set_owner(owner):
+    """ Bu iş parçacığında yt-dlp tarafından başlatılacak alt süreçleri 'owner' işine bağlar. """
+    _local.owner = owner
+
+def clear_owner():
+    _local.owner = None
+
+def register(process):
+    owner = getattr(_local, 'owner', None)
+    if owner is None:
+        return
+    with _lock:
+        running = [p for p in _processes.get(owner, []) if p.poll() is None]
+        running.append(process)
+        _processes[owner] = running
+
+def register_output(path):
+    """ Bu iş parçacığında başlatılan sürecin yazdığı geçici dosyayı işe bağlar (süreç öldürülürse silinir). """
+    owner = getattr(_local, 'owner', None)
+    if owner is None:
+        return
+    with _lock:
+        _outputs.setdefault(owner, set()).add(path)
+
+def release_output(path):
+    """ Geçici dosya yerine taşındı veya silindi; artık işe ait sayılmaz. """
+    owner = getattr(_local, 'owner', None)
+    with _lock:
+        outputs = _outputs.get(owner)
+        if outputs is not None:
+            outputs.discard(path)
+            if not outputs:
+                del _outputs[owner]
+
+def remove_output(path):
+    try:
+        os.remove(path)
+        logger.info(f"Yarım kalan geçici dosya silindi: {path}")
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Geçici dosya silinemedi: {path} ({e})")
+
+def kill_owner(owner):
+    """ 'owner' işine ait, hâlâ çalışan tüm alt süreçleri (ffmpeg vb.) sonlandırır ve yarım çıktılarını siler. """
+    with _lock:
+        processes = _processes.pop(owner, [])
+        outputs = _outputs.pop(owner, set())
+
+    killed = []
+    for process in processes:
+        if process.poll() is None:
+            try:
+                process.kill()
+                killed.append(process)
+            except OSError as e:
+                logger.warning(f"Alt süreç (PID {process.pid}) sonlandırılamadı: {e}")
+    if killed:
+        logger.info(f"İptal: {len(killed)} alt süreç sonlandırıldı.")
+    # Dosya, süreç kapanmadan silinemeyebilir (Windows); önce sürecin çıkması beklenir.
+    for process in killed:
+        try:
+            process.wait(timeout=5)
+        except Exception:
+            pass
+    for path in outputs:
+        remove_output(path)
+    return len(killed)
+
+def forget_owner(owner):
+    with _lock:
+        _processes.pop(owner, None)
+        _outputs.pop(owner, None)
+
+def install_popen_tracking():
+    """
+    yt-dlp'nin ffmpeg'i başlattığı modüllerdeki Popen sınıfını, süreçleri kaydeden bir alt sınıfla değiştirir.
+    Böylece iptal edilen bir işin ffmpeg süreçleri arkada çalışmaya devam etmez.
+    """
+    global _installed
+    with _lock:
+        if _installed:
+            return
+        _installed = True
+
+    import yt_dlp.utils
+
+    base_popen = yt_dlp.utils.Popen
+
+    class TrackedPopen(base_popen):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            register(self)
+
+    import importlib
+    for module_name in ('yt_dlp.postprocessor.ffmpeg', 'yt_dlp.downloader.external'):
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            continue
+        if getattr(module, 'Popen', None) is base_popen:
+            module.Popen = TrackedPopen
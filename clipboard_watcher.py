@@ -0,0 +1,57 @@
+from PySide6.QtCore import QObject, Signal, Slot
+from PySide6.QtWidgets import QApplication
+
+import url_classifier
+from logger_setup import logger
+
+class ClipboardWatcher(QObject):
+    """
+    Panoyu uygulama genelinde tek bir bağlantıyla izler.
+    Kopyalanan metin bir kez sınıflandırılır ve o servisin açık penceresine (en son açılan önce) iletilir;
+    pencereler 'handle_clipboard_url(url)' ile kabul edip etmediklerini bildirir.
+    Uygun pencere yoksa 'unrouted_url' sinyali yayılır; servis seçim ekranı açıksa bununla o servisi açar.
+    """
+    unrouted_url = Signal(str, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._windows = []
+        QApplication.clipboard().dataChanged.connect(self.on_clipboard_changed)
+
+    def register(self, window):
+        if window not in self._windows:
+            self._windows.append(window)
+
+    def unregister(self, window):
+        if window in self._windows:
+            self._windows.remove(window)
+
+    @Slot()
+    def on_clipboard_changed(self):
+        text = QApplication.clipboard().text().strip()
+        if not text:
+            return
+
+        service = url_classifier.classify(text)
+        if service is None:
+            return
+
+        for window in reversed(self._windows):
+            if window.service != service:
+                continue
+            try:
+                if window.handle_clipboard_url(text):
+                    return
+            except Exception as e:
+                logger.error(f"Pano URL'si pencereye iletilemedi ({service}): {e}")
+        logger.info(f"Pano takibi: {service} URL'si için uygun pencere yok.")
+        self.unrouted_url.emit(service, text)
+
+
+_clipboard_watcher = None
+
+def get_clipboard_watcher():
+    global _clipboard_watcher
+    if _clipboard_watcher is None:
+        _clipboard_watcher = ClipboardWatcher()
+    return _clipboard_watcher
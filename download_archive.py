@@ -0,0 +1,85 @@
+import os
+import threading
+
+from app_paths import APP_DATA_PATH
+from logger_setup import logger
+from url_classifier import canonical_key
+
+class DownloadArchive:
+    """
+    Daha önce indirilen videoların 'extractor video_id' anahtarlı kaydı.
+    Dosya biçimi yt-dlp'nin --download-archive dosyasıyla aynıdır (satır başına bir anahtar);
+    bellekte bir küme olarak tutulur, böylece arama O(1)'dir.
+    Nesne doğrudan yt-dlp'nin 'download_archive' seçeneğine verilebilir (__contains__ / add).
+    """
+
+    def __init__(self, path=None):
+        if path is None:
+            path = os.path.join(APP_DATA_PATH, "download_archive.txt")
+        self.path = path
+        self._lock = threading.Lock()
+        self._keys = set()
+        self._load()
+
+    @staticmethod
+    def make_key(extractor, video_id):
+        return f"{extractor.lower()} {video_id}"
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                for line in f:
+                    key = line.strip()
+                    if key:
+                        self._keys.add(key)
+            logger.info(f"İndirme arşivi yüklendi: {len(self._keys)} kayıt.")
+        except OSError as e:
+            logger.warning(f"İndirme arşivi okunamadı: {e}")
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def __len__(self):
+        return len(self._keys)
+
+    def add(self, key):
+        key = key.strip()
+        with self._lock:
+            if not key or key in self._keys:
+                return
+            self._keys.add(key)
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(key + "\n")
+            except OSError as e:
+                logger.warning(f"İndirme arşivine yazılamadı: {e}")
+
+    def contains_entry(self, entry):
+        """ extract_flat ile gelen bir playlist girdisinin (ie_key + id) arşivde olup olmadığını ağa çıkmadan söyler. """
+        extractor = entry.get('ie_key') or entry.get('extractor_key') or entry.get('extractor')
+        video_id = entry.get('id')
+        if not extractor or not video_id:
+            return False
+        return self.make_key(extractor, video_id) in self._keys
+
+    def contains_url(self, url):
+        """ URL'nin (extractor, id) anahtarı URL'den çıkarılabiliyorsa arşivde olup olmadığını ağa çıkmadan söyler. """
+        key = canonical_key(url)
+        if key is None:
+            return False
+        return self.make_key(*key) in self._keys
+
+
+_download_archive = None
+_download_archive_lock = threading.Lock()
+
+def get_download_archive():
+    """ Tüm servis pencereleri ve işler tarafından paylaşılan arşiv örneği. """
+    global _download_archive
+    with _download_archive_lock:
+        if _download_archive is None:
+            _download_archive = DownloadArchive()
+        return _download_archive
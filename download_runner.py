@@ -0,0 +1,552 @@
+import os
+import re
+import threading
+import time
+import traceback
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import child_processes
+import postprocess_pool
+from download_archive import get_download_archive
+from info_cache import get_info_cache
+from metadata_cache import url_key
+from languages import LANGUAGES
+from logger_setup import log_context, logger
+from progress import ProgressState
+from rate_estimator import TransferTracker
+from tool_locator import get_tool_locator
+from ydl_pool import get_ydl_pool
+
+AUDIO_FORMATS = ("mp3", "m4a", "ogg", "flac", "opus", "wav")
+VIDEO_FORMATS = ("mp4", "webm", "mkv")
+
+def sanitize_filename(filename, max_length=100):
+    filename = unicodedata.normalize('NFKD', filename).encode('ASCII', 'ignore').decode('utf-8')
+    filename = re.sub(r'[\\/*?:"<>|]', '', filename)
+    filename = re.sub(r'[^a-zA-Z0-9\s\-_#\.]', '', filename)
+    filename = re.sub(r'[\s]+', ' ', filename)  
+    filename = re.sub(r'[_\-]+', '_', filename) 
+    filename = filename.strip()
+    if len(filename) > max_length:
+        filename = filename[:max_length].rsplit(' ', 1)[0]  
+    return filename
+
+def get_yt_dlp_format(quality):
+    height = re.search(r'^\d+', quality)
+    if height:
+        height_str = height.group(0)
+        return f"bestvideo[height<={height_str}]+bestaudio/best[height<={height_str}]"
+    else:
+        return "bestvideo[height<=720]+bestaudio/best[height<=720]"
+
+def resolve_format_key(output_format, language_code):
+    """ Arayüzde gösterilen format etiketini ('MP3', 'MP4' ...) dil dosyasındaki anahtarına çevirir. """
+    for key, value in LANGUAGES[language_code].items():
+        if value == output_format:
+            return key.lower()
+    return "mp4"
+
+def build_ydl_options(output_template, target_format_ext, is_audio, quality="best", is_playlist=False,
+                      download_subs=False, sub_langs="", cookie_file_path=""):
+    """
+    Format dizesi, post-processor'lar, altyazı ve çerez ayarlarıyla yt-dlp seçeneklerini oluşturur.
+    İlerleme kancaları çağıran tarafından eklenir. (ydl_opts, format_dizesi) döndürür.
+    """
+    postprocessors = []
+
+    if is_audio: 
+        ydl_format_string = "bestaudio/best"
+        postprocessors.append({
+            'key': 'FFmpegExtractAudio',
+            'preferredcodec': target_format_ext,
+            'preferredquality': '192', 
+        })
+        if target_format_ext == 'mp3':
+            postprocessors[0]['preferredquality'] = '320'
+        elif target_format_ext == 'm4a':
+            postprocessors[0]['preferredquality'] = '256'
+
+    else: 
+        if quality == "best": 
+            ydl_format_string = "bestvideo+bestaudio/best"
+        else: 
+            ydl_format_string = get_yt_dlp_format(quality)
+        
+        postprocessors.append({
+            'key': 'FFmpegVideoRemuxer',
+            'preferedformat': target_format_ext,
+        })
+
+    ydl_opts = {
+        'format': ydl_format_string,
+        'outtmpl': output_template,
+        'quiet': False,
+        'postprocessors': postprocessors,
+        'noplaylist': not is_playlist,
+        'nooverwrites': False,
+        'continuedl': True,
+        'ffmpeg_location': get_tool_locator().ffmpeg_location(),
+        'ignoreerrors': is_playlist, 
+    }
+    
+    if cookie_file_path and os.path.exists(cookie_file_path):
+        logger.info(f"Kullanılan çerez dosyası: {cookie_file_path}")
+        ydl_opts['cookiefile'] = cookie_file_path
+
+    if download_subs and not is_audio: 
+        lang_list = [lang.strip() for lang in sub_langs.split(',')] if sub_langs else ['en', 'tr'] 
+        
+        ydl_opts['writesubtitles'] = True
+        ydl_opts['subtitleslangs'] = lang_list
+        ydl_opts['writeautomaticsub'] = True 
+        ydl_opts['embedsubtitles'] = True 
+
+    return ydl_opts, ydl_format_string
+
+
+class _DeferredArchive:
+    """
+    yt-dlp'ye verilen arşiv görünümü. yt-dlp anahtarı post_hooks döner dönmez ekler, oysa dönüştürme havuzda sürer;
+    bu yüzden dönüştürmesi bekleyen dosyanın anahtarı bekletilir ve DownloadRunner dönüştürme başarıyla bitince yazar.
+    """
+
+    def __init__(self, archive):
+        self.archive = archive
+        self._local = threading.local()
+
+    def __contains__(self, key):
+        return key in self.archive
+
+    def __len__(self):
+        return len(self.archive)
+
+    def expect_postprocessing(self, pending):
+        """ Bu iş parçacığında yt-dlp'nin ekleyeceği sıradaki anahtar 'pending' kaydına bağlanır. """
+        self._local.pending = pending
+
+    def add(self, key):
+        pending = getattr(self._local, 'pending', None)
+        self._local.pending = None
+        if pending is None:
+            self.archive.add(key)
+        else:
+            pending['archive_key'] = key
+
+
+def _format_ids_recorder(callback):
+    """
+    İndirme başlamadan ('before_dl') seçilen formatın tam kimliğini (ör. '137+140') bildiren post-processor.
+    İlerleme kancasındaki info_dict tek bir akışa aittir; birleşik seçim yalnızca üst düzey bilgide bulunur.
+    """
+    from yt_dlp.postprocessor.common import PostProcessor
+
+    class FormatIdsRecorderPP(PostProcessor):
+        def run(self, info):
+            requested = info.get('requested_formats')
+            format_ids = '+'.join(f['format_id'] for f in requested) if requested else info.get('format_id')
+            if format_ids:
+                callback(format_ids)
+            return [], info
+
+    return FormatIdsRecorderPP()
+
+
+class DownloadRunner:
+    """
+    Tek bir indirme işini yürüten, Qt'den bağımsız çekirdek.
+    Arayüzde DownloadThread tarafından, konsolda ise batch_cli tarafından kullanılır.
+    """
+
+    def __init__(self, url, download_folder, quality, video_format, output_format, 
+                 download_type_key, language_code, download_subs, sub_langs, 
+                 cookie_file_path, playlist_workers=3, output_dir=None, keep_partial_files=True,
+                 use_archive=True, job_info_callback=None, stage_callback=None, job_id=None, service=None,
+                 format_ids=None, format_ids_callback=None): 
+        self.url = url
+        self.download_folder = download_folder
+        self.quality = quality
+        self.video_format = video_format
+        self.output_format = output_format
+        self.download_type_key = download_type_key
+        self.language_code = language_code
+        self.download_subs = download_subs
+        self.sub_langs = sub_langs
+        self.cookie_file_path = cookie_file_path
+        self.playlist_workers = max(1, int(playlist_workers))
+        self.output_dir = output_dir
+        self.keep_partial_files = keep_partial_files
+        self.use_archive = use_archive
+        self.progress = ProgressState()
+        self.transfer = TransferTracker()
+        self.job_info_callback = job_info_callback
+        self.stage_callback = stage_callback
+        self.format_ids = format_ids
+        self.format_ids_callback = format_ids_callback
+        self.job_id = job_id
+        self.service = service
+        self._cancel_event = threading.Event()
+        self._partial_files = set()
+        self._partial_files_lock = threading.Lock()
+        self._postprocess_futures = []
+        self._postprocess_lock = threading.Lock()
+        self._archive = None
+
+    def cancel(self):
+        """
+        İşbirlikçi iptal: bir sonraki ilerleme / post-processor çağrısında iş durdurulur.
+        Çalışmakta olan ffmpeg alt süreçleri hemen sonlandırılır.
+        """
+        self._cancel_event.set()
+        child_processes.kill_owner(self)
+
+    def is_cancelled(self):
+        return self._cancel_event.is_set()
+
+    def _raise_if_cancelled(self):
+        if self._cancel_event.is_set():
+            from yt_dlp.utils import DownloadCancelled
+            raise DownloadCancelled("İndirme kullanıcı tarafından iptal edildi.")
+
+    def _postprocessor_hook(self, d):
+        self._raise_if_cancelled()
+
+    def _submit_postprocessing(self, filename, postprocessors, ffmpeg_location):
+        """ yt-dlp 'post_hooks' kancası: biten dosyanın dönüştürmesini havuza bırakır, indirme beklemeden sürer. """
+        def postprocess():
+            self._raise_if_cancelled()
+            with self.log_context(phase="postprocess"):
+                return postprocess_pool.run_postprocessors(filename, postprocessors, ffmpeg_location)
+
+        pending = {'future': postprocess_pool.submit(self, postprocess), 'archive_key': None}
+        if self._archive is not None:
+            self._archive.expect_postprocessing(pending)
+        with self._postprocess_lock:
+            self._postprocess_futures.append(pending)
+
+    def wait_postprocessing(self):
+        """
+        İndirme aşaması bittikten sonra çağrılır; indirme slotu serbest bırakılır ve bekleyen dönüştürmeler tamamlanır.
+        Başarısız olan dönüştürme sayısını döndürür.
+        """
+        with self._postprocess_lock:
+            pending_files = list(self._postprocess_futures)
+            self._postprocess_futures.clear()
+        if not pending_files:
+            return 0
+
+        if self.stage_callback:
+            self.stage_callback("postprocessing")
+        # update() anlık görüntüyü baştan yazar; kuyruk ETA'sı için işin bayt toplamları korunur.
+        job_downloaded, job_total, _, _ = self.transfer.totals()
+        job_bytes = {'job_downloaded_bytes': job_downloaded, 'job_total_bytes': job_total}
+        failed = 0
+        with self.log_context(phase="postprocess"):
+            for done, pending in enumerate(pending_files):
+                self.progress.update(status='postprocessing', pending_files=len(pending_files) - done, **job_bytes)
+                try:
+                    pending['future'].result()
+                except Exception as e:
+                    self._raise_if_cancelled()
+                    failed += 1
+                    logger.error(f"Dönüştürme başarısız: {e}")
+                    continue
+                # Arşive yalnızca dönüştürmesi başarıyla biten dosyalar yazılır; başarısızlar sonraki denemede yeniden indirilir.
+                if pending['archive_key'] and self._archive is not None:
+                    self._archive.archive.add(pending['archive_key'])
+        self._raise_if_cancelled()
+        self.progress.update(status='finished', percent=100, pending_files=0, **job_bytes)
+        return failed
+
+    def cleanup_partial_files(self):
+        with self._partial_files_lock:
+            partial_files = list(self._partial_files)
+            self._partial_files.clear()
+        for path in partial_files:
+            for candidate in (path, path + ".ytdl"):
+                try:
+                    if os.path.exists(candidate):
+                        os.remove(candidate)
+                        logger.info(f"Yarım dosya silindi: {candidate}")
+                except OSError as e:
+                    logger.warning(f"Yarım dosya silinemedi: {candidate} ({e})")
+
+    def log_context(self, phase):
+        """ Bu işin kayıtlarını (job_id, service, phase) ile etiketler; havuz iş parçacıklarında da kullanılır. """
+        return log_context(job_id=self.job_id, service=self.service, phase=phase)
+
+    def run(self):
+        """ İşi yürütür ve (başarılı_mı, mesaj) döndürür. """
+        with self.log_context(phase="download"):
+            return self._run()
+
+    def _run(self):
+        # yt_dlp ilk kullanımda yüklenir (uygulama açılışını yavaşlatmaması için).
+        import yt_dlp
+
+        child_processes.install_popen_tracking()
+        child_processes.set_owner(self)
+        try:
+            is_playlist = (self.download_type_key == "playlist")
+            is_audio = (self.video_format == LANGUAGES[self.language_code]["list_type_audio"])
+
+            logger.info(f"İndirme işlemi başlatıldı: {self.url} | Format: {self.video_format}")
+            
+            playlist_entries = []
+            if is_playlist:
+                try:
+                    info = get_info_cache().get(self.url, flat=True)
+                    if info is None:
+                        with get_ydl_pool().acquire({'quiet': True, 'noplaylist': False, 'extract_flat': True}) as ydl_info:
+                            info = ydl_info.extract_info(self.url, download=False)
+                        get_info_cache().put(self.url, info, flat=True)
+                    playlist_title = sanitize_filename(info.get('title', 'oynatma_listesi'))
+                    playlist_entries = [entry for entry in (info.get('entries') or []) if entry]
+                except Exception as e:
+                    logger.warning(f"Playlist başlığı alınamadı, varsayılan kullanılıyor. Hata: {e}")
+                    playlist_title = sanitize_filename(f"oynatma_listesi_{int(time.time())}")
+                
+                if self.output_dir:
+                    output_path_base = self.output_dir
+                else:
+                    output_path_base = os.path.join(self.download_folder, playlist_title)
+                raw_output_template = os.path.join(output_path_base, '%(playlist_autonumber)s - %(title)s.%(ext)s')
+            else:
+                output_path_base = self.download_folder
+                raw_output_template = os.path.join(output_path_base, '%(title)s.%(ext)s')
+
+            if not os.path.exists(output_path_base):
+                os.makedirs(output_path_base, exist_ok=True)
+
+            ydl_opts, ydl_format_string = build_ydl_options(
+                raw_output_template,
+                resolve_format_key(self.output_format, self.language_code),
+                is_audio,
+                quality=self.quality,
+                is_playlist=is_playlist,
+                download_subs=self.download_subs,
+                sub_langs=self.sub_langs,
+                cookie_file_path=self.cookie_file_path,
+            )
+            if self.format_ids and not is_playlist:
+                # Devam ettirilen iş ilk denemede seçilen akışları ister; artık yoksa normal seçime düşülür.
+                ydl_opts['format'] = f"{self.format_ids}/{ydl_opts['format']}"
+            ydl_opts['progress_hooks'] = [self._progress_hook]
+            ydl_opts['postprocessor_hooks'] = [self._postprocessor_hook]
+            # Ses çıkarma / yeniden paketleme yt-dlp içinde değil, ayrı dönüştürme havuzunda yapılır.
+            postprocessors = ydl_opts.pop('postprocessors', [])
+            if postprocessors:
+                ffmpeg_location = ydl_opts.get('ffmpeg_location')
+                ydl_opts['post_hooks'] = [
+                    lambda filename: self._submit_postprocessing(filename, postprocessors, ffmpeg_location)
+                ]
+
+            skipped = 0
+            skip_entry = None
+            if self.use_archive:
+                # yt-dlp, URL'den çıkarılabilen ID'leri ağa çıkmadan önce bu arşivde arar ve başarılı indirmeleri ekler.
+                archive = get_download_archive()
+                self._archive = _DeferredArchive(archive)
+                ydl_opts['download_archive'] = self._archive
+                skip_entry = archive.contains_entry
+                skipped = sum(1 for entry in playlist_entries if skip_entry(entry))
+                if skipped:
+                    logger.info(f"Playlist: {skipped} video zaten indirme arşivinde, atlanıyor.")
+                if playlist_entries and skipped == len(playlist_entries):
+                    return True, f"✅ Tüm videolar ({skipped}) zaten indirilmiş, atlandı.\nKlasör: '{output_path_base}'"
+
+            if self.job_info_callback:
+                self.job_info_callback(ydl_format_string, output_path_base)
+            
+            if is_playlist and playlist_entries:
+                self.transfer.expected_units = max(1, len(playlist_entries) - skipped)
+                failed = self.download_playlist_entries(playlist_entries, ydl_opts, output_path_base, skip_entry)
+                failed += self.wait_postprocessing()
+                skipped_note = f" ({skipped} video arşivde olduğu için atlandı)" if skipped else ""
+                if failed:
+                    logger.warning(f"Playlist indirmesinde {failed}/{len(playlist_entries)} video indirilemedi.")
+                    return True, (
+                        f"✅ İndirme tamamlandı! ({len(playlist_entries) - failed}/{len(playlist_entries)} video){skipped_note}\n"
+                        f"Dosyalar '{output_path_base}' klasörüne kaydedildi."
+                    )
+                return True, f"✅ İndirme tamamlandı!{skipped_note}\nDosyalar '{output_path_base}' klasörüne kaydedildi."
+
+            self._raise_if_cancelled()
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                if self.format_ids_callback:
+                    # Devam ettirilirken aynı akışların istenebilmesi için seçilen format kimlikleri kaydedilir.
+                    ydl.add_post_processor(_format_ids_recorder(self.format_ids_callback), when='before_dl')
+                downloaded = self._download_url(ydl, self.url)
+            self._raise_if_cancelled()
+            if not downloaded:
+                logger.info(f"Video zaten indirme arşivinde, atlandı: {self.url}")
+                return True, "✅ Bu video zaten indirilmiş (indirme arşivinde kayıtlı), atlandı."
+            if self.wait_postprocessing():
+                return False, f"Hata oluştu: dönüştürme başarısız oldu.\nİndirilen dosya '{output_path_base}' klasöründe özgün biçiminde bırakıldı."
+
+            return True, f"✅ İndirme tamamlandı!\nDosyalar '{output_path_base}' klasörüne kaydedildi."
+
+        except Exception as e:
+            if self.is_cancelled():
+                with self._postprocess_lock:
+                    for pending in self._postprocess_futures:
+                        pending['future'].cancel()
+                    self._postprocess_futures.clear()
+                logger.info(f"İndirme iptal edildi: {self.url}")
+                if not self.keep_partial_files:
+                    self.cleanup_partial_files()
+                return False, LANGUAGES[self.language_code].get("download_canceled", "⚠️ Download canceled.")
+            return False, f"Hata oluştu: {str(e)}\n{traceback.format_exc()}"
+        finally:
+            child_processes.clear_owner()
+            child_processes.forget_owner(self)
+
+    def download_playlist_entries(self, entries, ydl_opts, output_path_base, skip_entry=None):
+        """
+        Playlist girdilerini (extract_flat sonucu) sınırlı bir iş parçacığı havuzunda paralel indirir.
+        Her havuz iş parçacığı tek bir YoutubeDL örneğini girdiler boyunca kullanır (kurulum bir kez yapılır);
+        playlist sırası her girdide çıktı şablonuna sabitlenir. Hata veren örnek kapatılıp yenilenir.
+        'skip_entry' True döndüren girdiler (ör. arşivdekiler) hiç ağa çıkmadan atlanır.
+        Başarısız olan video sayısını döndürür.
+        """
+        import yt_dlp
+
+        n_entries = len(entries)
+        index_width = len(str(n_entries))
+        local = threading.local()
+        instances = []
+        instances_lock = threading.Lock()
+
+        def thread_ydl():
+            """ Bu iş parçacığının YoutubeDL örneği ve o an indirdiği girdinin durumu (ilerleme kancası için). """
+            if getattr(local, 'ydl', None) is None:
+                entry_state = {}
+                entry_opts = dict(ydl_opts)
+                entry_opts['noplaylist'] = True
+                entry_opts['ignoreerrors'] = False
+                # Parçalı indirmelerde kanca başka iş parçacıklarından da çağrılabilir; sıra örneğe bağlı tutulur.
+                entry_opts['progress_hooks'] = [
+                    lambda d: self._progress_hook(d, playlist_index=entry_state.get('playlist_index'), n_entries=n_entries)
+                ]
+                local.ydl = yt_dlp.YoutubeDL(entry_opts)
+                local.entry_state = entry_state
+                with instances_lock:
+                    instances.append(local.ydl)
+            return local.ydl, local.entry_state
+
+        def download_entry(playlist_index, entry):
+            with self.log_context(phase="download"):
+                return download_entry_in_context(playlist_index, entry)
+
+        def download_entry_in_context(playlist_index, entry):
+            self._raise_if_cancelled()
+            child_processes.set_owner(self)
+            entry_url = entry.get('url') or entry.get('webpage_url') or entry.get('id')
+            ydl, entry_state = thread_ydl()
+            entry_state['playlist_index'] = playlist_index
+            ydl.params['outtmpl'] = dict(ydl.params['outtmpl'], default=os.path.join(
+                output_path_base, f"{playlist_index:0{index_width}d} - %(title)s.%(ext)s"
+            ))
+            try:
+                self._download_url(ydl, entry_url)
+            except BaseException:
+                local.ydl = None
+                with instances_lock:
+                    instances.remove(ydl)
+                ydl.close()
+                raise
+            finally:
+                child_processes.clear_owner()
+
+        pending_entries = [
+            (playlist_index, entry) for playlist_index, entry in enumerate(entries, start=1)
+            if not (skip_entry and skip_entry(entry))
+        ]
+        failed = 0
+        if not pending_entries:
+            return failed
+        try:
+            with ThreadPoolExecutor(max_workers=min(self.playlist_workers, len(pending_entries))) as pool:
+                futures = {
+                    pool.submit(download_entry, playlist_index, entry): playlist_index
+                    for playlist_index, entry in pending_entries
+                }
+                for future in as_completed(futures):
+                    if self.is_cancelled():
+                        for pending in futures:
+                            pending.cancel()
+                        break
+                    try:
+                        future.result()
+                    except Exception as e:
+                        failed += 1
+                        logger.warning(f"Playlist videosu {futures[future]}/{n_entries} indirilemedi: {e}")
+                        self.progress.update(status='entry_error', percent=0, error=f"indirilemedi: {e}",
+                                             playlist_index=futures[future], n_entries=n_entries)
+        finally:
+            for ydl in instances:
+                ydl.close()
+        self._raise_if_cancelled()
+        return failed
+
+    def _download_url(self, ydl, url):
+        """
+        Doğrulamada çıkarılan bilgi önbellekteyse sayfayı yeniden çözümlemeden indirir.
+        Video indirme arşivinde kayıtlıysa (yt-dlp onu sessizce atlayacağından) indirmeye girmeden False döner.
+        Kimliği URL'den çıkarılamayan bağlantılarda (kısa bağlantılar, SoundCloud) sayfa önce işlenmeden
+        çözümlenir ve arşiv bu bilgiyle denetlenir.
+        """
+        info = get_info_cache().get(url)
+        if info is None:
+            if self._archive is not None:
+                key = url_key(url)
+                if key and key in self._archive:
+                    return False
+            info = ydl.extract_info(url, download=False, process=False)
+        if ydl.in_download_archive(info):
+            return False
+        ydl.process_ie_result(info, download=True)
+        return True
+
+    def _progress_hook(self, d, playlist_index=None, n_entries=None):
+        """ yt-dlp ilerleme kancası: yalnızca sayısal durumu kaydeder, biçimlendirme gösterimde yapılır. """
+        self._raise_if_cancelled()
+        if d.get('tmpfilename'):
+            with self._partial_files_lock:
+                self._partial_files.add(d['tmpfilename'])
+
+        if playlist_index is None:
+            playlist_index = d.get('info_dict', {}).get('playlist_autonumber')
+            n_entries = d.get('info_dict', {}).get('n_entries')
+
+        status = d.get('status')
+        unit = playlist_index or 0
+        if status == 'downloading':
+            total_size = d.get('total_bytes') or d.get('total_bytes_estimate') or 0
+            downloaded_size = d.get('downloaded_bytes') or 0
+            self.transfer.update(unit, d.get('filename'), downloaded_size, total_size)
+            job_downloaded, job_total, speed, eta = self.transfer.totals()
+            self.progress.update(
+                status='downloading',
+                percent=int(downloaded_size / total_size * 100) if total_size > 0 else 0,
+                downloaded_bytes=downloaded_size,
+                total_bytes=total_size,
+                job_downloaded_bytes=job_downloaded,
+                job_total_bytes=job_total,
+                speed=speed or d.get('speed') or 0,
+                eta=eta if eta is not None else d.get('eta'),
+                playlist_index=playlist_index,
+                n_entries=n_entries,
+            )
+        elif status == 'finished':
+            self.transfer.finish(unit, d.get('filename'))
+            job_downloaded, job_total, speed, eta = self.transfer.totals()
+            self.progress.update(status='finished', percent=100, job_downloaded_bytes=job_downloaded,
+                                 job_total_bytes=job_total, speed=speed, eta=eta,
+                                 playlist_index=playlist_index, n_entries=n_entries)
+        elif status == 'error':
+            error_message = d.get('error', 'Bilinmeyen hata')
+            if isinstance(error_message, dict):
+                error_message = f"Hata: {error_message.get('code', 'Bilinmeyen kod')}, {error_message.get('message', 'Açıklama bulunamadı.')}"
+            self.progress.update(status='error', percent=0, error=str(error_message),
+                                 playlist_index=playlist_index, n_entries=n_entries)
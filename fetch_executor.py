@@ -0,0 +1,101 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from info_cache import cache_key
+from logger_setup import logger
+from url_classifier import is_playlist_url
+
+class MetadataFetchExecutor:
+    """
+    Video bilgisi çekme işleri için paylaşılan, sınırlı havuz.
+    - Aynı anda en fazla 'max_workers' çıkarma çalışır.
+    - Aynı (grup, URL) için süren bir iş varsa yenisi başlatılmaz, sonuca abone olunur.
+    - Her sahip (pencere) için bir nesil sayacı tutulur; yeni istek eskisini geçersiz kılar.
+      Henüz başlamamış eski işler iptal edilir, başlamış olanların sonucu sahibine iletilmez.
+    """
+
+    def __init__(self, max_workers=3):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="metadata")
+        # Future.cancel() / add_done_callback() tamamlanma kancasını aynı iş parçacığında çağırabilir.
+        self._lock = threading.RLock()
+        self._generations = {}
+        self._in_flight = {}
+
+    def request(self, owner, url, fetch, callback, group=None, supersede=True):
+        """
+        'fetch(url)' sonucunu 'callback(sonuç)' ile iletir (havuz iş parçacığında çağrılır).
+        Hata durumunda sonuç {"error": ...} sözlüğüdür.
+        supersede=False ise sahibin önceki istekleri geçerli kalır (toplu içe aktarma gibi).
+        """
+        # watch?v=..&list=.. bilgisi playlist olarak alınır; aynı videonun tekil bilgisiyle paylaşılmamalı.
+        key = (group, cache_key(url, playlist=is_playlist_url(url)), is_playlist_url(url))
+        with self._lock:
+            if supersede:
+                generation = self._generations.get(owner, 0) + 1
+                self._generations[owner] = generation
+                self._supersede(owner)
+            else:
+                generation = self._generations.setdefault(owner, 1)
+
+            subscriber = (owner, generation, callback)
+            entry = self._in_flight.get(key)
+            if entry is not None:
+                logger.info(f"Bu URL için bilgi zaten alınıyor, sonuç paylaşılacak: {url}")
+                entry['subscribers'].append(subscriber)
+                return generation
+
+            future = self._executor.submit(fetch, url)
+            self._in_flight[key] = {'future': future, 'subscribers': [subscriber]}
+            future.add_done_callback(lambda f, key=key: self._on_done(key, f))
+        return generation
+
+    def cancel(self, owner):
+        """ Sahibin bekleyen isteklerini geçersiz kılar (ör. pencere kapanırken). """
+        with self._lock:
+            self._generations.pop(owner, None)
+            self._supersede(owner)
+
+    def _supersede(self, owner):
+        for key, entry in list(self._in_flight.items()):
+            subscribers = [s for s in entry['subscribers'] if s[0] is not owner]
+            if len(subscribers) == len(entry['subscribers']):
+                continue
+            entry['subscribers'] = subscribers
+            if not subscribers:
+                del self._in_flight[key]
+                if not entry['future'].cancel():
+                    # Zaten çalışıyor; sonradan gelen aynı istekler bu sonucu paylaşabilsin.
+                    self._in_flight[key] = entry
+
+    def _on_done(self, key, future):
+        with self._lock:
+            entry = self._in_flight.get(key)
+            if entry is None or entry['future'] is not future:
+                return
+            del self._in_flight[key]
+            subscribers = [
+                (generation, callback) for owner, generation, callback in entry['subscribers']
+                if self._generations.get(owner) == generation
+            ]
+        if future.cancelled() or not subscribers:
+            return
+        try:
+            result = future.result()
+        except Exception as e:
+            result = {"error": str(e)}
+        for _, callback in subscribers:
+            try:
+                callback(result)
+            except Exception as e:
+                logger.error(f"Bilgi sonucu iletilemedi: {e}")
+
+
+_fetch_executor = None
+_fetch_executor_lock = threading.Lock()
+
+def get_fetch_executor():
+    global _fetch_executor
+    with _fetch_executor_lock:
+        if _fetch_executor is None:
+            _fetch_executor = MetadataFetchExecutor()
+        return _fetch_executor
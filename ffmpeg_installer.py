@@ -0,0 +1,306 @@
+"""
+FFmpeg kurulumu (Windows derlemeleri): arşiv diske akıtılır, yalnızca 'bin/' içeriği parça parça çıkarılır.
+Arşiv hiçbir zaman belleğe bütün olarak alınmaz; her dosya önce geçici adla yazılıp sonra yerine taşınır.
+
+Arşiv birkaç HTTP Range bağlantısıyla paralel indirilir, kesintide kaldığı yerden devam eder,
+yayınlanan SHA-256 değeriyle doğrulanır ve ETag'iyle birlikte önbellekte saklanır.
+"""
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from app_paths import APP_DATA_PATH, TARGET_BIN_PATH
+from logger_setup import logger
+from tool_locator import get_tool_locator
+
+CHUNK_SIZE = 1024 * 1024
+SEGMENTS = 4
+SEGMENT_RETRIES = 3
+STATE_SAVE_INTERVAL = 4 * CHUNK_SIZE
+ARCHIVE_CACHE_PATH = os.path.join(APP_DATA_PATH, "cache", "ffmpeg")
+FALLBACK_FFMPEG_URL = "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip"
+
+class InstallCancelled(Exception):
+    pass
+
+def get_latest_ffmpeg_url():
+    """
+    GitHub API'sini kullanarak her zaman en güncel FFmpeg indirme linkini bulur.
+    Eğer API çalışmazsa, yedek olarak kalıcı bir link (Gyan.dev) kullanır.
+    """
+    try:
+        logger.info("En güncel FFmpeg sürümü GitHub'dan sorgulanıyor...")
+        api_url = "https://api.github.com/repos/BtbN/FFmpeg-Builds/releases/latest"
+        
+        response = requests.get(api_url, timeout=10)
+        
+        if response.status_code == 200:
+            data = response.json()
+
+            for asset in data.get('assets', []):
+                name = asset.get('name', '').lower()
+
+                if "win64-gpl.zip" in name and "shared" not in name:
+                    found_url = asset['browser_download_url']
+                    logger.info(f"Güncel URL bulundu: {found_url}")
+                    return found_url
+                    
+    except Exception as e:
+        logger.warning(f"GitHub API hatası: {e}. Yedek link kullanılıyor.")
+
+    return FALLBACK_FFMPEG_URL
+
+def _check_cancel(cancel_event):
+    if cancel_event is not None and cancel_event.is_set():
+        raise InstallCancelled("FFmpeg kurulumu iptal edildi.")
+
+def _read_json(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _write_json(path, data):
+    temp_path = path + ".tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.replace(temp_path, path)
+
+def _remove(*paths):
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def file_sha256(path, cancel_event=None):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(CHUNK_SIZE), b''):
+            _check_cancel(cancel_event)
+            digest.update(block)
+    return digest.hexdigest()
+
+def fetch_expected_checksum(url):
+    """
+    Arşiv için yayınlanan SHA-256 değerini bulur:
+    gyan.dev '<arşiv>.sha256' dosyası, BtbN ise sürümdeki 'checksums.sha256' listesi yayınlar.
+    Bulunamazsa None döner.
+    """
+    file_name = url.rsplit('/', 1)[-1]
+    for checksum_url in (url + ".sha256", url.rsplit('/', 1)[0] + "/checksums.sha256"):
+        try:
+            response = requests.get(checksum_url, timeout=10)
+        except requests.RequestException:
+            continue
+        if response.status_code != 200:
+            continue
+        for line in response.text.splitlines():
+            fields = line.split()
+            if not fields or not re.fullmatch(r'[0-9a-fA-F]{64}', fields[0]):
+                continue
+            if len(fields) == 1 or fields[-1].lstrip('*') == file_name:
+                return fields[0].lower()
+    return None
+
+def _is_not_modified(url, etag):
+    """ Koşullu GET: sunucu 304 dönerse önbellekteki arşiv hâlâ günceldir. """
+    try:
+        with requests.get(url, headers={'If-None-Match': etag}, stream=True, timeout=15) as response:
+            return response.status_code == 304
+    except requests.RequestException as e:
+        logger.warning(f"FFmpeg arşivi için koşullu istek başarısız: {e}")
+        return False
+
+def _download_segments(url, part_path, state, state_path, report, cancel_event):
+    """ 'state' içindeki [başlangıç, bitiş, inen] aralıklarını paralel Range istekleriyle tamamlar. """
+    lock = threading.Lock()
+    total_size = state['size']
+    progress = {'downloaded': sum(segment[2] for segment in state['segments']), 'unsaved': 0}
+
+    def fetch_segment(segment):
+        for attempt in range(1, SEGMENT_RETRIES + 1):
+            start, end, done = segment
+            if start + done > end:
+                return
+            headers = {'Range': f"bytes={start + done}-{end}"}
+            if state.get('etag'):
+                headers['If-Range'] = state['etag']
+            try:
+                with requests.get(url, headers=headers, stream=True, timeout=30) as response:
+                    if response.status_code != 206:
+                        raise RuntimeError(f"Sunucu aralık isteğini kabul etmedi (HTTP {response.status_code}).")
+                    with open(part_path, 'r+b') as f:
+                        f.seek(start + done)
+                        for data in response.iter_content(chunk_size=CHUNK_SIZE):
+                            _check_cancel(cancel_event)
+                            f.write(data)
+                            f.flush()
+                            with lock:
+                                segment[2] += len(data)
+                                progress['downloaded'] += len(data)
+                                progress['unsaved'] += len(data)
+                                if progress['unsaved'] >= STATE_SAVE_INTERVAL:
+                                    progress['unsaved'] = 0
+                                    _write_json(state_path, state)
+                                downloaded_size = progress['downloaded']
+                            report(int(downloaded_size / total_size * 100),
+                                   f"İndiriliyor... {downloaded_size / 1024 / 1024:.1f}MB / {total_size / 1024 / 1024:.1f}MB")
+                return
+            except requests.RequestException as e:
+                if attempt == SEGMENT_RETRIES:
+                    raise
+                logger.warning(f"FFmpeg parçası kesildi, yeniden deneniyor ({attempt}/{SEGMENT_RETRIES}): {e}")
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(state['segments'])) as pool:
+            for future in [pool.submit(fetch_segment, segment) for segment in state['segments']]:
+                future.result()
+    finally:
+        with lock:
+            _write_json(state_path, state)
+
+def _download_single(url, part_path, report, cancel_event):
+    """ Sunucu Range desteklemiyorsa tek akışla baştan indirir. """
+    with requests.get(url, stream=True, timeout=30) as response:
+        response.raise_for_status()
+        total_size = int(response.headers.get('content-length', 0))
+        downloaded_size = 0
+        with open(part_path, 'wb') as f:
+            for data in response.iter_content(chunk_size=CHUNK_SIZE):
+                _check_cancel(cancel_event)
+                f.write(data)
+                downloaded_size += len(data)
+                if total_size > 0:
+                    report(int(downloaded_size / total_size * 100),
+                           f"İndiriliyor... {downloaded_size / 1024 / 1024:.1f}MB / {total_size / 1024 / 1024:.1f}MB")
+
+def download_archive(url, progress_callback=None, cancel_event=None, segments=SEGMENTS):
+    """
+    Arşivi önbellek klasörüne indirir ve yolunu döndürür.
+    - Önbellekteki tam kopya ETag ile doğrulanır (koşullu GET, 304 ise yeniden indirilmez).
+    - Yarım kalan indirme, kayıtlı aralık durumundan devam eder (ETag ve boyut aynıysa).
+    - Yayınlanmış bir SHA-256 varsa, ayıklamadan önce dosya bununla karşılaştırılır.
+    """
+    def report(percent, message):
+        if progress_callback:
+            progress_callback(percent, message)
+
+    os.makedirs(ARCHIVE_CACHE_PATH, exist_ok=True)
+    archive_path = os.path.join(ARCHIVE_CACHE_PATH, url.rsplit('/', 1)[-1] or "ffmpeg.zip")
+    part_path = archive_path + ".part"
+    state_path = archive_path + ".json"
+
+    state = _read_json(state_path) or {}
+    if state.get('url') != url:
+        state = {}
+
+    if state.get('complete') and state.get('etag') and os.path.exists(archive_path):
+        if _is_not_modified(url, state['etag']):
+            logger.info("FFmpeg arşivi değişmemiş (HTTP 304), önbellekteki kopya kullanılıyor.")
+            report(100, "Önbellekteki arşiv kullanılıyor...")
+            return archive_path
+
+    head = requests.head(url, allow_redirects=True, timeout=15)
+    head.raise_for_status()
+    total_size = int(head.headers.get('content-length', 0))
+    etag = head.headers.get('ETag')
+    supports_ranges = head.headers.get('Accept-Ranges', '').lower() == 'bytes' and total_size > 0
+
+    if supports_ranges:
+        resumable = (
+            not state.get('complete') and state.get('etag') == etag and state.get('size') == total_size
+            and os.path.exists(part_path) and os.path.getsize(part_path) == total_size
+        )
+        if resumable:
+            done = sum(segment[2] for segment in state['segments'])
+            logger.info(f"FFmpeg indirmesi kaldığı yerden devam ediyor ({done / 1024 / 1024:.1f}MB hazır).")
+        else:
+            segment_size = -(-total_size // segments)
+            state = {
+                'url': url, 'etag': etag, 'size': total_size, 'complete': False,
+                'segments': [
+                    [start, min(start + segment_size, total_size) - 1, 0]
+                    for start in range(0, total_size, segment_size)
+                ],
+            }
+            with open(part_path, 'wb') as f:
+                f.truncate(total_size)
+            _write_json(state_path, state)
+        _download_segments(head.url, part_path, state, state_path, report, cancel_event)
+    else:
+        state = {'url': url, 'etag': etag, 'size': total_size, 'complete': False, 'segments': []}
+        _download_single(head.url, part_path, report, cancel_event)
+
+    report(100, "Doğrulanıyor...")
+    expected = fetch_expected_checksum(url)
+    if expected:
+        actual = file_sha256(part_path, cancel_event)
+        if actual != expected:
+            _remove(part_path, state_path)
+            raise RuntimeError(f"FFmpeg arşivinin SHA-256 değeri uyuşmuyor (beklenen {expected}, bulunan {actual}).")
+        logger.info("FFmpeg arşivi SHA-256 ile doğrulandı.")
+    else:
+        logger.warning("FFmpeg arşivi için yayınlanmış bir SHA-256 bulunamadı, doğrulama atlandı.")
+
+    os.replace(part_path, archive_path)
+    state['complete'] = True
+    _write_json(state_path, state)
+
+    for entry in os.scandir(ARCHIVE_CACHE_PATH):
+        if entry.is_file() and entry.path not in (archive_path, state_path):
+            _remove(entry.path)
+    return archive_path
+
+def extract_bin_members(zip_path, target_bin_path, cancel_event=None):
+    """
+    Arşivdeki '.../bin/<dosya>' üyelerini 'target_bin_path' klasörüne çıkarır.
+    Her dosya '.part' adıyla yazılır ve tamamlanınca os.replace ile yerine konur; yarım dosya kalmaz.
+    """
+    os.makedirs(target_bin_path, exist_ok=True)
+    extracted = []
+    with zipfile.ZipFile(zip_path) as z:
+        for file_info in z.infolist():
+            parts = file_info.filename.split('/')
+            if not (len(parts) > 1 and parts[-2] == 'bin' and parts[-1] != ''):
+                continue
+            _check_cancel(cancel_event)
+            target_file_path = os.path.join(target_bin_path, parts[-1])
+            temp_file_path = target_file_path + ".part"
+            try:
+                with z.open(file_info) as source, open(temp_file_path, 'wb') as target:
+                    shutil.copyfileobj(source, target, CHUNK_SIZE)
+                os.replace(temp_file_path, target_file_path)
+            finally:
+                if os.path.exists(temp_file_path):
+                    os.remove(temp_file_path)
+            extracted.append(target_file_path)
+    if not extracted:
+        raise RuntimeError("Arşivde 'bin' klasörü bulunamadı.")
+    return extracted
+
+def install_ffmpeg(progress_callback=None, cancel_event=None):
+    """ En güncel FFmpeg arşivini indirip TARGET_BIN_PATH'e kurar ve bu yolu döndürür. """
+    def report(percent, message):
+        if progress_callback:
+            progress_callback(percent, message)
+
+    report(0, "Güncel sürüm aranıyor...")
+    url = get_latest_ffmpeg_url()
+
+    report(5, "İndirme başlatılıyor...")
+    archive_path = download_archive(url, progress_callback, cancel_event)
+
+    report(100, "Ayıklanıyor...")
+    extract_bin_members(archive_path, TARGET_BIN_PATH, cancel_event)
+    get_tool_locator().invalidate()
+    logger.info(f"FFmpeg kuruldu: {TARGET_BIN_PATH}")
+    return TARGET_BIN_PATH
@@ -0,0 +1,85 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from logger_setup import logger
+from url_classifier import canonical_key
+
+TRACKING_PARAMS = ("si", "feature", "pp", "igsh", "igshid", "fbclid", "gclid")
+
+def canonical_url(url):
+    """ Önbellek anahtarı için URL'yi sadeleştirir: boşluk, şema/alan adı büyük-küçük harfi, #parça ve izleme parametreleri. """
+    parts = urlsplit(url.strip())
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key not in TRACKING_PARAMS and not key.startswith("utm_")
+    ]
+    netloc = parts.netloc.lower()
+    if netloc.startswith("www."):
+        netloc = netloc[4:]
+    return urlunsplit((parts.scheme.lower() or "https", netloc, parts.path.rstrip('/'), urlencode(query), ""))
+
+def cache_key(url, playlist=False):
+    """
+    Önbellek / kuyruk tekilleştirme anahtarı: servis URL'leri için ağa çıkmadan 'extractor id'
+    (youtu.be, music.youtube.com, x.com gibi yazımlar aynı anahtarı verir), diğerleri için sadeleştirilmiş URL.
+    playlist=True ise liste parametresi taşıyan bağlantılar listenin anahtarını verir.
+    """
+    key = canonical_key(url, playlist)
+    if key:
+        return f"{key[0]} {key[1]}"
+    return canonical_url(url)
+
+
+class InfoCache:
+    """
+    Doğrulama sırasında çıkarılan yt-dlp bilgi sözlüklerinin kısa ömürlü (TTL) bellek önbelleği.
+    İndirme aynı URL için bu sözlüğü 'process_ie_result' ile kullanır ve sayfayı yeniden çözümlemez.
+    'flat' kayıtlar extract_flat ile alınmış playlist sonuçlarıdır, tam kayıtlar işlenmemiş (process=False) video sonuçlarıdır.
+    """
+
+    def __init__(self, ttl=600, max_entries=64):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def put(self, url, info, flat=False):
+        key = (cache_key(url, playlist=flat), flat)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, copy.deepcopy(info))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, url, flat=False):
+        """ Süresi dolmamış kaydın bir kopyasını döndürür (yt-dlp sözlüğü yerinde değiştirir), yoksa None. """
+        key = (cache_key(url, playlist=flat), flat)
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires_at, info = item
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        logger.info(f"Bilgi önbellekten kullanılıyor: {url}")
+        return copy.deepcopy(info)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_info_cache = None
+_info_cache_lock = threading.Lock()
+
+def get_info_cache():
+    global _info_cache
+    with _info_cache_lock:
+        if _info_cache is None:
+            _info_cache = InfoCache()
+        return _info_cache
@@ -0,0 +1,122 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from app_paths import APP_DATA_PATH
+from logger_setup import logger
+
+UNFINISHED_STATES = ("queued", "running", "postprocessing")
+
+class JobJournal:
+    """
+    İndirme işlerinin kalıcı kaydı (SQLite, WAL modu).
+    Uygulama çökse bile yarım kalan işler bir sonraki açılışta buradan devam ettirilir.
+    """
+
+    def __init__(self, db_path=None):
+        if db_path is None:
+            db_path = os.path.join(APP_DATA_PATH, "jobs.db")
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                service TEXT NOT NULL,
+                url TEXT NOT NULL,
+                options TEXT NOT NULL,
+                format TEXT,
+                output_path TEXT,
+                state TEXT NOT NULL,
+                error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_state ON jobs(state)")
+        columns = {row['name'] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        if "format_ids" not in columns:
+            # Eski kayıt dosyalarına, çözümlenmiş format kimlikleri için sütun eklenir.
+            self._conn.execute("ALTER TABLE jobs ADD COLUMN format_ids TEXT")
+
+    def add_job(self, service, options, state="queued"):
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO jobs (service, url, options, state, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (service, options.get('url', ''), json.dumps(options, ensure_ascii=False), state, now, now)
+            )
+            return cursor.lastrowid
+
+    def update_job(self, job_id, **fields):
+        allowed = {"format", "format_ids", "output_path", "state", "error"}
+        columns = [key for key in fields if key in allowed]
+        if not columns:
+            return
+        assignments = ", ".join(f"{column} = ?" for column in columns)
+        values = [fields[column] for column in columns]
+        with self._lock:
+            self._conn.execute(
+                f"UPDATE jobs SET {assignments}, updated_at = ? WHERE id = ?",
+                (*values, time.time(), job_id)
+            )
+
+    def set_state(self, job_id, state, error=None):
+        self.update_job(job_id, state=state, error=error)
+
+    def get_job(self, job_id):
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._row_to_dict(row) if row else None
+
+    def unfinished_jobs(self):
+        """ 'queued', 'running' veya 'postprocessing' durumunda kalmış işleri oluşturulma sırasıyla döndürür. """
+        placeholders = ", ".join("?" for _ in UNFINISHED_STATES)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT * FROM jobs WHERE state IN ({placeholders}) ORDER BY id", UNFINISHED_STATES
+            ).fetchall()
+        return [self._row_to_dict(row) for row in rows]
+
+    def cancel_interrupted(self):
+        """
+        İptal edilirken uygulama kapanan ('canceling' durumunda kalan) işleri 'canceled' yapar.
+        Kullanıcı bu işleri durdurmak istediği için yeniden başlatılmazlar; etkilenen iş sayısını döndürür.
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET state = 'canceled', updated_at = ? WHERE state = 'canceling'", (time.time(),)
+            )
+            return cursor.rowcount
+
+    def purge_finished(self, older_than_days=30):
+        cutoff = time.time() - older_than_days * 86400
+        placeholders = ", ".join("?" for _ in UNFINISHED_STATES)
+        with self._lock:
+            cursor = self._conn.execute(
+                f"DELETE FROM jobs WHERE state NOT IN ({placeholders}) AND updated_at < ?",
+                (*UNFINISHED_STATES, cutoff)
+            )
+            return cursor.rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _row_to_dict(self, row):
+        job = dict(row)
+        try:
+            job['options'] = json.loads(job['options'])
+        except (TypeError, ValueError):
+            logger.warning(f"İş #{job['id']} seçenekleri okunamadı.")
+            job['options'] = {'url': job['url']}
+        return job
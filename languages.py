@@ -87,7 +87,24 @@ LANGUAGES = {
         "ffmpeg_button_reinstall": "Re-Install / Update",
         "ffmpeg_tooltip_found": "FFmpeg is found on your system (in your AppData folder or system PATH).",
         "ffmpeg_tooltip_missing": "This will install FFmpeg to your user's AppData folder and add it to your PATH. No admin rights required.",
-        "clipboard_monitor": "Auto-Paste from Clipboard"
+        "clipboard_monitor": "Auto-Paste from Clipboard",
+        "settings_group_queue": "Download Queue",
+        "settings_max_downloads_label": "Concurrent downloads:",
+        "settings_playlist_workers_label": "Parallel playlist videos:",
+        "settings_keep_partial_files": "Keep partial files on cancel (resumable)",
+        "settings_use_download_archive": "Skip videos that were already downloaded",
+        "settings_show_splash": "Show the intro animation at startup",
+        "download_queued": "🕒 Added to the queue (#{job_id}). Waiting for a free slot...",
+        "queue_status": "Active: {active} | Queued: {pending}",
+        "queue_eta": "⏳ Queue: {eta}",
+        "download_postprocessing": "⚙️ Converting... ({pending} file(s) left)",
+        "bulk_add_button": "Bulk Add",
+        "bulk_dialog_title": "Bulk Add URLs",
+        "bulk_dialog_hint": "Paste one URL per line, or import a .txt / .csv file.",
+        "bulk_import_file": "Import from File...",
+        "bulk_skipped": "{skipped} URL(s) were skipped (another service, invalid or already downloaded).",
+        "bulk_progress": "📋 Bulk: {ready}/{total} queued, {failed} failed",
+        "bulk_summary": "Bulk import finished: {completed} downloaded, {failed} failed."
     },
     "tr": {
         "title": "YouTube Video ve Ses İndirici",
@@ -177,7 +194,24 @@ LANGUAGES = {
         "ffmpeg_button_reinstall": "Yeniden Kur / Güncelle",
         "ffmpeg_tooltip_found": "FFmpeg sisteminizde (AppData klasörünüzde veya sistem PATH) bulundu.",
         "ffmpeg_tooltip_missing": "FFmpeg'i AppData klasörünüze kurar ve sistem PATH'inize ekler. Yönetici izni gerekmez.",
-        "clipboard_monitor": "Panoyu Otomatik İzle"
+        "clipboard_monitor": "Panoyu Otomatik İzle",
+        "settings_group_queue": "İndirme Kuyruğu",
+        "settings_max_downloads_label": "Eşzamanlı indirme sayısı:",
+        "settings_playlist_workers_label": "Paralel playlist videosu:",
+        "settings_keep_partial_files": "İptalde yarım dosyaları sakla (devam ettirilebilir)",
+        "settings_use_download_archive": "Daha önce indirilen videoları atla",
+        "settings_show_splash": "Açılışta giriş animasyonunu göster",
+        "download_queued": "🕒 Kuyruğa eklendi (#{job_id}). Boş slot bekleniyor...",
+        "queue_status": "Aktif: {active} | Sırada: {pending}",
+        "queue_eta": "⏳ Kuyruk: {eta}",
+        "download_postprocessing": "⚙️ Dönüştürülüyor... ({pending} dosya kaldı)",
+        "bulk_add_button": "Toplu Ekle",
+        "bulk_dialog_title": "Toplu URL Ekle",
+        "bulk_dialog_hint": "Her satıra bir URL yapıştırın veya bir .txt / .csv dosyası içe aktarın.",
+        "bulk_import_file": "Dosyadan İçe Aktar...",
+        "bulk_skipped": "{skipped} URL atlandı (başka servis, geçersiz veya zaten indirilmiş).",
+        "bulk_progress": "📋 Toplu: {ready}/{total} kuyrukta, {failed} hatalı",
+        "bulk_summary": "Toplu içe aktarma bitti: {completed} indirildi, {failed} hatalı."
     },
     "es": {
         "title": "Descargador de Video y Audio de YouTube",
@@ -267,7 +301,24 @@ LANGUAGES = {
         "ffmpeg_button_reinstall": "Reinstalar / Actualizar",
         "ffmpeg_tooltip_found": "FFmpeg se encuentra en su sistema (en su carpeta AppData o PATH del sistema).",
         "ffmpeg_tooltip_missing": "Esto instalará FFmpeg en su carpeta AppData y lo agregará a su PATH. No se requieren derechos de administrador.",
-        "clipboard_monitor": "Pegar autom. desde portapapeles"
+        "clipboard_monitor": "Pegar autom. desde portapapeles",
+        "settings_group_queue": "Cola de descargas",
+        "settings_max_downloads_label": "Descargas simultáneas:",
+        "download_queued": "🕒 Añadido a la cola (#{job_id}). Esperando un hueco libre...",
+        "queue_status": "Activas: {active} | En cola: {pending}",
+        "settings_playlist_workers_label": "Vídeos de lista en paralelo:",
+        "settings_keep_partial_files": "Conservar archivos parciales al cancelar (reanudables)",
+        "settings_use_download_archive": "Omitir vídeos ya descargados",
+        "queue_eta": "⏳ Cola: {eta}",
+        "download_postprocessing": "⚙️ Convirtiendo... (quedan {pending} archivo(s))",
+        "settings_show_splash": "Mostrar la animación de inicio",
+        "bulk_add_button": "Añadir en lote",
+        "bulk_dialog_title": "Añadir URLs en lote",
+        "bulk_dialog_hint": "Pegue una URL por línea o importe un archivo .txt / .csv.",
+        "bulk_import_file": "Importar desde archivo...",
+        "bulk_skipped": "Se omitieron {skipped} URL(s) (otro servicio, no válidas o ya descargadas).",
+        "bulk_progress": "📋 Lote: {ready}/{total} en cola, {failed} con error",
+        "bulk_summary": "Importación en lote terminada: {completed} descargadas, {failed} con error."
     },
     "de": {
         "title": "YouTube Video und Audio Downloader",
@@ -357,7 +408,24 @@ LANGUAGES = {
         "ffmpeg_button_reinstall": "Neu installieren / Aktualisieren",
         "ffmpeg_tooltip_found": "FFmpeg wurde auf Ihrem System gefunden (in Ihrem AppData-Ordner oder System-PATH).",
         "ffmpeg_tooltip_missing": "Dies installiert FFmpeg in Ihrem AppData-Ordner und fügt es Ihrem PATH hinzu. Keine Admin-Rechte erforderlich.",
-        "clipboard_monitor": "Automatisch aus Zwischenablage"
+        "clipboard_monitor": "Automatisch aus Zwischenablage",
+        "settings_group_queue": "Download-Warteschlange",
+        "settings_max_downloads_label": "Gleichzeitige Downloads:",
+        "download_queued": "🕒 Zur Warteschlange hinzugefügt (#{job_id}). Warte auf einen freien Platz...",
+        "queue_status": "Aktiv: {active} | Wartend: {pending}",
+        "settings_playlist_workers_label": "Parallele Playlist-Videos:",
+        "settings_keep_partial_files": "Teildateien beim Abbrechen behalten (fortsetzbar)",
+        "settings_use_download_archive": "Bereits heruntergeladene Videos überspringen",
+        "queue_eta": "⏳ Warteschlange: {eta}",
+        "download_postprocessing": "⚙️ Konvertiere... (noch {pending} Datei(en))",
+        "settings_show_splash": "Intro-Animation beim Start anzeigen",
+        "bulk_add_button": "Mehrere hinzufügen",
+        "bulk_dialog_title": "Mehrere URLs hinzufügen",
+        "bulk_dialog_hint": "Eine URL pro Zeile einfügen oder eine .txt- / .csv-Datei importieren.",
+        "bulk_import_file": "Aus Datei importieren...",
+        "bulk_skipped": "{skipped} URL(s) wurden übersprungen (anderer Dienst, ungültig oder bereits heruntergeladen).",
+        "bulk_progress": "📋 Stapel: {ready}/{total} eingereiht, {failed} fehlgeschlagen",
+        "bulk_summary": "Stapelimport abgeschlossen: {completed} heruntergeladen, {failed} fehlgeschlagen."
     },
     "fr": {
         "title": "Téléchargeur de vidéos et d'audio YouTube",
@@ -447,7 +515,24 @@ LANGUAGES = {
         "ffmpeg_button_reinstall": "Réinstaller / Mettre à jour",
         "ffmpeg_tooltip_found": "FFmpeg est trouvé sur votre système (dans votre dossier AppData ou PATH système).",
         "ffmpeg_tooltip_missing": "Ceci installera FFmpeg dans votre dossier AppData et l'ajoutera à votre PATH. Aucun droit d'administrateur requis.",
-        "clipboard_monitor": "Collage auto. (Presse-papiers)"
+        "clipboard_monitor": "Collage auto. (Presse-papiers)",
+        "settings_group_queue": "File de téléchargement",
+        "settings_max_downloads_label": "Téléchargements simultanés :",
+        "download_queued": "🕒 Ajouté à la file (#{job_id}). En attente d'un emplacement libre...",
+        "queue_status": "Actifs : {active} | En attente : {pending}",
+        "settings_playlist_workers_label": "Vidéos de playlist en parallèle :",
+        "settings_keep_partial_files": "Conserver les fichiers partiels à l'annulation (reprise possible)",
+        "settings_use_download_archive": "Ignorer les vidéos déjà téléchargées",
+        "queue_eta": "⏳ File : {eta}",
+        "download_postprocessing": "⚙️ Conversion... ({pending} fichier(s) restant(s))",
+        "settings_show_splash": "Afficher l'animation d'introduction au démarrage",
+        "bulk_add_button": "Ajout groupé",
+        "bulk_dialog_title": "Ajout groupé d'URL",
+        "bulk_dialog_hint": "Collez une URL par ligne ou importez un fichier .txt / .csv.",
+        "bulk_import_file": "Importer depuis un fichier...",
+        "bulk_skipped": "{skipped} URL ont été ignorées (autre service, non valides ou déjà téléchargées).",
+        "bulk_progress": "📋 Groupé : {ready}/{total} en file, {failed} en échec",
+        "bulk_summary": "Import groupé terminé : {completed} téléchargées, {failed} en échec."
     },
     "it": {
         "title": "Downloader Video e Audio YouTube",
@@ -537,7 +622,24 @@ LANGUAGES = {
         "ffmpeg_button_reinstall": "Reinstalla / Aggiorna",
         "ffmpeg_tooltip_found": "FFmpeg è stato trovato sul tuo sistema (nella cartella AppData o nel PATH di sistema).",
         "ffmpeg_tooltip_missing": "Questo installerà FFmpeg nella cartella AppData e lo aggiungerà al tuo PATH. Non sono richiesti diritti di amministratore.",
-        "clipboard_monitor": "Incolla auto. (Appunti)"
+        "clipboard_monitor": "Incolla auto. (Appunti)",
+        "settings_group_queue": "Coda di download",
+        "settings_max_downloads_label": "Download simultanei:",
+        "download_queued": "🕒 Aggiunto alla coda (#{job_id}). In attesa di uno slot libero...",
+        "queue_status": "Attivi: {active} | In coda: {pending}",
+        "settings_playlist_workers_label": "Video della playlist in parallelo:",
+        "settings_keep_partial_files": "Conserva i file parziali all'annullamento (ripristinabili)",
+        "settings_use_download_archive": "Salta i video già scaricati",
+        "queue_eta": "⏳ Coda: {eta}",
+        "download_postprocessing": "⚙️ Conversione... ({pending} file rimanenti)",
+        "settings_show_splash": "Mostra l'animazione iniziale all'avvio",
+        "bulk_add_button": "Aggiunta multipla",
+        "bulk_dialog_title": "Aggiunta multipla di URL",
+        "bulk_dialog_hint": "Incolla un URL per riga oppure importa un file .txt / .csv.",
+        "bulk_import_file": "Importa da file...",
+        "bulk_skipped": "{skipped} URL ignorati (altro servizio, non validi o già scaricati).",
+        "bulk_progress": "📋 Multiplo: {ready}/{total} in coda, {failed} non riusciti",
+        "bulk_summary": "Importazione multipla completata: {completed} scaricati, {failed} non riusciti."
     },
     "pt": {
         "title": "Baixador de Vídeo e Áudio do YouTube",
@@ -627,7 +729,24 @@ LANGUAGES = {
         "ffmpeg_button_reinstall": "Reinstalar / Atualizar",
         "ffmpeg_tooltip_found": "O FFmpeg foi encontrado no seu sistema (na pasta AppData ou PATH do sistema).",
         "ffmpeg_tooltip_missing": "Isso instalará o FFmpeg na pasta AppData e o adicionará ao PATH. Não são necessários direitos de administrador.",
-        "clipboard_monitor": "Colar auto. (Área de transf.)"
+        "clipboard_monitor": "Colar auto. (Área de transf.)",
+        "settings_group_queue": "Fila de downloads",
+        "settings_max_downloads_label": "Downloads simultâneos:",
+        "download_queued": "🕒 Adicionado à fila (#{job_id}). Aguardando uma vaga livre...",
+        "queue_status": "Ativos: {active} | Na fila: {pending}",
+        "settings_playlist_workers_label": "Vídeos da playlist em paralelo:",
+        "settings_keep_partial_files": "Manter arquivos parciais ao cancelar (retomáveis)",
+        "settings_use_download_archive": "Pular vídeos já baixados",
+        "queue_eta": "⏳ Fila: {eta}",
+        "download_postprocessing": "⚙️ Convertendo... ({pending} arquivo(s) restante(s))",
+        "settings_show_splash": "Mostrar a animação de abertura ao iniciar",
+        "bulk_add_button": "Adicionar em lote",
+        "bulk_dialog_title": "Adicionar URLs em lote",
+        "bulk_dialog_hint": "Cole uma URL por linha ou importe um arquivo .txt / .csv.",
+        "bulk_import_file": "Importar de arquivo...",
+        "bulk_skipped": "{skipped} URL(s) foram ignoradas (outro serviço, inválidas ou já baixadas).",
+        "bulk_progress": "📋 Lote: {ready}/{total} na fila, {failed} com falha",
+        "bulk_summary": "Importação em lote concluída: {completed} baixados, {failed} com falha."
     },
     "ru": {
         "title": "Загрузчик видео и аудио с YouTube",
@@ -717,7 +836,24 @@ LANGUAGES = {
         "ffmpeg_button_reinstall": "Переустановить / Обновить",
         "ffmpeg_tooltip_found": "FFmpeg найден в вашей системе (в папке AppData или системном PATH).",
         "ffmpeg_tooltip_missing": "Это установит FFmpeg в папку AppData и добавит его в ваш PATH. Права администратора не требуются.",
-        "clipboard_monitor": "Авто-вставка (Буфер)"
+        "clipboard_monitor": "Авто-вставка (Буфер)",
+        "settings_group_queue": "Очередь загрузок",
+        "settings_max_downloads_label": "Одновременных загрузок:",
+        "download_queued": "🕒 Добавлено в очередь (#{job_id}). Ожидание свободного слота...",
+        "queue_status": "Активных: {active} | В очереди: {pending}",
+        "settings_playlist_workers_label": "Параллельных видео плейлиста:",
+        "settings_keep_partial_files": "Сохранять незавершённые файлы при отмене (можно продолжить)",
+        "settings_use_download_archive": "Пропускать уже скачанные видео",
+        "queue_eta": "⏳ Очередь: {eta}",
+        "download_postprocessing": "⚙️ Конвертация... (осталось файлов: {pending})",
+        "settings_show_splash": "Показывать заставку при запуске",
+        "bulk_add_button": "Массовое добавление",
+        "bulk_dialog_title": "Массовое добавление URL",
+        "bulk_dialog_hint": "Вставьте по одному URL в строке или импортируйте файл .txt / .csv.",
+        "bulk_import_file": "Импорт из файла...",
+        "bulk_skipped": "Пропущено URL: {skipped} (другой сервис, неверные или уже скачанные).",
+        "bulk_progress": "📋 Пакет: {ready}/{total} в очереди, ошибок: {failed}",
+        "bulk_summary": "Массовый импорт завершён: скачано {completed}, ошибок: {failed}."
     },
     "ar": {
         "title": "مُحمل الفيديو والصوت من يوتيوب",
@@ -807,7 +943,24 @@ LANGUAGES = {
         "ffmpeg_button_reinstall": "إعادة تثبيت / تحديث",
         "ffmpeg_tooltip_found": "تم العثور على FFmpeg على نظامك (في مجلد AppData أو مسار النظام).",
         "ffmpeg_tooltip_missing": "سيؤدي هذا إلى تثبيت FFmpeg في مجلد AppData الخاص بك وإضافته إلى مسار النظام. لا يلزم وجود حقوق مسؤول.",
-        "clipboard_monitor": "لصق تلقائي (الحافظة)"
+        "clipboard_monitor": "لصق تلقائي (الحافظة)",
+        "settings_group_queue": "قائمة انتظار التنزيل",
+        "settings_max_downloads_label": "التنزيلات المتزامنة:",
+        "download_queued": "🕒 تمت الإضافة إلى قائمة الانتظار (#{job_id}). في انتظار مكان شاغر...",
+        "queue_status": "نشط: {active} | في الانتظار: {pending}",
+        "settings_playlist_workers_label": "مقاطع قائمة التشغيل المتوازية:",
+        "settings_keep_partial_files": "الاحتفاظ بالملفات الجزئية عند الإلغاء (قابلة للاستئناف)",
+        "settings_use_download_archive": "تخطي المقاطع التي تم تنزيلها بالفعل",
+        "queue_eta": "⏳ قائمة الانتظار: {eta}",
+        "download_postprocessing": "⚙️ جارٍ التحويل... (متبقٍ {pending} ملف)",
+        "settings_show_splash": "عرض الرسوم المتحركة الافتتاحية عند بدء التشغيل",
+        "bulk_add_button": "إضافة مجمّعة",
+        "bulk_dialog_title": "إضافة روابط مجمّعة",
+        "bulk_dialog_hint": "الصق رابطًا واحدًا في كل سطر أو استورد ملف .txt / .csv.",
+        "bulk_import_file": "استيراد من ملف...",
+        "bulk_skipped": "تم تخطي {skipped} رابط (خدمة أخرى أو غير صالح أو تم تنزيله بالفعل).",
+        "bulk_progress": "📋 مجمّع: {ready}/{total} في الانتظار، {failed} فشل",
+        "bulk_summary": "اكتمل الاستيراد المجمّع: تم تنزيل {completed}، فشل {failed}."
     },
     "zh": {
         "title": "YouTube视频和音频下载器",
@@ -896,6 +1049,23 @@ LANGUAGES = {
         "ffmpeg_button_reinstall": "重新安装 / 更新",
         "ffmpeg_tooltip_found": "在您的系统上找到了 FFmpeg (在您的 AppData 文件夹或系统 PATH 中).",
         "ffmpeg_tooltip_missing": "这将安装 FFmpeg 到您的 AppData 文件夹并将其添加到您的 PATH。无需管理员权限。",
-        "clipboard_monitor": "自动粘贴 (剪贴板)"
+        "clipboard_monitor": "自动粘贴 (剪贴板)",
+        "settings_group_queue": "下载队列",
+        "settings_max_downloads_label": "同时下载数：",
+        "download_queued": "🕒 已加入队列 (#{job_id})。正在等待空闲位置...",
+        "queue_status": "进行中：{active} | 排队中：{pending}",
+        "settings_playlist_workers_label": "播放列表并行视频数：",
+        "settings_keep_partial_files": "取消时保留未完成的文件（可续传）",
+        "settings_use_download_archive": "跳过已下载的视频",
+        "queue_eta": "⏳ 队列：{eta}",
+        "download_postprocessing": "⚙️ 正在转换...（剩余 {pending} 个文件）",
+        "settings_show_splash": "启动时显示开场动画",
+        "bulk_add_button": "批量添加",
+        "bulk_dialog_title": "批量添加链接",
+        "bulk_dialog_hint": "每行粘贴一个链接，或导入 .txt / .csv 文件。",
+        "bulk_import_file": "从文件导入...",
+        "bulk_skipped": "已跳过 {skipped} 个链接（其他服务、无效或已下载）。",
+        "bulk_progress": "📋 批量：{ready}/{total} 已加入队列，{failed} 个失败",
+        "bulk_summary": "批量导入完成：已下载 {completed} 个，失败 {failed} 个。"
     }
 }
\ No newline at end of file
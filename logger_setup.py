@@ -1,26 +1,100 @@
+import atexit
+import contextvars
+import json
 import logging
 import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
-def setup_logger(name="VidExtract"):
+from app_paths import APP_DATA_PATH
+
+# İş bağlamı: aynı anda çalışan işlerin kayıtlarını ayırt etmek için her kayda eklenir.
+CONTEXT_FIELDS = ("job_id", "service", "phase")
+JSON_LOG_ENV = "VIDEXTRACT_JSON_LOG"
+
+_log_context = contextvars.ContextVar("vidextract_log_context", default={})
+_listener = None
+
+
+@contextmanager
+def log_context(**fields):
+    """
+    Blok içinde bu iş parçacığından yazılan kayıtlara job_id / service / phase ekler.
+    Bağlam iç içe kullanılabilir; içteki alanlar dıştakileri geçersiz kılar.
+    """
+    merged = dict(_log_context.get())
+    merged.update({key: value for key, value in fields.items() if value is not None})
+    token = _log_context.set(merged)
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+
+class _ContextFilter(logging.Filter):
+    """ Kaydı yazan iş parçacığında çalışır; bağlam alanlarını kayda işler. """
+
+    def filter(self, record):
+        context = _log_context.get()
+        for field in CONTEXT_FIELDS:
+            setattr(record, field, context.get(field))
+        record.context = "".join(
+            f" [{field}={context[field]}]" for field in CONTEXT_FIELDS if context.get(field) is not None
+        )
+        return True
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """ Her kaydı tek satırlık bir JSON nesnesi olarak yazar. """
+
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "module": record.module,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        for field in CONTEXT_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def _stop_listener():
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def setup_logger(name="VidExtract", json_lines=None):
     """
     Uygulama genelinde kullanılacak Logger yapılandırması.
     Logları 'AppData/Local/VidExtract/logs/app_debug.log' dosyasına kaydeder.
+    Kayıtlar bir kuyruğa bırakılır; disk ve konsol yazımı ayrı bir dinleyici iş parçacığında yapılır.
+    json_lines (veya VIDEXTRACT_JSON_LOG=1) açıksa ayrıca 'app_debug.jsonl' dosyasına JSON satırları yazılır.
     """
-    
-    app_data_path = os.path.join(os.getenv('LOCALAPPDATA'), 'VidExtract')
-    log_dir = os.path.join(app_data_path, 'logs')
-    
+    global _listener
+
+    logger = logging.getLogger(name)
+    if logger.handlers:
+        return logger
+
+    log_dir = os.path.join(APP_DATA_PATH, 'logs')
+
     if not os.path.exists(log_dir):
         os.makedirs(log_dir, exist_ok=True)
-        
+
     log_file_path = os.path.join(log_dir, 'app_debug.log')
 
-    logger = logging.getLogger(name)
     logger.setLevel(logging.DEBUG)
+    logger.propagate = False
 
-    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(module)s - %(message)s')
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(module)s%(context)s - %(message)s')
 
     file_handler = RotatingFileHandler(log_file_path, maxBytes=5*1024*1024, backupCount=2, encoding='utf-8')
     file_handler.setFormatter(formatter)
@@ -30,10 +104,25 @@ def setup_logger(name="VidExtract"):
     console_handler.setFormatter(formatter)
     console_handler.setLevel(logging.INFO)
 
-    if not logger.handlers:
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+    handlers = [file_handler, console_handler]
+
+    if json_lines is None:
+        json_lines = os.environ.get(JSON_LOG_ENV, "").lower() in ("1", "true", "yes")
+    if json_lines:
+        json_handler = RotatingFileHandler(os.path.join(log_dir, 'app_debug.jsonl'),
+                                           maxBytes=5*1024*1024, backupCount=2, encoding='utf-8')
+        json_handler.setFormatter(JsonLinesFormatter())
+        json_handler.setLevel(logging.DEBUG)
+        handlers.append(json_handler)
+
+    queue_handler = QueueHandler(queue.SimpleQueue())
+    queue_handler.addFilter(_ContextFilter())
+    logger.addHandler(queue_handler)
+
+    _listener = QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_stop_listener)
 
     return logger
 
-logger = setup_logger()
\ No newline at end of file
+logger = setup_logger()
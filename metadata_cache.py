@@ -0,0 +1,146 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+
+from app_paths import APP_DATA_PATH
+from info_cache import canonical_url
+from logger_setup import logger
+from url_classifier import canonical_key
+
+@lru_cache(maxsize=256)
+def url_key(url):
+    """
+    URL'yi ağa çıkmadan 'extractor video_id' anahtarına çevirir (yt-dlp'nin arşiv ön kontrolüyle aynı yöntem).
+    Desteklenen servislerde önce url_classifier'ın hızlı kuralları denenir; yt-dlp extractor taraması yalnızca gerekirse yapılır.
+    Uygun bir extractor bulunamazsa None döner.
+    """
+    key = canonical_key(url)
+    if key:
+        return f"{key[0]} {key[1]}"
+    try:
+        from yt_dlp.extractor import gen_extractor_classes
+        for ie in gen_extractor_classes():
+            if ie.ie_key() == 'Generic' or not ie.suitable(url):
+                continue
+            temp_id = ie.get_temp_id(url)
+            if temp_id:
+                return f"{ie.ie_key().lower()} {temp_id}"
+            break
+    except Exception as e:
+        logger.warning(f"URL anahtarı çıkarılamadı: {url} ({e})")
+    return None
+
+
+class MetadataCache:
+    """
+    get_video_info sonuçlarının (başlık, yükleyen, süre, izlenme, küçük resim URL'si, kalite listesi) disk önbelleği.
+    Kayıtlar 'extractor video_id' anahtarıyla SQLite'ta tutulur; süresi dolan kayıtlar atılır,
+    toplam boyut 'max_bytes' değerini aşınca en uzun süredir kullanılmayan kayıtlar silinir (LRU).
+    """
+
+    def __init__(self, db_path=None, ttl=24 * 3600, max_bytes=4 * 1024 * 1024):
+        if db_path is None:
+            db_path = os.path.join(APP_DATA_PATH, "metadata_cache.db")
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS metadata (
+                key TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                url TEXT NOT NULL,
+                data TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (key, kind)
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_metadata_url ON metadata(url, kind)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_metadata_accessed ON metadata(accessed_at)")
+
+    def _lookup_key(self, url):
+        return url_key(url) or f"url {canonical_url(url)}"
+
+    def get(self, url, kind="video"):
+        """ Süresi dolmamış kayıt varsa video bilgisi sözlüğünü, yoksa None döndürür. """
+        key = self._lookup_key(url)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data, created_at FROM metadata WHERE key = ? AND kind = ?", (key, kind)
+            ).fetchone()
+            if row is None:
+                return None
+            data, created_at = row
+            if created_at + self.ttl < now:
+                self._conn.execute("DELETE FROM metadata WHERE key = ? AND kind = ?", (key, kind))
+                return None
+            self._conn.execute(
+                "UPDATE metadata SET accessed_at = ? WHERE key = ? AND kind = ?", (now, key, kind)
+            )
+        try:
+            return json.loads(data)
+        except ValueError:
+            return None
+
+    def put(self, url, video_info, kind="video"):
+        data = json.dumps(video_info, ensure_ascii=False)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO metadata (key, kind, url, data, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (self._lookup_key(url), kind, canonical_url(url), data, len(data.encode('utf-8')), now, now)
+            )
+            self._evict(now)
+
+    def _evict(self, now):
+        self._conn.execute("DELETE FROM metadata WHERE created_at < ?", (now - self.ttl,))
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM metadata").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = 0
+        for key, kind, size in self._conn.execute(
+            "SELECT key, kind, size FROM metadata ORDER BY accessed_at"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM metadata WHERE key = ? AND kind = ?", (key, kind))
+            total -= size
+            evicted += 1
+        logger.info(f"Bilgi önbelleği: {evicted} eski kayıt silindi.")
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM metadata")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_metadata_cache = None
+_metadata_cache_lock = threading.Lock()
+
+def get_metadata_cache():
+    """ Paylaşılan önbelleği döndürür; veritabanı açılamazsa None (önbelleksiz devam edilir). """
+    global _metadata_cache
+    with _metadata_cache_lock:
+        if _metadata_cache is None:
+            try:
+                _metadata_cache = MetadataCache()
+            except Exception as e:
+                logger.warning(f"Bilgi önbelleği açılamadı: {e}")
+                return None
+        return _metadata_cache
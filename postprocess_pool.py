@@ -0,0 +1,200 @@
+"""
+İndirmeden ayrı çalışan dönüştürme (post-processing) aşaması.
+
+İndirme iş parçacığı dosyayı bitirir bitirmez dönüştürmeyi bu havuza bırakır ve bir sonraki indirmeye geçer.
+Asıl CPU yükü ffmpeg alt süreçlerinde olduğundan havuz, CPU çekirdeği sayısı kadar iş parçacığından oluşur;
+her iş kendi ffmpeg sürecini başlatır.
+"""
+import os
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import child_processes
+from logger_setup import logger
+from tool_locator import get_tool_locator
+
+# biçim: (uzantı, tercih sırasına göre kodlayıcılar, ek argümanlar)
+AUDIO_CODECS = {
+    'mp3': ('mp3', ['libmp3lame', 'mp3_mf'], []),
+    'm4a': ('m4a', ['aac', 'aac_mf'], ['-movflags', '+faststart']),
+    'ogg': ('ogg', ['libvorbis', 'vorbis'], []),
+    'opus': ('opus', ['libopus', 'opus'], []),
+    'flac': ('flac', ['flac'], []),
+    'wav': ('wav', ['pcm_s16le'], []),
+}
+# biçim: (yeniden kodlamadan kopyalanabilen kaynak kodek (ffprobe codec_name), kopyalamada ek argümanlar)
+COPYABLE_CODECS = {
+    'mp3': ('mp3', []),
+    'm4a': ('aac', ['-bsf:a', 'aac_adtstoasc', '-movflags', '+faststart']),
+    'ogg': ('vorbis', []),
+    'opus': ('opus', []),
+    'flac': ('flac', []),
+}
+CONTAINER_MUXERS = {'mp4': 'mp4', 'mkv': 'matroska', 'webm': 'webm'}
+EXPERIMENTAL_ENCODERS = ('vorbis', 'opus')
+LOSSLESS_CODECS = ('flac', 'wav')
+
+class PostProcessingError(Exception):
+    pass
+
+_executor = None
+_executor_lock = threading.Lock()
+
+def get_postprocess_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            workers = os.cpu_count() or 2
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="postprocess")
+            logger.info(f"Dönüştürme havuzu başlatıldı ({workers} işçi).")
+        return _executor
+
+def submit(owner, func, *args, **kwargs):
+    """ Dönüştürme işini havuza gönderir; başlatılan ffmpeg süreçleri 'owner' işine bağlanır (iptal için). """
+    def task():
+        child_processes.set_owner(owner)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            child_processes.clear_owner()
+    return get_postprocess_executor().submit(task)
+
+def _ffmpeg_executable(ffmpeg_location):
+    name = "ffmpeg.exe" if os.name == 'nt' else "ffmpeg"
+    if ffmpeg_location:
+        candidate = ffmpeg_location
+        if os.path.isdir(candidate):
+            candidate = os.path.join(candidate, name)
+        if os.path.exists(candidate):
+            return candidate
+    return get_tool_locator().ffmpeg_executable()
+
+def _ffprobe_executable(ffmpeg_location):
+    name = "ffprobe.exe" if os.name == 'nt' else "ffprobe"
+    if ffmpeg_location:
+        directory = ffmpeg_location if os.path.isdir(ffmpeg_location) else os.path.dirname(ffmpeg_location)
+        candidate = os.path.join(directory, name)
+        if os.path.exists(candidate):
+            return candidate
+    tool = get_tool_locator().ffprobe()
+    return tool.path if tool else None
+
+def probe_audio_codec(path, ffmpeg_location=None):
+    """ Dosyadaki ilk ses akışının kodeği (ör. 'opus', 'aac'); ffprobe yoksa veya okunamazsa None. """
+    ffprobe = _ffprobe_executable(ffmpeg_location)
+    if not ffprobe:
+        return None
+    command = [ffprobe, '-v', 'error', '-select_streams', 'a:0',
+               '-show_entries', 'stream=codec_name', '-of', 'default=noprint_wrappers=1:nokey=1', path]
+    creationflags = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+    try:
+        result = subprocess.run(command, capture_output=True, text=True, encoding='utf-8', errors='replace',
+                                timeout=30, check=False, creationflags=creationflags)
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.warning(f"Ses kodeği okunamadı ({path}): {e}")
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip().splitlines()[0] if result.stdout.strip() else None
+
+def _pick_encoder(candidates):
+    """ Bu ffmpeg derlemesinde bulunan ilk kodlayıcıyı seçer (liste bilinmiyorsa ilk aday). """
+    locator = get_tool_locator()
+    for encoder in candidates:
+        if locator.has_encoder(encoder):
+            return encoder
+    raise PostProcessingError(f"ffmpeg bu biçim için kodlayıcı içermiyor: {', '.join(candidates)}")
+
+def run_ffmpeg(args, output_path, ffmpeg_location=None):
+    """
+    ffmpeg'i 'output_path' çıktısıyla çalıştırır. Çıktı işe bağlanır: süreç hata verir veya iptalde öldürülürse
+    yarım dosya silinir. Başarılı olunca çağıranın release_output() ile çıktıyı sahiplenmesi gerekir.
+    """
+    command = [_ffmpeg_executable(ffmpeg_location), '-y', '-loglevel', 'error', '-nostdin'] + args + [output_path]
+    creationflags = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+    child_processes.register_output(output_path)
+    process = subprocess.Popen(
+        command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, creationflags=creationflags
+    )
+    child_processes.register(process)
+    _, stderr = process.communicate()
+    if process.returncode != 0:
+        child_processes.remove_output(output_path)
+        child_processes.release_output(output_path)
+        message = stderr.decode('utf-8', 'replace').strip().splitlines()
+        raise PostProcessingError(message[-1] if message else f"ffmpeg çıkış kodu {process.returncode}")
+
+def _replace_output(source_path, temp_path, target_path):
+    os.replace(temp_path, target_path)
+    child_processes.release_output(temp_path)
+    if os.path.abspath(source_path) != os.path.abspath(target_path):
+        try:
+            os.remove(source_path)
+        except OSError as e:
+            logger.warning(f"Kaynak dosya silinemedi: {source_path} ({e})")
+    return target_path
+
+def extract_audio(source_path, codec, quality='192', ffmpeg_location=None):
+    """
+    FFmpegExtractAudio karşılığı: sesi 'codec' biçimine dönüştürür ve yeni dosya yolunu döndürür.
+    Kaynaktaki ses zaten hedef kodekteyse (ör. webm içindeki opus -> .opus) yt-dlp'deki gibi yeniden kodlanmaz, kopyalanır.
+    """
+    if codec not in AUDIO_CODECS:
+        codec = 'mp3'
+    extension, encoders, extra_args = AUDIO_CODECS[codec]
+    base, source_extension = os.path.splitext(source_path)
+    target_path = f"{base}.{extension}"
+    if source_extension.lstrip('.').lower() == extension:
+        return source_path
+
+    temp_path = f"{base}.temp.{extension}"
+    copyable = COPYABLE_CODECS.get(codec)
+    if copyable and probe_audio_codec(source_path, ffmpeg_location) == copyable[0]:
+        args = ['-i', source_path, '-vn', '-acodec', 'copy'] + copyable[1]
+        action = "kopyalandı"
+    else:
+        encoder = _pick_encoder(encoders)
+        args = ['-i', source_path, '-vn', '-c:a', encoder] + extra_args
+        if encoder in EXPERIMENTAL_ENCODERS:
+            args += ['-strict', 'experimental']
+        if codec not in LOSSLESS_CODECS and quality:
+            args += ['-b:a', f"{quality}k"]
+        action = "dönüştürüldü"
+    run_ffmpeg(args, temp_path, ffmpeg_location)
+    logger.info(f"Ses {action}: {target_path}")
+    return _replace_output(source_path, temp_path, target_path)
+
+def remux_video(source_path, container, ffmpeg_location=None):
+    """ FFmpegVideoRemuxer karşılığı: akışları yeniden kodlamadan 'container' kabına taşır. """
+    base, source_extension = os.path.splitext(source_path)
+    if source_extension.lstrip('.').lower() == container:
+        return source_path
+
+    muxer = CONTAINER_MUXERS.get(container, container)
+    if not get_tool_locator().has_muxer(muxer):
+        logger.warning(f"ffmpeg '{muxer}' kabını desteklemiyor, özgün dosya korunuyor: {source_path}")
+        return source_path
+
+    target_path = f"{base}.{container}"
+    temp_path = f"{base}.temp.{container}"
+    try:
+        run_ffmpeg(['-i', source_path, '-map', '0', '-dn', '-ignore_unknown', '-c', 'copy'], temp_path, ffmpeg_location)
+    except PostProcessingError as e:
+        # yt-dlp'deki gibi: kap bu kodekleri desteklemiyorsa dosya özgün biçiminde bırakılır.
+        logger.warning(f"'{container}' kabına aktarılamadı, özgün dosya korunuyor: {source_path} ({e})")
+        return source_path
+    logger.info(f"Video yeniden paketlendi: {target_path}")
+    return _replace_output(source_path, temp_path, target_path)
+
+def run_postprocessors(source_path, postprocessors, ffmpeg_location=None):
+    """ build_ydl_options() içindeki post-processor tanımlarını sırayla uygular, son dosya yolunu döndürür. """
+    path = source_path
+    for pp in postprocessors:
+        if pp.get('key') == 'FFmpegExtractAudio':
+            path = extract_audio(path, pp.get('preferredcodec', 'mp3'), pp.get('preferredquality'), ffmpeg_location)
+        elif pp.get('key') == 'FFmpegVideoRemuxer':
+            path = remux_video(path, pp.get('preferedformat', 'mp4'), ffmpeg_location)
+        else:
+            logger.warning(f"Desteklenmeyen post-processor atlandı: {pp.get('key')}")
+    return path
@@ -0,0 +1,36 @@
+import importlib
+import threading
+import time
+
+from logger_setup import logger
+
+PREWARM_MODULES = ("requests", "yt_dlp")
+
+_started = False
+_lock = threading.Lock()
+
+def _prewarm(modules):
+    for name in modules:
+        started = time.perf_counter()
+        try:
+            importlib.import_module(name)
+            if name == "yt_dlp":
+                # Extractor tabloları ilk doğrulamada ve URL anahtarı çıkarılırken gerekir.
+                from yt_dlp.extractor import gen_extractor_classes
+                gen_extractor_classes()
+        except Exception as e:
+            logger.warning(f"'{name}' önceden yüklenemedi: {e}")
+            continue
+        logger.info(f"'{name}' önceden yüklendi ({(time.perf_counter() - started) * 1000:.0f} ms).")
+
+def prewarm_in_background(modules=PREWARM_MODULES):
+    """
+    Ağır modülleri arka planda bir kez yükler; böylece ilk doğrulama / indirme beklemez.
+    Servis seçim ekranı gösterildikten sonra çağrılır, açılışı geciktirmez.
+    """
+    global _started
+    with _lock:
+        if _started:
+            return
+        _started = True
+    threading.Thread(target=_prewarm, args=(modules,), name="prewarm", daemon=True).start()
@@ -0,0 +1,106 @@
+import threading
+import time
+
+from languages import LANGUAGES
+
+class ProgressState:
+    """
+    Bir işin en son ilerleme durumunu sayısal olarak tutan, iş parçacığı güvenli kayıt.
+    yt-dlp kancaları saniyede yüzlerce kez update() çağırabilir; tüketiciler (arayüz ~10 Hz, konsol)
+    poll() ile yalnızca değişen son durumu alır. Metin biçimlendirme format_progress() ile gösterimde yapılır.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot = {'status': 'queued', 'percent': 0}
+        self._version = 0
+        self._polled_version = 0
+
+    def update(self, **fields):
+        fields['updated_at'] = time.monotonic()
+        with self._lock:
+            self._snapshot = fields
+            self._version += 1
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self._snapshot)
+
+    def poll(self):
+        """ Son poll()'dan beri değiştiyse durumun bir kopyasını, değişmediyse None döndürür. """
+        with self._lock:
+            if self._version == self._polled_version:
+                return None
+            self._polled_version = self._version
+            return dict(self._snapshot)
+
+
+def format_size(num_bytes):
+    if num_bytes >= 1_073_741_824:
+        return f"{num_bytes / 1_073_741_824:.2f} GB"
+    return f"{num_bytes / 1024 / 1024:.2f} MB"
+
+def format_speed(speed):
+    speed = speed or 0
+    if speed >= 1_048_576: 
+        return f"{speed / 1_048_576:.2f} MB/s"
+    elif speed >= 1024: 
+        return f"{speed / 1024:.2f} KB/s"
+    return f"{speed:.2f} B/s"
+
+def format_eta(eta):
+    if eta is None:
+        return "--"
+    eta = int(eta)
+    if eta >= 3600:
+        return f"{eta // 3600}h {eta % 3600 // 60}m"
+    if eta > 60:
+        return f"{eta // 60}m {eta % 60}s"
+    return f"{eta}s"
+
+def format_progress(snapshot, language_code="en"):
+    """ ProgressState anlık görüntüsünü (yüzde, markdown metin) çiftine çevirir. """
+    lang = LANGUAGES.get(language_code, LANGUAGES["en"])
+    status = snapshot.get('status')
+    percent = int(snapshot.get('percent') or 0)
+    playlist_index = snapshot.get('playlist_index')
+    n_entries = snapshot.get('n_entries')
+
+    playlist_prefix = ""
+    if playlist_index and n_entries:
+        playlist_prefix = f"**[Video {playlist_index}/{n_entries}]**\n"
+
+    if status == 'downloading':
+        total_size = snapshot.get('total_bytes') or 0
+        if total_size <= 0:
+            return 0, f"{playlist_prefix}{lang.get('download_starting', '⏳ Download starting... Please wait.')}"
+        in_progress = lang.get("download_in_progress", "📥 Downloading in progress: {percent}% complete").format(percent=percent)
+        speed_eta = lang.get("download_speed_eta", "🚀 Speed: {speed} | ⏳ Time remaining: {eta}").format(
+            speed=format_speed(snapshot.get('speed')), eta=format_eta(snapshot.get('eta'))
+        )
+        size_line = f"🔹 {format_size(snapshot.get('downloaded_bytes') or 0)} / {format_size(total_size)}"
+        if n_entries and snapshot.get('job_total_bytes'):
+            size_line += (
+                f"  (Σ {format_size(snapshot.get('job_downloaded_bytes') or 0)}"
+                f" / ~{format_size(snapshot['job_total_bytes'])})"
+            )
+        return percent, f"{playlist_prefix}**{in_progress}**\n{size_line}\n{speed_eta}"
+
+    if status == 'finished':
+        if playlist_index:
+            return 100, f"✅ **[Video {playlist_index}]** {lang.get('download_complete', '✅ Download completed successfully!').lstrip('✅ ')}"
+        return 100, f"**{lang.get('download_complete', '✅ Download completed successfully!')}**"
+
+    if status == 'postprocessing':
+        text = lang.get("download_postprocessing", "⚙️ Converting... ({pending} file(s) left)").format(
+            pending=snapshot.get('pending_files') or 0
+        )
+        return 100, f"**{text}**"
+
+    if status == 'entry_error':
+        return percent, f"⚠️ **[Video {playlist_index}/{n_entries}]** {snapshot.get('error', '')}"
+
+    if status == 'error':
+        return percent, f"⚠️ {snapshot.get('error', lang.get('download_error', 'An error occurred during download.'))}"
+
+    return percent, f"{playlist_prefix}{lang.get('download_starting', '⏳ Download starting... Please wait.')}"
@@ -0,0 +1,107 @@
+import threading
+import time
+from collections import deque
+
+class RateEstimator:
+    """
+    Byte örneklerinden kararlı hız tahmini.
+    Son 'window' örnek bir halka tamponda tutulur; tampondaki ortalama hız EWMA ile yumuşatılır.
+    """
+
+    def __init__(self, window=20, alpha=0.25, min_span=0.5):
+        self.alpha = alpha
+        self.min_span = min_span
+        self._samples = deque(maxlen=window)
+        self._speed = None
+
+    def add_sample(self, total_bytes, timestamp=None):
+        if timestamp is None:
+            timestamp = time.monotonic()
+        if self._samples and total_bytes < self._samples[-1][1]:
+            self._samples.clear()
+        self._samples.append((timestamp, total_bytes))
+
+        first_time, first_bytes = self._samples[0]
+        span = timestamp - first_time
+        if span < self.min_span:
+            return
+        window_speed = (total_bytes - first_bytes) / span
+        if self._speed is None:
+            self._speed = window_speed
+        else:
+            self._speed = self.alpha * window_speed + (1 - self.alpha) * self._speed
+
+    @property
+    def speed(self):
+        return self._speed or 0.0
+
+    def eta(self, remaining_bytes):
+        if remaining_bytes <= 0:
+            return 0
+        if not self._speed or self._speed <= 0:
+            return None
+        return remaining_bytes / self._speed
+
+    def reset(self):
+        self._samples.clear()
+        self._speed = None
+
+
+class TransferTracker:
+    """
+    Bir işin tüm dosyalarındaki ilerlemeyi toplar (tek video veya playlist).
+    'unit' bir videoyu, 'part' o videonun bir dosyasını (ör. ayrı görüntü + ses) temsil eder.
+    Henüz başlamamış videoların boyutu, görülen videoların ortalamasıyla tahmin edilir.
+    """
+
+    def __init__(self, expected_units=1, estimator=None):
+        self.expected_units = max(1, expected_units)
+        self.estimator = estimator or RateEstimator()
+        self._lock = threading.Lock()
+        self._parts = {}
+        self._units = set()
+
+    def update(self, unit, part, downloaded_bytes, total_bytes, timestamp=None):
+        with self._lock:
+            self._units.add(unit)
+            self._parts[(unit, part)] = (downloaded_bytes, max(total_bytes or 0, downloaded_bytes))
+            self.estimator.add_sample(self._downloaded(), timestamp)
+
+    def finish(self, unit, part):
+        with self._lock:
+            downloaded, total = self._parts.get((unit, part), (0, 0))
+            self._units.add(unit)
+            self._parts[(unit, part)] = (max(downloaded, total), max(downloaded, total))
+
+    def _downloaded(self):
+        return sum(downloaded for downloaded, _ in self._parts.values())
+
+    def totals(self):
+        """ (indirilen_byte, tahmini_toplam_byte, hız, kalan_süre) döndürür. """
+        with self._lock:
+            downloaded = self._downloaded()
+            known_total = sum(total for _, total in self._parts.values())
+            unseen_units = max(0, self.expected_units - len(self._units))
+            if self._units and unseen_units:
+                known_total += unseen_units * known_total / len(self._units)
+            speed = self.estimator.speed
+            return downloaded, known_total, speed, self.estimator.eta(known_total - downloaded)
+
+
+def queue_eta(job_totals, pending_jobs=0, average_job_bytes=None):
+    """
+    Kuyruğun tamamı için kalan süre tahmini.
+    'job_totals' aktif işlerin (indirilen, toplam, hız) üçlüleridir; bekleyen işlerin boyutu
+    'average_job_bytes' (ör. bu oturumda biten işlerin ortalaması) ile tahmin edilir.
+    """
+    if any(total <= 0 for _, total, _ in job_totals):
+        return None
+    remaining = sum(max(0, total - downloaded) for downloaded, total, _ in job_totals)
+    speed = sum(speed for _, _, speed in job_totals)
+    if pending_jobs and average_job_bytes:
+        remaining += pending_jobs * average_job_bytes
+    if remaining <= 0:
+        return 0
+    if speed <= 0:
+        return None
+    return remaining / speed
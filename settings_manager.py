@@ -1,7 +1,17 @@
+import atexit
+import threading
+
 from logger_setup import logger
 from PySide6.QtCore import QSettings
 
 class _SettingsManager:
+    """
+    Ayarlar açılışta bir kez okunup türüne çevrilerek bellekte tutulur; okumalar QSettings'e gitmez.
+    Yazmalar birleştirilir ve FLUSH_DELAY_SECONDS sonra (veya kapanışta) tek seferde diske yazılır.
+    subscribe() ile bir ayarın değişimi dinlenebilir.
+    """
+    FLUSH_DELAY_SECONDS = 2.0
+
     def __init__(self):
         self.qsettings = QSettings("VidExtract", "DownloaderApp")
 
@@ -10,31 +20,35 @@ class _SettingsManager:
         self.KEY_THEME_MODE = "theme_mode"
         self.KEY_COOKIE_PATH = "cookie_file_path"
         self.KEY_CLIPBOARD_MONITOR = "clipboard_monitor"
+        self.KEY_MAX_CONCURRENT_DOWNLOADS = "max_concurrent_downloads"
+        self.KEY_PLAYLIST_WORKERS = "playlist_workers"
+        self.KEY_KEEP_PARTIAL_FILES = "keep_partial_files"
+        self.KEY_USE_DOWNLOAD_ARCHIVE = "use_download_archive"
+        self.KEY_SHOW_SPLASH = "show_splash"
         
         self.DEFAULT_VALUES = {
             self.KEY_DOWNLOAD_FOLDER: "downloads",
             self.KEY_LANGUAGE_INDEX: 1, 
             self.KEY_THEME_MODE: "dark",
             self.KEY_COOKIE_PATH: "",
-            self.KEY_CLIPBOARD_MONITOR: True 
+            self.KEY_CLIPBOARD_MONITOR: True,
+            self.KEY_MAX_CONCURRENT_DOWNLOADS: 3,
+            self.KEY_PLAYLIST_WORKERS: 3,
+            self.KEY_KEEP_PARTIAL_FILES: True,
+            self.KEY_USE_DOWNLOAD_ARCHIVE: True,
+            self.KEY_SHOW_SPLASH: True
         }
 
-    def save_setting(self, key, value):
-        if value is None:
-            logger.warning(f"Ayarlar: '{key}' anahtarı için None değeri kaydedilmeye çalışıldı.")
-            return
-
-        self.qsettings.setValue(key, value)
-        self.qsettings.sync() 
-
-    def get_setting(self, key):
-        if key not in self.DEFAULT_VALUES:
-            raise KeyError(f"Ayar anahtarı '{key}' için varsayılan değer tanımlanmamış.")
+        self._lock = threading.RLock()
+        self._dirty = set()
+        self._flush_timer = None
+        self._subscribers = {}
+        self._values = {key: self._read_setting(key) for key in self.DEFAULT_VALUES}
+        atexit.register(self.flush)
 
+    def _coerce(self, key, value):
         default_value = self.DEFAULT_VALUES[key]
         expected_type = type(default_value)
-        value = self.qsettings.value(key, defaultValue=default_value, type=expected_type)
-        
         try:
             if expected_type == int:
                 return int(value)
@@ -43,6 +57,65 @@ class _SettingsManager:
             return expected_type(value)
         except (ValueError, TypeError):
             return default_value
+
+    def _read_setting(self, key):
+        default_value = self.DEFAULT_VALUES[key]
+        value = self.qsettings.value(key, defaultValue=default_value, type=type(default_value))
+        return self._coerce(key, value)
+
+    def save_setting(self, key, value):
+        if value is None:
+            logger.warning(f"Ayarlar: '{key}' anahtarı için None değeri kaydedilmeye çalışıldı.")
+            return
+        if key in self.DEFAULT_VALUES:
+            value = self._coerce(key, value)
+
+        with self._lock:
+            if self._values.get(key) == value:
+                return
+            self._values[key] = value
+            self._dirty.add(key)
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.FLUSH_DELAY_SECONDS, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+            subscribers = list(self._subscribers.get(key, ()))
+
+        for callback in subscribers:
+            try:
+                callback(key, value)
+            except Exception as e:
+                logger.error(f"Ayar değişikliği bildirilemedi ({key}): {e}")
+
+    def flush(self):
+        """ Bekleyen değişiklikleri tek seferde QSettings'e yazar. """
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return
+            for key in self._dirty:
+                self.qsettings.setValue(key, self._values[key])
+            self._dirty.clear()
+            self.qsettings.sync()
+
+    def subscribe(self, key, callback):
+        """ 'key' değiştiğinde callback(key, yeni_değer) çağrılır (değiştiren iş parçacığında). """
+        with self._lock:
+            self._subscribers.setdefault(key, []).append(callback)
+
+    def unsubscribe(self, key, callback):
+        with self._lock:
+            callbacks = self._subscribers.get(key, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+
+    def get_setting(self, key):
+        if key not in self.DEFAULT_VALUES:
+            raise KeyError(f"Ayar anahtarı '{key}' için varsayılan değer tanımlanmamış.")
+        with self._lock:
+            return self._values[key]
             
     def get_all_settings(self):
         return {
@@ -65,4 +138,9 @@ KEY_DOWNLOAD_FOLDER = settings_manager.KEY_DOWNLOAD_FOLDER
 KEY_LANGUAGE_INDEX = settings_manager.KEY_LANGUAGE_INDEX
 KEY_THEME_MODE = settings_manager.KEY_THEME_MODE
 KEY_COOKIE_PATH = settings_manager.KEY_COOKIE_PATH
-KEY_CLIPBOARD_MONITOR = settings_manager.KEY_CLIPBOARD_MONITOR
\ No newline at end of file
+KEY_CLIPBOARD_MONITOR = settings_manager.KEY_CLIPBOARD_MONITOR
+KEY_MAX_CONCURRENT_DOWNLOADS = settings_manager.KEY_MAX_CONCURRENT_DOWNLOADS
+KEY_PLAYLIST_WORKERS = settings_manager.KEY_PLAYLIST_WORKERS
+KEY_KEEP_PARTIAL_FILES = settings_manager.KEY_KEEP_PARTIAL_FILES
+KEY_USE_DOWNLOAD_ARCHIVE = settings_manager.KEY_USE_DOWNLOAD_ARCHIVE
+KEY_SHOW_SPLASH = settings_manager.KEY_SHOW_SPLASH
\ No newline at end of file
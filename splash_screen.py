@@ -0,0 +1,121 @@
+import os
+
+from PySide6.QtCore import Qt, Signal, Slot, QTimer, QUrl
+from PySide6.QtGui import QImage, QPainter
+from PySide6.QtWidgets import QWidget
+
+from logger_setup import logger
+
+STATIC_SPLASH_DURATION_MS = 1200
+
+
+class _SplashBase(QWidget):
+    """ Çerçevesiz, saydam açılış penceresi. Gösterilecek görsel, pencere boyutuna önceden ölçeklenmiş olarak tutulur. """
+    finished = Signal()
+
+    def __init__(self):
+        super().__init__()
+
+        self.setWindowFlags(
+            Qt.FramelessWindowHint |
+            Qt.WindowStaysOnTopHint |
+            Qt.Tool
+        )
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setAttribute(Qt.WA_DeleteOnClose)
+
+        self.setStyleSheet("background: transparent;")
+
+        self.current_frame = QImage()
+
+    def _fit(self, image):
+        if image.size() == self.size():
+            return image
+        return image.scaled(self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+
+        if not self.current_frame.isNull():
+            x = (self.width() - self.current_frame.width()) // 2
+            y = (self.height() - self.current_frame.height()) // 2
+            painter.drawImage(x, y, self.current_frame)
+        else:
+            painter.fillRect(self.rect(), Qt.transparent)
+
+
+class VideoSplashScreen(_SplashBase):
+    """
+    assets/giris.mp4 oynatılır. Her kare geldiği anda bir kez ölçeklenir (paintEvent yalnızca çizer);
+    önceki kare henüz çizilmediyse yeni kare dönüştürülmeden atlanır.
+    """
+
+    def __init__(self, video_path):
+        super().__init__()
+        from PySide6.QtMultimedia import QMediaPlayer, QVideoSink
+
+        self._stopped_state = QMediaPlayer.PlaybackState.StoppedState
+        self._frame_pending = False
+
+        self.player = QMediaPlayer(self)
+        self.sink = QVideoSink(self)
+        self.player.setVideoSink(self.sink)
+
+        self.sink.videoFrameChanged.connect(self.on_frame_changed)
+
+        video_file_url = QUrl.fromLocalFile(os.path.abspath(video_path))
+        self.player.setSource(video_file_url)
+
+        self.player.playbackStateChanged.connect(self.on_state_changed)
+
+        self.player.play()
+
+    @Slot(object)
+    def on_frame_changed(self, frame):
+        if self._frame_pending or not frame.isValid():
+            return
+        # toImage() zaten bağımsız bir QImage döndürür; ek kopya gerekmez.
+        self.current_frame = self._fit(frame.toImage())
+        self._frame_pending = True
+        self.update()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        self._frame_pending = False
+
+    @Slot(object)
+    def on_state_changed(self, state):
+        if state == self._stopped_state:
+            self.finished.emit()
+
+
+class StaticSplashScreen(_SplashBase):
+    """ Video oynatılamadığında kullanılan hafif açılış: logo kısa bir süre gösterilir. """
+
+    def __init__(self, image_path, duration_ms=STATIC_SPLASH_DURATION_MS):
+        super().__init__()
+        self._image = QImage(image_path)
+        QTimer.singleShot(duration_ms, self.finished.emit)
+
+    def resizeEvent(self, event):
+        if not self._image.isNull():
+            self.current_frame = self._fit(self._image)
+        super().resizeEvent(event)
+
+
+def create_splash(video_path, image_path):
+    """
+    Uygun açılış ekranını döndürür: video (QtMultimedia varsa) -> sabit logo -> None (doğrudan ana ekran).
+    QtMultimedia yalnızca video açılışı gerçekten kullanılacaksa yüklenir.
+    """
+    if os.path.exists(video_path):
+        try:
+            return VideoSplashScreen(video_path)
+        except ImportError as e:
+            logger.warning(f"Video açılışı kullanılamıyor, sabit görsele geçiliyor: {e}")
+    else:
+        logger.warning(f"Splash video dosyası bulunamadı: {video_path}")
+
+    if os.path.exists(image_path):
+        return StaticSplashScreen(image_path)
+    return None
@@ -0,0 +1,132 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide6.QtCore import QObject, QSize, Qt, Signal
+from PySide6.QtGui import QImage
+
+from app_paths import APP_DATA_PATH
+from logger_setup import logger
+
+THUMBNAIL_CACHE_PATH = os.path.join(APP_DATA_PATH, "thumbnails")
+
+class ThumbnailLoader(QObject):
+    """
+    Küçük resimleri arayüz iş parçacığını bloklamadan yükler.
+    İndirme, çözümleme ve ölçekleme havuzda yapılır (QImage iş parçacığı güvenlidir);
+    sonuç 'thumbnail_ready' sinyaliyle ana iş parçacığına iletilir, QPixmap'e orada çevrilir.
+    Ham görseller diskte, ölçeklenmiş görseller bellekte LRU olarak saklanır.
+    """
+    thumbnail_ready = Signal(str, QImage)
+    thumbnail_failed = Signal(str, str)
+
+    def __init__(self, max_workers=4, memory_entries=32, disk_max_bytes=50 * 1024 * 1024, parent=None):
+        super().__init__(parent)
+        self.memory_entries = memory_entries
+        self.disk_max_bytes = disk_max_bytes
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="thumbnail")
+
+        import requests
+        from requests.adapters import HTTPAdapter
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max_workers)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        os.makedirs(THUMBNAIL_CACHE_PATH, exist_ok=True)
+
+    def load(self, url, size):
+        """ 'url' görselini 'size' (QSize) içine sığacak şekilde yükler; sonuç sinyalle gelir. """
+        key = (url, size.width(), size.height())
+        with self._lock:
+            image = self._memory.get(key)
+            if image is not None:
+                self._memory.move_to_end(key)
+        if image is not None:
+            self.thumbnail_ready.emit(url, image)
+            return
+        self._executor.submit(self._load, url, QSize(size))
+
+    def _load(self, url, size):
+        try:
+            data = self._read_disk(url)
+            if data is None:
+                response = self._session.get(url, timeout=10)
+                if response.status_code != 200:
+                    self.thumbnail_failed.emit(url, f"HTTP Hatası: {response.status_code}")
+                    return
+                data = response.content
+                self._write_disk(url, data)
+
+            image = QImage()
+            if not image.loadFromData(data):
+                self.thumbnail_failed.emit(url, "Görsel yüklenemedi")
+                return
+            image = image.scaled(size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+            with self._lock:
+                self._memory[(url, size.width(), size.height())] = image
+                while len(self._memory) > self.memory_entries:
+                    self._memory.popitem(last=False)
+            self.thumbnail_ready.emit(url, image)
+        except Exception as e:
+            self.thumbnail_failed.emit(url, f"Hata: {str(e)}")
+
+    def _disk_path(self, url):
+        return os.path.join(THUMBNAIL_CACHE_PATH, hashlib.sha1(url.encode('utf-8')).hexdigest())
+
+    def _read_disk(self, url):
+        path = self._disk_path(url)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)
+            return data
+        except OSError:
+            return None
+
+    def _write_disk(self, url, data):
+        path = self._disk_path(url)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Küçük resim önbelleğe yazılamadı: {e}")
+            return
+        self._evict_disk()
+
+    def _evict_disk(self):
+        """ Disk önbelleği sınırı aşarsa en uzun süredir kullanılmayan dosyaları siler. """
+        try:
+            entries = []
+            for entry in os.scandir(THUMBNAIL_CACHE_PATH):
+                if entry.is_file() and not entry.name.endswith(".tmp"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            return
+        total = sum(size for _, size, _ in entries)
+        if total <= self.disk_max_bytes:
+            return
+        for _, size, path in sorted(entries):
+            if total <= self.disk_max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+
+_thumbnail_loader = None
+
+def get_thumbnail_loader():
+    global _thumbnail_loader
+    if _thumbnail_loader is None:
+        _thumbnail_loader = ThumbnailLoader()
+    return _thumbnail_loader
@@ -0,0 +1,155 @@
+import os
+import shutil
+import subprocess
+import sys
+import threading
+
+from app_paths import TARGET_BIN_PATH
+from logger_setup import logger
+
+EXE_SUFFIX = ".exe" if os.name == 'nt' else ""
+
+class ToolInfo:
+    """ Bulunan bir aracın (ffmpeg / ffprobe) yolu, kaynağı ve sürümü. """
+
+    def __init__(self, name, path, source, version=None):
+        self.name = name
+        self.path = path
+        self.directory = os.path.dirname(path)
+        self.source = source
+        self.version = version
+
+    def __repr__(self):
+        return f"ToolInfo({self.name!r}, {self.path!r}, source={self.source!r}, version={self.version!r})"
+
+
+def _run(command):
+    creationflags = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+    result = subprocess.run(
+        command, capture_output=True, text=True, encoding='utf-8', errors='replace',
+        timeout=15, check=False, creationflags=creationflags
+    )
+    return result.stdout
+
+def _parse_capability_list(output, flag):
+    """ 'ffmpeg -encoders' / '-muxers' çıktısından adları toplar ('--' ayracından sonraki satırlar). """
+    names = set()
+    started = False
+    for line in output.splitlines():
+        stripped = line.strip()
+        if not started:
+            started = stripped.startswith("--")
+            continue
+        fields = stripped.split()
+        if len(fields) >= 2 and flag in fields[0]:
+            names.update(fields[1].split(','))
+    return names
+
+
+class ToolLocator:
+    """
+    ffmpeg / ffprobe konumunu bir kez çözer ve önbelleğe alır.
+    Arama sırası: PyInstaller paketi (MEIPASS) -> AppData kurulumu -> sistem PATH.
+    Sürüm ve kodlayıcı / muxer listeleri ilk istendiklerinde ffmpeg'e sorulur.
+    Önbellek yalnızca invalidate() ile (ör. kurulumdan sonra) temizlenir.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tools = {}
+        self._capabilities = {}
+
+    def _candidates(self, name):
+        executable = name + EXE_SUFFIX
+        if hasattr(sys, '_MEIPASS'):
+            yield os.path.join(sys._MEIPASS, 'ffmpeg', 'bin', executable), "bundle"
+        yield os.path.join(TARGET_BIN_PATH, executable), "appdata"
+        path = shutil.which(name)
+        if path:
+            yield path, "path"
+
+    def _resolve(self, name):
+        for path, source in self._candidates(name):
+            if os.path.isfile(path):
+                version = None
+                try:
+                    first_line = _run([path, '-hide_banner', '-version']).splitlines()[0]
+                    version = first_line.split(' version ', 1)[1].split()[0]
+                except (OSError, IndexError, subprocess.SubprocessError) as e:
+                    logger.warning(f"{name} sürümü okunamadı ({path}): {e}")
+                tool = ToolInfo(name, path, source, version)
+                logger.info(f"{name} bulundu: {path} (kaynak: {source}, sürüm: {version or '?'})")
+                return tool
+        logger.info(f"{name} bulunamadı.")
+        return None
+
+    def get(self, name):
+        with self._lock:
+            if name not in self._tools:
+                self._tools[name] = self._resolve(name)
+            return self._tools[name]
+
+    def ffmpeg(self):
+        return self.get("ffmpeg")
+
+    def ffprobe(self):
+        return self.get("ffprobe")
+
+    def is_available(self, require_ffprobe=False):
+        return self.ffmpeg() is not None and (not require_ffprobe or self.ffprobe() is not None)
+
+    def ffmpeg_location(self):
+        """ yt-dlp'nin 'ffmpeg_location' seçeneği için klasör; araç PATH'te ise None (yt-dlp kendisi bulur). """
+        tool = self.ffmpeg()
+        if tool is None or tool.source == "path":
+            return None
+        return tool.directory
+
+    def ffmpeg_executable(self):
+        tool = self.ffmpeg()
+        return tool.path if tool else "ffmpeg"
+
+    def _capability_set(self, kind, flag):
+        tool = self.ffmpeg()
+        if tool is None:
+            return None
+        with self._lock:
+            if kind not in self._capabilities:
+                try:
+                    self._capabilities[kind] = _parse_capability_list(_run([tool.path, '-hide_banner', f'-{kind}']), flag)
+                except (OSError, subprocess.SubprocessError) as e:
+                    logger.warning(f"ffmpeg {kind} listesi alınamadı: {e}")
+                    self._capabilities[kind] = None
+            return self._capabilities[kind]
+
+    def encoders(self):
+        """ Kullanılabilir kodlayıcı adları; bilinmiyorsa None. """
+        return self._capability_set("encoders", "")
+
+    def muxers(self):
+        return self._capability_set("muxers", "E")
+
+    def has_encoder(self, name):
+        encoders = self.encoders()
+        return encoders is None or name in encoders
+
+    def has_muxer(self, name):
+        muxers = self.muxers()
+        return muxers is None or name in muxers
+
+    def invalidate(self):
+        with self._lock:
+            self._tools.clear()
+            self._capabilities.clear()
+        logger.info("Araç konum önbelleği temizlendi.")
+
+
+_tool_locator = None
+_tool_locator_lock = threading.Lock()
+
+def get_tool_locator():
+    global _tool_locator
+    with _tool_locator_lock:
+        if _tool_locator is None:
+            _tool_locator = ToolLocator()
+        return _tool_locator
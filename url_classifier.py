@@ -0,0 +1,158 @@
+"""
+Servis URL kayıt defteri: doğrulama ve pano takibi aynı, önceden derlenmiş ifadeleri kullanır.
+Qt'ye bağlı değildir; yüzlerce URL tek tek derleme yapılmadan sınıflandırılabilir.
+"""
+import re
+
+# servis -> (alan adı ifadesi, geçerli bağlantı ifadesi)
+SERVICE_PATTERNS = {
+    "youtube": (
+        r"(?:youtube\.com|youtu\.be)",
+        r"(https?://)?(www\.)?(youtube\.com/watch\?v=|youtu\.be/|youtube\.com/playlist\?list=|music\.youtube\.com/watch\?v=)",
+    ),
+    "twitter": (
+        r"(?:twitter\.com|x\.com)",
+        r"(https?://)?(www\.)?(twitter\.com|x\.com)/(.+?)/status/(\d+)",
+    ),
+    "facebook": (
+        r"(?:facebook\.com|fb\.watch)",
+        r"(https?://)?(www\.)?(facebook\.com|fb\.watch)/(watch|video\.php|.+/videos|reel)(.+)",
+    ),
+    "tiktok": (
+        r"tiktok\.com",
+        r"(https?://)?(www\.)?(tiktok\.com/(@.+/video|\d+)|vm\.tiktok\.com/([a-zA-Z0-9]+))",
+    ),
+    "instagram": (
+        r"instagram\.com",
+        r"(https?://)?(www\.)?(instagram\.com)/(p|reel|tv)/([^/?#&]+)",
+    ),
+    "soundcloud": (
+        r"soundcloud\.com",
+        r"(https?://)?(www\.)?(soundcloud\.com)/(.+)",
+    ),
+    "reddit": (
+        r"reddit\.com",
+        r"(https?://)?(www\.)?(reddit\.com)/r/([^/]+)/comments/([^/?#&]+)",
+    ),
+}
+
+SERVICES = tuple(SERVICE_PATTERNS)
+
+# Tüm servislerin alan adları tek bir ifadede; eşleşen adlandırılmış grup servisi verir.
+_HOST_REGEX = re.compile(
+    r"(?<![\w.-])(?:[\w-]+\.)*(?:"
+    + "|".join(f"(?P<{service}>{host})" for service, (host, _) in SERVICE_PATTERNS.items())
+    + r")(?![\w-])",
+    re.IGNORECASE,
+)
+_VALID_REGEXES = {service: re.compile(valid) for service, (_, valid) in SERVICE_PATTERNS.items()}
+_UNKNOWN_SERVICE_REGEX = re.compile(r"http")
+
+
+def classify(url):
+    """ URL'nin ait olduğu servisi (alan adına göre) döndürür; tanınmıyorsa None. """
+    match = _HOST_REGEX.search(url)
+    return match.lastgroup if match else None
+
+
+def is_valid(url, service):
+    """ URL bu servis için indirilebilir bir bağlantı biçiminde mi (validate_url kuralları). """
+    return _VALID_REGEXES.get(service, _UNKNOWN_SERVICE_REGEX).search(url) is not None
+
+
+def classify_valid(url):
+    """ URL'yi sınıflandırır ve yalnızca servisin bağlantı kuralına da uyuyorsa servisi döndürür. """
+    service = classify(url)
+    if service and is_valid(url, service):
+        return service
+    return None
+
+
+def classify_many(urls):
+    """ [(url, servis veya None), ...]; toplu yapıştırma / içe aktarma için. """
+    return [(url, classify_valid(url)) for url in urls]
+
+
+
+# servis -> [(yt-dlp extractor anahtarı, video kimliğini 'id' grubunda yakalayan ifade), ...]
+# Anahtarlar yt-dlp'nin indirme arşivindeki 'extractor id' biçimiyle aynıdır.
+_ID_PATTERNS = {
+    "youtube": [
+        ("youtubetab", r"youtube\.com/playlist\?(?:.*&)?list=(?P<id>[\w-]+)"),
+        ("youtube", r"(?:youtube\.com/(?:watch\?(?:.*&)?v=|shorts/|live/|embed/)|youtu\.be/)(?P<id>[\w-]{11})(?![\w-])"),
+    ],
+    "twitter": [
+        ("twitter", r"(?:twitter\.com|x\.com)/[^/]+/status(?:es)?/(?P<id>\d+)"),
+    ],
+    "tiktok": [
+        ("tiktok", r"tiktok\.com/(?:@[^/]+/video/|v/|embed/(?:v2/)?)?(?P<id>\d{6,})"),
+    ],
+    "instagram": [
+        ("instagram", r"instagram\.com/(?:[^/]+/)?(?:p|reels?|tv)/(?P<id>[^/?#&]+)"),
+    ],
+    "reddit": [
+        ("reddit", r"reddit\.com/r/[^/]+/comments/(?P<id>[^/?#&]+)"),
+    ],
+    "facebook": [
+        ("facebook", r"facebook\.com/(?:.*[?&]v=|[^?#]*/videos/(?:[^/?#]+/)?|reel/|watch/\?v=)(?P<id>\d+)"),
+    ],
+}
+_ID_REGEXES = {
+    service: [(extractor, re.compile(pattern, re.IGNORECASE)) for extractor, pattern in patterns]
+    for service, patterns in _ID_PATTERNS.items()
+}
+# Playlist olarak indirilen bağlantılarda (ör. watch?v=..&list=..) anahtar videonun değil listenin kimliğidir.
+_PLAYLIST_REGEXES = {
+    "youtube": ("youtubetab", re.compile(r"[?&]list=(?P<id>[\w-]+)")),
+}
+
+
+def is_playlist_url(url):
+    """ URL bir liste parametresi taşıyor mu (uygulama bu bağlantıların bilgisini playlist olarak alır). """
+    playlist = _PLAYLIST_REGEXES.get(classify(url))
+    return playlist is not None and playlist[1].search(url) is not None
+
+
+def canonical_key(url, playlist=False):
+    """
+    URL'yi ağa çıkmadan (extractor, id) çiftine çevirir; youtu.be / music.youtube.com / x.com gibi
+    farklı yazımlar ve izleme parametreleri aynı anahtarı verir. Çıkarılamıyorsa (kısa bağlantılar,
+    SoundCloud gibi kimliği URL'de olmayan servisler) None döner.
+    watch?v=..&list=.. bağlantıları videoya eşlenir; playlist=True ise (playlist indirmesi) listeye.
+    """
+    service = classify(url)
+    if playlist and service in _PLAYLIST_REGEXES:
+        extractor, regex = _PLAYLIST_REGEXES[service]
+        match = regex.search(url)
+        if match:
+            return extractor, match.group('id')
+    for extractor, regex in _ID_REGEXES.get(service, ()):
+        match = regex.search(url)
+        if match:
+            return extractor, match.group('id')
+    return None
+
+_URL_TOKEN_REGEX = re.compile(r"(?:https?://)?(?:[\w-]+\.)+[a-z]{2,}/[^\s\"',;<>]*", re.IGNORECASE)
+
+
+def extract_urls(text):
+    """
+    Çok satırlı yapıştırma veya CSV içeriğinden URL'leri sırasıyla ve tekrarsız çıkarır.
+    '#' ile başlayan satırlar yorum sayılır.
+    """
+    urls = []
+    seen = set()
+    for line in text.splitlines():
+        if line.lstrip().startswith('#'):
+            continue
+        for url in _URL_TOKEN_REGEX.findall(line):
+            if url not in seen:
+                seen.add(url)
+                urls.append(url)
+    return urls
+
+
+def read_url_file(path):
+    """ .txt (satır başına bir URL) veya .csv (URL içeren herhangi bir hücre) dosyasındaki URL'ler. """
+    with open(path, encoding='utf-8-sig', errors='replace') as f:
+        return extract_urls(f.read())
@@ -1,34 +1,36 @@
+import sys
+
+if __name__ == '__main__' and len(sys.argv) > 1 and sys.argv[1] == "batch":
+    # Arayüzsüz mod: PySide6 hiç yüklenmeden toplu indirme çalıştırılır.
+    from batch_cli import main as batch_main
+    sys.exit(batch_main(sys.argv[2:]))
+
 from PySide6.QtCore import (
     Qt, Signal, Slot, QThread, QPropertyAnimation, QTimer, 
-    QRectF, QRect, QSize, QEasingCurve, QUrl
+    QRectF, QRect, QSize, QEasingCurve, QObject, QEvent
 )
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QLineEdit, QPushButton, QComboBox, QFileDialog, QProgressBar,
     QSplitter, QMessageBox, QDialog, QScrollArea, QGraphicsOpacityEffect,
     QSplashScreen, QGraphicsBlurEffect, QCheckBox, QSpacerItem, QSizePolicy,
-    QGroupBox, QTabWidget, QProgressDialog 
+    QGroupBox, QTabWidget, QProgressDialog, QSpinBox, QPlainTextEdit, QDialogButtonBox
 )
-from PySide6.QtMultimedia import QMediaPlayer, QVideoSink, QVideoFrame
-
 from PySide6.QtGui import (
     QPixmap, QPainter, QLinearGradient, QColor, QFont, 
     QPen, QScreen, QTextDocument, QImage, QIcon
 )
 import os
 import re
-import yt_dlp
 import subprocess
-import requests
-import sys
 import traceback   
-import time
 from modern_style import get_service_theme, SERVICE_COLORS
 import threading
 import unicodedata
 from languages import LANGUAGES
-import shutil
+from collections import deque
 from logger_setup import logger
+import child_processes
 
 from settings_manager import (
     settings_manager, 
@@ -36,18 +38,61 @@ from settings_manager import (
     KEY_LANGUAGE_INDEX, 
     KEY_THEME_MODE, 
     KEY_COOKIE_PATH,
-    KEY_CLIPBOARD_MONITOR
+    KEY_CLIPBOARD_MONITOR,
+    KEY_MAX_CONCURRENT_DOWNLOADS,
+    KEY_PLAYLIST_WORKERS,
+    KEY_KEEP_PARTIAL_FILES,
+    KEY_USE_DOWNLOAD_ARCHIVE,
+    KEY_SHOW_SPLASH
 )
 
-import zipfile
-import io
 if os.name == 'nt':
     import winreg 
     import ctypes 
 
-APP_DATA_PATH = os.path.join(os.getenv('LOCALAPPDATA'), 'VidExtract')
-TARGET_PATH = os.path.join(APP_DATA_PATH, "ffmpeg") 
-TARGET_BIN_PATH = os.path.join(TARGET_PATH, "bin")
+from app_paths import TARGET_PATH, TARGET_BIN_PATH
+from job_journal import JobJournal
+from download_runner import DownloadRunner
+from info_cache import cache_key, get_info_cache
+from download_archive import get_download_archive
+from metadata_cache import get_metadata_cache
+from thumbnail_loader import get_thumbnail_loader
+from fetch_executor import get_fetch_executor
+from ydl_pool import get_ydl_pool
+from clipboard_watcher import get_clipboard_watcher
+from bulk_import import BulkImporter
+import url_classifier
+from tool_locator import get_tool_locator
+from prewarm import prewarm_in_background
+from progress import format_progress, format_eta
+from rate_estimator import queue_eta
+
+# KEY_LANGUAGE_INDEX sırasıyla: "", türkçe, english, español, deutsch, français, italiano, português, русский, عربي, 中文
+LANGUAGE_CODES = ("", "tr", "en", "es", "de", "fr", "it", "pt", "ru", "ar", "zh")
+_language_code_cache = None
+
+
+def _reset_language_code(key, value):
+    global _language_code_cache
+    _language_code_cache = None
+
+settings_manager.subscribe(KEY_LANGUAGE_INDEX, _reset_language_code)
+# Çerez dosyası değişince havuzdaki YoutubeDL örnekleri eski çerezlerle kullanılmasın.
+settings_manager.subscribe(KEY_COOKIE_PATH, lambda key, value: get_ydl_pool().clear())
+
+
+def current_language_code():
+    """ Seçili dilin kodu; yalnızca dil ayarı değiştiğinde yeniden hesaplanır. """
+    global _language_code_cache
+    if _language_code_cache is None:
+        try:
+            code = LANGUAGE_CODES[settings_manager.get_setting(KEY_LANGUAGE_INDEX)]
+        except (IndexError, KeyError, TypeError) as e:
+            logger.warning(f"Dil ayarı okunurken hata: {e}. Varsayılan 'tr' kullanılıyor.")
+            code = ""
+        _language_code_cache = code or "tr"
+    return _language_code_cache
+
 
 def resource_path(relative_path):
     """ PyInstaller tarafından oluşturulan geçici yoldaki varlıklara erişmek için. """
@@ -59,239 +104,352 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
-def get_latest_ffmpeg_url():
+class DownloadThread(QThread):
     """
-    GitHub API'sini kullanarak her zaman en güncel FFmpeg indirme linkini bulur.
-    Eğer API çalışmazsa, yedek olarak kalıcı bir link (Gyan.dev) kullanır.
+    DownloadRunner'ı ayrı bir Qt iş parçacığında çalıştırır ve sonucunu sinyal olarak iletir.
+    İlerleme sinyalle değil, 'runner.progress' üzerinden DownloadQueueManager tarafından sabit aralıkla okunur.
     """
-    try:
-        logger.info("En güncel FFmpeg sürümü GitHub'dan sorgulanıyor...")
-        api_url = "https://api.github.com/repos/BtbN/FFmpeg-Builds/releases/latest"
-        
-        response = requests.get(api_url, timeout=10)
-        
-        if response.status_code == 200:
-            data = response.json()
-
-            for asset in data.get('assets', []):
-                name = asset.get('name', '').lower()
-
-                if "win64-gpl.zip" in name and "shared" not in name:
-                    found_url = asset['browser_download_url']
-                    logger.info(f"Güncel URL bulundu: {found_url}")
-                    return found_url
-                    
-    except Exception as e:
-        logger.warning(f"GitHub API hatası: {e}. Yedek link kullanılıyor.")
-
-    return "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip"
-
-class DownloadThread(QThread):
-    progress_signal = Signal(int, str) 
     finished_signal = Signal(str)      
+    job_info_signal = Signal(str, str)
+    stage_signal = Signal(str)
+    format_ids_signal = Signal(str)
 
     def __init__(self, url, download_folder, quality, video_format, output_format, 
                  download_type_key, language_code, download_subs, sub_langs, 
-                 cookie_file_path): 
+                 cookie_file_path, playlist_workers=3, output_dir=None, keep_partial_files=True,
+                 use_archive=True, job_id=None, service=None, format_ids=None): 
         super().__init__()
+        self.runner = DownloadRunner(
+            url, download_folder, quality, video_format, output_format,
+            download_type_key, language_code, download_subs, sub_langs,
+            cookie_file_path, playlist_workers=playlist_workers, output_dir=output_dir,
+            keep_partial_files=keep_partial_files, use_archive=use_archive,
+            job_info_callback=self.job_info_signal.emit,
+            stage_callback=self.stage_signal.emit,
+            job_id=job_id, service=service,
+            format_ids=format_ids, format_ids_callback=self.format_ids_signal.emit,
+        )
         self.url = url
-        self.download_folder = download_folder
-        self.quality = quality
-        self.video_format = video_format
-        self.output_format = output_format
-        self.download_type_key = download_type_key
-        self.language_code = language_code
-        self.download_subs = download_subs
-        self.sub_langs = sub_langs
-        self.cookie_file_path = cookie_file_path
-    
+        self.keep_partial_files = keep_partial_files
+        self.succeeded = False
+
+    def cancel(self):
+        self.runner.cancel()
+
+    def cleanup_partial_files(self):
+        self.runner.cleanup_partial_files()
+
     def run(self):
-        try:
-            is_playlist = (self.download_type_key == "playlist")
-            
-            audio_string = LANGUAGES[self.language_code]["list_type_audio"]
+        self.succeeded, message = self.runner.run()
+        self.finished_signal.emit(message)
 
-            logger.info(f"İndirme işlemi başlatıldı: {self.url} | Format: {self.video_format}")
-            
-            if is_playlist:
-                try:
-                    with yt_dlp.YoutubeDL({'quiet': True, 'noplaylist': False, 'extract_flat': True}) as ydl_info:
-                        info = ydl_info.extract_info(self.url, download=False)
-                        playlist_title = self.sanitize_filename(info.get('title', 'oynatma_listesi'))
-                except Exception as e:
-                    logger.warning(f"Playlist başlığı alınamadı, varsayılan kullanılıyor. Hata: {e}")
-                    playlist_title = self.sanitize_filename(f"oynatma_listesi_{int(time.time())}")
-                
-                output_path_base = os.path.join(self.download_folder, playlist_title)
-                raw_output_template = os.path.join(output_path_base, '%(playlist_autonumber)s - %(title)s.%(ext)s')
-            else:
-                output_path_base = self.download_folder
-                raw_output_template = os.path.join(output_path_base, '%(title)s.%(ext)s')
 
-            if not os.path.exists(output_path_base):
-                os.makedirs(output_path_base, exist_ok=True)
+class DownloadJob:
+    """ Kuyruktaki tek bir indirme işi. 'options' doğrudan DownloadThread'e aktarılır. """
 
-            postprocessors = []
-            
-            target_format_key = "mp4" 
-            lang_dict = LANGUAGES[self.language_code]
-            for key, value in lang_dict.items():
-                if value == self.output_format:
-                    target_format_key = key
-                    break
-            
-            target_format_ext = target_format_key.lower() 
-
-            if self.video_format == audio_string: 
-                ydl_format_string = "bestaudio/best"
-                postprocessors.append({
-                    'key': 'FFmpegExtractAudio',
-                    'preferredcodec': target_format_ext,
-                    'preferredquality': '192', 
-                })
-                if target_format_ext == 'mp3':
-                    postprocessors[0]['preferredquality'] = '320'
-                elif target_format_ext == 'm4a':
-                    postprocessors[0]['preferredquality'] = '256'
-
-            else: 
-                if self.quality == "best": 
-                    ydl_format_string = "bestvideo+bestaudio/best"
-                else: 
-                    ydl_format_string = self.get_yt_dlp_format(self.quality, self.video_format)
-                
-                postprocessors.append({
-                    'key': 'FFmpegVideoRemuxer',
-                    'preferedformat': target_format_ext,
-                })
-
-            ffmpeg_path = None 
-
-            if hasattr(sys, '_MEIPASS'):
-                meipass_ffmpeg_path = os.path.join(sys._MEIPASS, 'ffmpeg', 'bin')
-                if os.path.exists(os.path.join(meipass_ffmpeg_path, "ffmpeg.exe")):
-                    ffmpeg_path = meipass_ffmpeg_path
-                    logger.info(f"FFmpeg (MEIPASS) yolu tespit edildi: {ffmpeg_path}")
-            
-            if not ffmpeg_path and os.path.exists(os.path.join(TARGET_BIN_PATH, "ffmpeg.exe")):
-                ffmpeg_path = TARGET_BIN_PATH
-                logger.info(f"FFmpeg (AppData) kullanılıyor: {ffmpeg_path}")
-
-            if not ffmpeg_path and shutil.which("ffmpeg"):
-                logger.info("FFmpeg (Sistem PATH) kullanılacak.")
-                ffmpeg_path = None
-                 
-            ydl_opts = {
-                'format': ydl_format_string,
-                'outtmpl': raw_output_template,
-                'quiet': False,
-                'progress_hooks': [self._progress_hook],
-                'postprocessors': postprocessors,
-                'noplaylist': not is_playlist,
-                'nooverwrites': False,
-                'ffmpeg_location': ffmpeg_path,
-                'ignoreerrors': is_playlist, 
-            }
-            
-            if self.cookie_file_path and os.path.exists(self.cookie_file_path):
-                print(f"Kullanılan çerez dosyası: {self.cookie_file_path}")
-                ydl_opts['cookiefile'] = self.cookie_file_path
+    def __init__(self, job_id, service, options):
+        self.job_id = job_id
+        self.service = service
+        self.options = options
+        self.state = "queued"
+        self.thread = None
 
-            if self.download_subs and self.video_format != audio_string: 
-                lang_list = [lang.strip() for lang in self.sub_langs.split(',')] if self.sub_langs else ['en', 'tr'] 
-                
-                ydl_opts['writesubtitles'] = True
-                ydl_opts['subtitleslangs'] = lang_list
-                ydl_opts['writeautomaticsub'] = True 
-                ydl_opts['embedsubtitles'] = True 
-            
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([self.url]) 
 
-            success_message = f"✅ İndirme tamamlandı!\nDosyalar '{output_path_base}' klasörüne kaydedildi."
-            self.finished_signal.emit(success_message)
+class DownloadQueueManager(QObject):
+    """
+    Tüm servis pencereleri tarafından paylaşılan indirme kuyruğu.
+    Aynı anda en fazla 'max_workers' adet işi indirir, geri kalan işleri sırada bekletir.
+    Dönüştürme aşamasına geçen iş slotunu bırakır; böylece bir iş dönüştürülürken sıradaki indirilebilir.
+    İşler JobJournal'a yazılır; uygulama kapanır veya çökerse yarım kalan işler resume_unfinished() ile devam eder.
+    """
+    job_started_signal = Signal(int)
+    jobs_progress_signal = Signal(object)   # {job_id (int): ilerleme anlık görüntüsü}; int anahtarlı dict Signal(dict) ile aktarılamaz
+    queue_progress_signal = Signal(dict)
+    job_finished_signal = Signal(int, str)
+    queue_changed_signal = Signal()
+
+    CANCEL_TIMEOUT_MS = 10000
+    PROGRESS_INTERVAL_MS = 100
+
+    def __init__(self, max_workers=None, parent=None):
+        super().__init__(parent)
+        if max_workers is None:
+            max_workers = settings_manager.get_setting(KEY_MAX_CONCURRENT_DOWNLOADS)
+        self.max_workers = max(1, int(max_workers))
+        self.jobs = {}
+        self.pending = deque()
+        self.active = {}
+        self._next_job_id = 1
+        self.latest_progress = {}
+        self.finished_job_bytes = deque(maxlen=50)
+        self.detached_threads = set()
+
+        self.progress_timer = QTimer(self)
+        self.progress_timer.setInterval(self.PROGRESS_INTERVAL_MS)
+        self.progress_timer.timeout.connect(self._poll_progress)
 
+        try:
+            self.journal = JobJournal()
         except Exception as e:
-            error_message = f"Hata oluştu: {str(e)}\n{traceback.format_exc()}"
-            self.finished_signal.emit(error_message)
+            logger.warning(f"İş kaydı (journal) açılamadı, işler kalıcı olarak saklanmayacak: {e}")
+            self.journal = None
+
+    DEDUPE_OPTIONS = ('download_type_key', 'video_format', 'output_format', 'quality', 'download_folder')
+
+    def _dedupe_key(self, options):
+        url_key = cache_key(options.get('url', ''), playlist=options.get('download_type_key') == "playlist")
+        return (url_key,) + tuple(options.get(name) for name in self.DEDUPE_OPTIONS)
+
+    def find_duplicate(self, options):
+        """ Aynı video aynı seçeneklerle zaten sıradaysa veya indiriliyorsa o işin numarası, değilse None. """
+        key = self._dedupe_key(options)
+        for job in list(self.pending) + list(self.active.values()):
+            if self._dedupe_key(job.options) == key:
+                return job.job_id
+        return None
+
+    def submit(self, service, options):
+        duplicate_id = self.find_duplicate(options)
+        if duplicate_id is not None:
+            logger.info(f"Aynı video zaten kuyrukta (#{duplicate_id}), yeniden eklenmedi: {options.get('url')}")
+            return duplicate_id
+        if self.journal:
+            job_id = self.journal.add_job(service, options)
+        else:
+            job_id = self._next_job_id
+            self._next_job_id += 1
+        return self._enqueue(DownloadJob(job_id, service, options))
+
+    def resume_unfinished(self):
+        """ Önceki oturumdan 'queued'/'running'/'postprocessing' durumunda kalan işleri .part dosyalarından devam ettirmek üzere kuyruğa alır. """
+        if not self.journal:
+            return []
+
+        interrupted = self.journal.cancel_interrupted()
+        if interrupted:
+            logger.info(f"İptal edilirken yarım kalan {interrupted} iş iptal edildi olarak işaretlendi.")
+        purged = self.journal.purge_finished()
+        if purged:
+            logger.info(f"İş günlüğünden {purged} eski kayıt silindi.")
+
+        resumed = []
+        for record in self.journal.unfinished_jobs():
+            if record['id'] in self.jobs:
+                continue
+            options = dict(record['options'])
+            if record.get('output_path') and options.get('download_type_key') == "playlist":
+                options['output_dir'] = record['output_path']
+            if record.get('format_ids') and options.get('download_type_key') != "playlist":
+                options['format_ids'] = record['format_ids']
+            self.journal.set_state(record['id'], "queued")
+            resumed.append(self._enqueue(DownloadJob(record['id'], record['service'], options)))
+
+        if resumed:
+            logger.info(f"Önceki oturumdan {len(resumed)} yarım kalan iş devam ettiriliyor.")
+        return resumed
+
+    def _enqueue(self, job):
+        self.jobs[job.job_id] = job
+        self.pending.append(job)
+        logger.info(f"Kuyruğa iş eklendi #{job.job_id}: {job.options.get('url')}")
+        self.queue_changed_signal.emit()
+        self._start_next()
+        return job.job_id
+
+    def _set_job_state(self, job, state, error=None):
+        job.state = state
+        if self.journal:
+            try:
+                self.journal.set_state(job.job_id, state, error)
+            except Exception as e:
+                logger.warning(f"İş #{job.job_id} durumu kaydedilemedi: {e}")
 
-    def sanitize_filename(self,filename, max_length=100):
-        filename = unicodedata.normalize('NFKD', filename).encode('ASCII', 'ignore').decode('utf-8')
-        filename = re.sub(r'[\\/*?:"<>|]', '', filename)
-        filename = re.sub(r'[^a-zA-Z0-9\s\-_#\.]', '', filename)
-        filename = re.sub(r'[\s]+', ' ', filename)  
-        filename = re.sub(r'[_\-]+', '_', filename) 
-        filename = filename.strip()
-        if len(filename) > max_length:
-            filename = filename[:max_length].rsplit(' ', 1)[0]  
-        return filename
-    
-    def get_yt_dlp_format(self, quality, video_format):
-        height = re.search(r'^\d+', quality)
-        if height:
-            height_str = height.group(0)
-            return f"bestvideo[height<={height_str}]+bestaudio/best[height<={height_str}]"
+    def cancel(self, job_id):
+        job = self.jobs.get(job_id)
+        if job is None or job.state not in ("queued", "running", "postprocessing"):
+            return False
+
+        if job.state == "queued":
+            try:
+                self.pending.remove(job)
+            except ValueError:
+                pass
+        elif job.thread is not None and job.thread.isRunning():
+            self._set_job_state(job, "canceling")
+            job.thread.cancel()
+            QTimer.singleShot(self.CANCEL_TIMEOUT_MS, lambda: self._force_stop(job))
+            logger.info(f"İş #{job_id} için iptal istendi.")
+            return True
+
+        self._set_job_state(job, "canceled")
+        logger.info(f"İş #{job_id} iptal edildi.")
+        self.queue_changed_signal.emit()
+        self._start_next()
+        return True
+
+    def _force_stop(self, job):
+        """
+        İş süre sınırı içinde kendiliğinden durmadıysa: alt süreçleri öldürülür, iş iptal edildi sayılır ve slotu
+        serbest bırakılır. İş parçacığı sonlandırılmaz (yt-dlp kilit / dosya tutarken öldürülmesi güvenli değildir);
+        kuyruktan ayrılır ve bir sonraki iptal denetiminde kendi kendine biter.
+        """
+        if job.state != "canceling" or job.thread is None or not job.thread.isRunning():
+            return
+        logger.warning(f"İş #{job.job_id} {self.CANCEL_TIMEOUT_MS} ms içinde durmadı, kuyruktan ayrılıyor.")
+        thread = job.thread
+        child_processes.kill_owner(thread.runner)
+        thread.finished_signal.disconnect(self._on_thread_finished)
+        thread.job_info_signal.disconnect(self._on_thread_job_info)
+        thread.stage_signal.disconnect(self._on_thread_stage)
+        thread.format_ids_signal.disconnect(self._on_thread_format_ids)
+        self.detached_threads.add(thread)
+        thread.finished.connect(self._on_detached_thread_exit)
+
+        self.active.pop(job.job_id, None)
+        self.latest_progress.pop(job.job_id, None)
+        job.thread = None
+        self._set_job_state(job, "canceled")
+        self.queue_changed_signal.emit()
+        self._start_next()
+
+    @Slot()
+    def _on_detached_thread_exit(self):
+        thread = self.sender()
+        if thread not in self.detached_threads:
+            return
+        self.detached_threads.discard(thread)
+        logger.info(f"Kuyruktan ayrılan iş parçacığı sona erdi: {thread.url}")
+        if not thread.keep_partial_files:
+            thread.cleanup_partial_files()
+        thread.deleteLater()
+
+    def set_max_workers(self, max_workers):
+        self.max_workers = max(1, int(max_workers))
+        self._start_next()
+
+    def active_count(self):
+        return len(self.active)
+
+    def downloading_count(self):
+        return sum(1 for job in self.active.values() if job.state != "postprocessing")
+
+    def pending_count(self):
+        return len(self.pending)
+
+    def _start_next(self):
+        while self.pending and self.downloading_count() < self.max_workers:
+            job = self.pending.popleft()
+            thread = DownloadThread(job_id=job.job_id, service=job.service, **job.options)
+            thread.finished_signal.connect(self._on_thread_finished)
+            thread.job_info_signal.connect(self._on_thread_job_info)
+            thread.stage_signal.connect(self._on_thread_stage)
+            thread.format_ids_signal.connect(self._on_thread_format_ids)
+            job.thread = thread
+            self._set_job_state(job, "running")
+            self.active[job.job_id] = job
+            thread.start()
+            logger.info(f"İş #{job.job_id} başlatıldı ({self.downloading_count()}/{self.max_workers} slot).")
+            self.job_started_signal.emit(job.job_id)
+        if self.active and not self.progress_timer.isActive():
+            self.progress_timer.start()
+        elif not self.active:
+            self.progress_timer.stop()
+        self.queue_changed_signal.emit()
+
+    def _job_for_thread(self, thread):
+        for job in self.active.values():
+            if job.thread is thread:
+                return job
+        return None
+
+    @Slot()
+    def _poll_progress(self):
+        """ Aktif işlerin değişen ilerleme durumlarını toplar ve tek bir sinyalle (~10 Hz) yayınlar. """
+        changed = {}
+        for job_id, job in self.active.items():
+            if job.thread is None:
+                continue
+            snapshot = job.thread.runner.progress.poll()
+            if snapshot is not None:
+                changed[job_id] = snapshot
+                self.latest_progress[job_id] = snapshot
+        if changed:
+            self.jobs_progress_signal.emit(changed)
+            self.queue_progress_signal.emit(self.queue_estimate())
+
+    def queue_estimate(self):
+        """ Aktif işlerin yumuşatılmış hızlarından tüm kuyruk için toplam hız ve kalan süre tahmini. """
+        job_totals = [
+            (snapshot.get('job_downloaded_bytes') or 0, snapshot.get('job_total_bytes') or 0, snapshot.get('speed') or 0)
+            for job_id, snapshot in self.latest_progress.items() if job_id in self.active
+        ]
+        average_job_bytes = (
+            sum(self.finished_job_bytes) / len(self.finished_job_bytes) if self.finished_job_bytes else None
+        )
+        return {
+            'active': len(self.active),
+            'pending': len(self.pending),
+            'speed': sum(speed for _, _, speed in job_totals),
+            'eta': queue_eta(job_totals, len(self.pending), average_job_bytes),
+        }
+
+    @Slot(str, str)
+    def _on_thread_job_info(self, format_string, output_path):
+        job = self._job_for_thread(self.sender())
+        if job is not None and self.journal:
+            try:
+                self.journal.update_job(job.job_id, format=format_string, output_path=output_path)
+            except Exception as e:
+                logger.warning(f"İş #{job.job_id} bilgileri kaydedilemedi: {e}")
+
+    @Slot(str)
+    def _on_thread_format_ids(self, format_ids):
+        job = self._job_for_thread(self.sender())
+        if job is not None and self.journal:
+            try:
+                self.journal.update_job(job.job_id, format_ids=format_ids)
+            except Exception as e:
+                logger.warning(f"İş #{job.job_id} format kimlikleri kaydedilemedi: {e}")
+
+    @Slot(str)
+    def _on_thread_stage(self, stage):
+        job = self._job_for_thread(self.sender())
+        if job is None or job.state != "running":
+            return
+        if stage == "postprocessing":
+            self._set_job_state(job, "postprocessing")
+            logger.info(f"İş #{job.job_id} dönüştürme aşamasında, indirme slotu serbest bırakıldı.")
+            self._start_next()
+
+    @Slot(str)
+    def _on_thread_finished(self, message):
+        job = self._job_for_thread(self.sender())
+        if job is None:
+            return
+        self.active.pop(job.job_id, None)
+        snapshot = self.latest_progress.pop(job.job_id, None)
+        if job.thread.succeeded and snapshot and snapshot.get('job_total_bytes'):
+            self.finished_job_bytes.append(snapshot['job_total_bytes'])
+        if job.state == "canceling":
+            self._set_job_state(job, "canceled")
+        elif job.thread.succeeded:
+            self._set_job_state(job, "finished")
         else:
-            return "bestvideo[height<=720]+bestaudio/best[height<=720]"
-    
-    def _progress_hook(self, d):
-        try:
-            if d.get('status') == 'downloading':
-                total_size = d.get('total_bytes') or d.get('total_bytes_estimate', 0)
-                downloaded_size = d.get('downloaded_bytes', 0)
-                speed = d.get('speed', 0)  
-                eta = d.get('eta', 0)  
-
-                playlist_index = d.get('info_dict', {}).get('playlist_autonumber')
-                n_entries = d.get('info_dict', {}).get('n_entries')
-                
-                playlist_prefix = ""
-                if playlist_index and n_entries:
-                    playlist_prefix = f"**[Video {playlist_index}/{n_entries}]**\n"
-
-                if total_size > 0:
-                    percent = int(downloaded_size / total_size * 100)
-                    downloaded_mb = downloaded_size / 1024 / 1024
-                    total_mb = total_size / 1024 / 1024
-
-                    if speed >= 1_048_576: 
-                        speed_str = f"{speed / 1_048_576:.2f} MB/s"
-                    elif speed >= 1024: 
-                        speed_str = f"{speed / 1024:.2f} KB/s"
-                    else:
-                        speed_str = f"{speed:.2f} B/s"
-
-                    if eta > 60:
-                        eta_str = f"{eta // 60}m {eta % 60}s"
-                    else:
-                        eta_str = f"{eta}s"
-
-                    progress_message = (
-                        f"{playlist_prefix}📥 İndirme devam ediyor: **{percent}% tamamlandı**\n"
-                        f"🔹 {downloaded_mb:.2f} MB / {total_mb:.2f} MB\n"
-                        f"🚀 Hız: {speed_str} | ⏳ Kalan süre: {eta_str}"
-                    )
-                    self.progress_signal.emit(percent, progress_message)
-                else:
-                    self.progress_signal.emit(0, f"{playlist_prefix}⏳ İndirme başlatılıyor... Lütfen bekleyin.")
+            self._set_job_state(job, "failed", message)
+        job.thread.wait()
+        job.thread.deleteLater()
+        job.thread = None
+        self.job_finished_signal.emit(job.job_id, message)
+        self._start_next()
 
-            elif d.get('status') == 'finished':
-                playlist_index = d.get('info_dict', {}).get('playlist_autonumber')
-                if not playlist_index:
-                    self.progress_signal.emit(100, "✅ **İndirme tamamlandı!**")
-                else:
-                    self.progress_signal.emit(100, f"✅ **[Video {d['info_dict']['playlist_autonumber']}]** tamamlandı!")
 
-            elif d.get('status') == 'error':
-                error_message = d.get('error', 'Bilinmeyen hata')
-                if isinstance(error_message, dict):
-                    error_message = f"⚠️ Hata: {error_message.get('code', 'Bilinmeyen kod')}, {error_message.get('message', 'Açıklama bulunamadı.')}"
-                self.progress_signal.emit(0, error_message)
+_download_queue = None
 
-        except KeyError as e:
-            self.progress_signal.emit(0, f"⚠️ Eksik veri hatası: {str(e)}")
-        except Exception as e:
-            self.progress_signal.emit(0, f" {str(e)}")
+def get_download_queue():
+    global _download_queue
+    if _download_queue is None:
+        _download_queue = DownloadQueueManager()
+    return _download_queue
 
 
 class UpdateThread(QThread):
@@ -337,49 +495,18 @@ class FFmpegDownloadThread(QThread):
     progress_signal = Signal(int, str) 
     finished_signal = Signal(bool, str) 
 
+    def __init__(self):
+        super().__init__()
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        """ İndirme / ayıklama bir sonraki parçada durur; yarım dosya kurulum klasörüne yazılmaz. """
+        self._cancel_event.set()
+
     def run(self):
+        from ffmpeg_installer import install_ffmpeg, InstallCancelled
         try:
-          
-            self.progress_signal.emit(0, "Güncel sürüm aranıyor...")
-            
-            current_ffmpeg_url = get_latest_ffmpeg_url()
-            
-            self.progress_signal.emit(5, "İndirme başlatılıyor...")
-            
-            response = requests.get(current_ffmpeg_url, stream=True)
-            response.raise_for_status()
-            
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded_size = 0
-            chunk_size = 8192
-            
-            zip_data = io.BytesIO()
-            
-            for data in response.iter_content(chunk_size=chunk_size):
-                zip_data.write(data)
-                downloaded_size += len(data)
-                if total_size > 0:
-                    percent = int(downloaded_size / total_size * 100)
-                    self.progress_signal.emit(percent, f"İndiriliyor... {downloaded_size / 1024 / 1024:.1f}MB / {total_size / 1024 / 1024:.1f}MB")
-            
-            self.progress_signal.emit(100, "Ayıklanıyor...")
-            
-            if os.path.exists(TARGET_BIN_PATH):
-                try:
-                    shutil.rmtree(TARGET_PATH, ignore_errors=True)
-                except Exception as e:
-                    print(f"Eski FFmpeg klasörü silinemedi, devam ediliyor: {e}")
-                    
-            os.makedirs(TARGET_BIN_PATH) 
-
-            with zipfile.ZipFile(zip_data) as z:
-                for file_info in z.infolist():
-                    parts = file_info.filename.split('/')
-                    if len(parts) > 1 and parts[-2] == 'bin' and parts[-1] != '':
-                        filename = parts[-1]
-                        target_file_path = os.path.join(TARGET_BIN_PATH, filename)
-                        with open(target_file_path, 'wb') as f:
-                            f.write(z.read(file_info.filename))
+            install_ffmpeg(self.progress_signal.emit, self._cancel_event)
             
             self.progress_signal.emit(100, "PATH ayarlanıyor...")
             
@@ -388,6 +515,8 @@ class FFmpegDownloadThread(QThread):
             
             self.finished_signal.emit(True, f"FFmpeg başarıyla {TARGET_BIN_PATH} konumuna kuruldu ve PATH'e eklendi.")
 
+        except InstallCancelled as e:
+            self.finished_signal.emit(False, str(e))
         except PermissionError:
             self.finished_signal.emit(False, f"İzin Hatası! '{TARGET_PATH}' dizinine yazılamıyor. Başka bir programın dosyaları kilitlemediğinden emin olun.")
         except Exception as e:
@@ -482,6 +611,15 @@ class SettingsDialog(QDialog):
         self.update_button.clicked.connect(self.apply_update_check)
         gen_layout.addWidget(self.update_button, alignment=Qt.AlignCenter)
         
+        gen_layout.addSpacerItem(QSpacerItem(20, 20, QSizePolicy.Minimum, QSizePolicy.Fixed))
+
+        self.show_splash_checkbox = QCheckBox()
+        self.show_splash_checkbox.setChecked(settings_manager.get_setting(KEY_SHOW_SPLASH))
+        self.show_splash_checkbox.toggled.connect(
+            lambda checked: settings_manager.save_setting(KEY_SHOW_SPLASH, checked)
+        )
+        gen_layout.addWidget(self.show_splash_checkbox)
+
         gen_layout.addStretch()
 
         self.advanced_tab = QWidget()
@@ -527,6 +665,47 @@ class SettingsDialog(QDialog):
         ffmpeg_group_layout.addWidget(self.ffmpeg_tooltip_label)
         
         adv_layout.addWidget(self.ffmpeg_group)
+
+        self.queue_group = QGroupBox()
+        queue_group_layout = QHBoxLayout(self.queue_group)
+
+        self.max_downloads_label = QLabel()
+        queue_group_layout.addWidget(self.max_downloads_label)
+
+        self.max_downloads_spin = QSpinBox()
+        self.max_downloads_spin.setRange(1, 8)
+        self.max_downloads_spin.setValue(settings_manager.get_setting(KEY_MAX_CONCURRENT_DOWNLOADS))
+        self.max_downloads_spin.valueChanged.connect(self.save_max_downloads)
+        queue_group_layout.addWidget(self.max_downloads_spin)
+        queue_group_layout.addSpacing(20)
+
+        self.playlist_workers_label = QLabel()
+        queue_group_layout.addWidget(self.playlist_workers_label)
+
+        self.playlist_workers_spin = QSpinBox()
+        self.playlist_workers_spin.setRange(1, 8)
+        self.playlist_workers_spin.setValue(settings_manager.get_setting(KEY_PLAYLIST_WORKERS))
+        self.playlist_workers_spin.valueChanged.connect(
+            lambda value: settings_manager.save_setting(KEY_PLAYLIST_WORKERS, value)
+        )
+        queue_group_layout.addWidget(self.playlist_workers_spin)
+        queue_group_layout.addStretch()
+
+        adv_layout.addWidget(self.queue_group)
+
+        self.keep_partial_checkbox = QCheckBox()
+        self.keep_partial_checkbox.setChecked(settings_manager.get_setting(KEY_KEEP_PARTIAL_FILES))
+        self.keep_partial_checkbox.toggled.connect(
+            lambda checked: settings_manager.save_setting(KEY_KEEP_PARTIAL_FILES, checked)
+        )
+        adv_layout.addWidget(self.keep_partial_checkbox)
+
+        self.use_archive_checkbox = QCheckBox()
+        self.use_archive_checkbox.setChecked(settings_manager.get_setting(KEY_USE_DOWNLOAD_ARCHIVE))
+        self.use_archive_checkbox.toggled.connect(
+            lambda checked: settings_manager.save_setting(KEY_USE_DOWNLOAD_ARCHIVE, checked)
+        )
+        adv_layout.addWidget(self.use_archive_checkbox)
         
         adv_layout.addStretch()
 
@@ -549,9 +728,7 @@ class SettingsDialog(QDialog):
         self.parent_app.trigger_ffmpeg_installation()
         
     def check_ffmpeg_status(self):
-        found = False
-        if shutil.which("ffmpeg") or os.path.exists(os.path.join(TARGET_BIN_PATH, "ffmpeg.exe")):
-            found = True
+        found = get_tool_locator().is_available()
         
         lang_code = self.parent_app.get_current_language_code()
         lang = LANGUAGES.get(lang_code, LANGUAGES["en"])
@@ -579,10 +756,16 @@ class SettingsDialog(QDialog):
         self.lang_label.setText(lang.get("language", "Language Selection") + ":")
         self.theme_button.setText(lang.get("theme", "Change Theme"))
         self.update_button.setText(lang.get("update_button", "Check for Updates"))
+        self.show_splash_checkbox.setText(lang.get("settings_show_splash", "Show the intro animation at startup"))
         
         self.cookie_group.setTitle(lang.get("settings_group_cookie", "Cookies"))
         self.cookie_label.setText(lang.get("settings_cookie_label", "Cookies File Path (.txt):"))
         self.ffmpeg_group.setTitle(lang.get("settings_group_ffmpeg", "FFmpeg Installation"))
+        self.queue_group.setTitle(lang.get("settings_group_queue", "Download Queue"))
+        self.max_downloads_label.setText(lang.get("settings_max_downloads_label", "Concurrent downloads:"))
+        self.playlist_workers_label.setText(lang.get("settings_playlist_workers_label", "Parallel playlist videos:"))
+        self.keep_partial_checkbox.setText(lang.get("settings_keep_partial_files", "Keep partial files on cancel (resumable)"))
+        self.use_archive_checkbox.setText(lang.get("settings_use_download_archive", "Skip videos that were already downloaded"))
         self.check_ffmpeg_status() 
 
         self.close_button.setText(lang.get("settings_close_button", "Close"))
@@ -620,6 +803,10 @@ class SettingsDialog(QDialog):
         except Exception as e:
             logger.warning(f"Ayarlar diyaloğu yüklenirken hata: {e}")
 
+    def save_max_downloads(self, value):
+        settings_manager.save_setting(KEY_MAX_CONCURRENT_DOWNLOADS, value)
+        get_download_queue().set_max_workers(value)
+
     def save_cookie_path(self):
         try:
             settings_manager.save_setting(KEY_COOKIE_PATH, self.cookie_entry.text())
@@ -628,6 +815,46 @@ class SettingsDialog(QDialog):
         except Exception as e:
             logger.warning(f"Çerez yolu kaydedilirken hata: {e}")
 
+class BulkUrlDialog(QDialog):
+    """ Çok satırlı URL yapıştırma veya .txt / .csv dosyasından içe aktarma penceresi. """
+
+    def __init__(self, lang, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(lang.get("bulk_dialog_title", "Bulk Add URLs"))
+        self.resize(560, 380)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel(lang.get("bulk_dialog_hint", "Paste one URL per line, or import a .txt / .csv file."), self))
+
+        self.text_edit = QPlainTextEdit(self)
+        layout.addWidget(self.text_edit)
+
+        button_layout = QHBoxLayout()
+        self.import_button = QPushButton(lang.get("bulk_import_file", "Import from File..."), self)
+        self.import_button.clicked.connect(self.import_file)
+        button_layout.addWidget(self.import_button)
+        button_layout.addStretch()
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel, self)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        button_layout.addWidget(buttons)
+        layout.addLayout(button_layout)
+
+    def import_file(self):
+        path, _ = QFileDialog.getOpenFileName(self, "URL Listesi Seç", "", "URL Listesi (*.txt *.csv);;Tüm Dosyalar (*)")
+        if not path:
+            return
+        try:
+            urls = url_classifier.read_url_file(path)
+        except OSError as e:
+            QMessageBox.warning(self, "Hata", f"Dosya okunamadı: {e}")
+            return
+        existing = self.text_edit.toPlainText().strip()
+        self.text_edit.setPlainText("\n".join(([existing] if existing else []) + urls))
+
+    def urls(self):
+        return url_classifier.extract_urls(self.text_edit.toPlainText())
+
 class ServiceSelectionScreen(QWidget):
     def __init__(self):
         super().__init__()
@@ -644,6 +871,19 @@ class ServiceSelectionScreen(QWidget):
         self.setWindowOpacity(0.0)
         self.resize(430, 330)
         QTimer.singleShot(100, self.start_combined_appearance_animation)
+        QTimer.singleShot(600, self.resume_unfinished_downloads)
+        # Ekran göründükten sonra yt_dlp / requests arka planda yüklenir; açılışı bekletmez.
+        QTimer.singleShot(800, prewarm_in_background)
+
+    def resume_unfinished_downloads(self):
+        try:
+            resumed = get_download_queue().resume_unfinished()
+        except Exception as e:
+            logger.warning(f"Yarım kalan indirmeler devam ettirilemedi: {e}")
+            return
+        if resumed:
+            QMessageBox.information(self, "VidExtract",
+                f"Önceki oturumdan yarım kalan {len(resumed)} indirme kaldığı yerden devam ettiriliyor.")
 
     def initUI(self):
         main_layout = QVBoxLayout(self)
@@ -701,12 +941,22 @@ class ServiceSelectionScreen(QWidget):
         self.instagram_button.clicked.connect(lambda: self.launch_service("instagram"))
         self.soundcloud_button.clicked.connect(lambda: self.launch_service("soundcloud"))
         self.reddit_button.clicked.connect(lambda: self.launch_service("reddit")) 
+        get_clipboard_watcher().unrouted_url.connect(self.on_unrouted_clipboard_url)
 
     def launch_service(self, service_name):
         self.main_app_window = DownloaderApp(service=service_name, parent_selection_screen=self)
         self.main_app_window.start_combined_appearance_animation()
         self.hide()
 
+    @Slot(str, str)
+    def on_unrouted_clipboard_url(self, service, url):
+        """ Kopyalanan URL'nin servisine ait pencere yokken seçim ekranı açıksa o servis açılır ve URL ona verilir. """
+        if not self.isVisible() or not settings_manager.get_setting(KEY_CLIPBOARD_MONITOR):
+            return
+        logger.info(f"Pano takibi: {service} penceresi açılıyor.")
+        self.launch_service(service)
+        self.main_app_window.handle_clipboard_url(url)
+
     def start_combined_appearance_animation(self):
         self.show()
         fade_anim = QPropertyAnimation(self, b"windowOpacity")
@@ -727,6 +977,7 @@ class ServiceSelectionScreen(QWidget):
 
 class DownloaderApp(QWidget):
     video_info_signal = Signal(dict)
+    BULK_SUMMARY_MAX_FAILURES = 10
 
     def __init__(self, service="youtube", parent_selection_screen=None):
         super().__init__()
@@ -736,6 +987,13 @@ class DownloaderApp(QWidget):
         self.info_panel_animation = None
         self.is_dark_mode = True 
         self.cookie_file_path = ""
+        self.download_queue = get_download_queue()
+        self.my_jobs = set()
+        self.queue_eta = None
+        self.bulk_importer = None
+        self.bulk_jobs = {}
+        self.bulk_completed = 0
+        self.bulk_failures = []
 
         self.setWindowIcon(QIcon(resource_path("assets/app_icon.ico")))
         
@@ -804,7 +1062,23 @@ class DownloaderApp(QWidget):
         self.resize(780, 580)
         
         self.setAttribute(Qt.WA_DeleteOnClose)
-        QApplication.clipboard().dataChanged.connect(self.check_clipboard)
+        get_clipboard_watcher().register(self)
+
+        self.download_queue.jobs_progress_signal.connect(self.update_jobs_progress)
+        self.download_queue.queue_progress_signal.connect(self.update_queue_estimate)
+        self.download_queue.job_finished_signal.connect(self.job_finished)
+        self.adopt_service_jobs()
+
+    def adopt_service_jobs(self):
+        """ Bu servise ait, hâlâ süren işleri (ör. önceki oturumdan devam ettirilenler) pencereye bağlar. """
+        for job in self.download_queue.jobs.values():
+            if job.service == self.service and job.state in ("queued", "running", "postprocessing"):
+                self.my_jobs.add(job.job_id)
+        if self.my_jobs:
+            self.show_cancel_button()
+            self.progress_bar.setFormat(self.queue_status_text())
+            self.info_panel.setVisible(True)
+            self.info_panel_opacity.setOpacity(1.0)
 
     def initUI(self):
         layout = QVBoxLayout()
@@ -853,6 +1127,9 @@ class DownloaderApp(QWidget):
         self.url_entry.editingFinished.connect(self.validate_url)
         url_layout.addWidget(self.validate_button)
         self.validate_button.setVisible(False)
+        self.bulk_button = QPushButton("", self)
+        self.bulk_button.clicked.connect(self.show_bulk_dialog)
+        url_layout.addWidget(self.bulk_button)
         input_group_layout.addLayout(url_layout)
         self.clipboard_checkbox = QCheckBox("Panoyu İzle", self)
         self.clipboard_checkbox.setChecked(True)
@@ -987,43 +1264,27 @@ class DownloaderApp(QWidget):
         self.list_type_combo.currentIndexChanged.connect(self.toggle_quality)
         
         self.video_info_signal.connect(self.show_video_info)
+
+        self.current_thumbnail_url = None
+        self.thumbnail_loader = get_thumbnail_loader()
+        self.thumbnail_loader.thumbnail_ready.connect(self.on_thumbnail_ready)
+        self.thumbnail_loader.thumbnail_failed.connect(self.on_thumbnail_failed)
     
-    @Slot()
-    def check_clipboard(self):
+    def handle_clipboard_url(self, url):
+        """ ClipboardWatcher bu servise ait bir URL gördüğünde çağırır; URL kabul edildiyse True döner. """
         if not hasattr(self, 'clipboard_checkbox') or not self.clipboard_checkbox.isChecked():
-            return
-        
-        clipboard_text = QApplication.clipboard().text().strip()
-        
-        if not clipboard_text:
-            return
+            return False
 
-        if clipboard_text == self.url_entry.text().strip():
-            return
+        if url == self.url_entry.text().strip():
+            return False
 
-        regex = ""
-        if self.service == "youtube":
-            regex = r"(https?://)?(www\.)?(youtube\.com|youtu\.be|music\.youtube\.com)"
-        elif self.service == "twitter":
-            regex = r"(twitter\.com|x\.com)"
-        elif self.service == "facebook":
-            regex = r"(facebook\.com|fb\.watch)"
-        elif self.service == "instagram":
-            regex = r"(instagram\.com)"
-        elif self.service == "tiktok":
-            regex = r"(tiktok\.com)"
-        elif self.service == "soundcloud":
-            regex = r"(soundcloud\.com)"
-        elif self.service == "reddit":
-             regex = r"(reddit\.com)"
-
-        if regex and re.search(regex, clipboard_text):
-            logger.info(f"Pano takibi: Uygun URL tespit edildi -> {clipboard_text}")
-            self.url_entry.setText(clipboard_text)
-            self.validate_url() 
-            
-            self.activateWindow() 
-            self.raise_()
+        logger.info(f"Pano takibi: Uygun URL tespit edildi -> {url}")
+        self.url_entry.setText(url)
+        self.validate_url() 
+        
+        self.activateWindow() 
+        self.raise_()
+        return True
 
     @Slot()
     def go_back_to_selection(self):
@@ -1058,24 +1319,14 @@ class DownloaderApp(QWidget):
 
     def closeEvent(self, event):
         self.save_settings()
+        get_fetch_executor().cancel(self)
+        get_clipboard_watcher().unregister(self)
+        self.stop_bulk_import()
         super().closeEvent(event)
 
     def check_ffmpeg(self):
-        found = False
-        
-        if shutil.which("ffmpeg") and shutil.which("ffprobe"):
-            found = True
-            print("FFmpeg sistem PATH'inde bulundu.")
-
-        elif hasattr(sys, '_MEIPASS'):
-             meipass_path = os.path.join(sys._MEIPASS, 'ffmpeg', 'bin')
-             if os.path.exists(os.path.join(meipass_path, "ffmpeg.exe")):
-                 found = True
-                 print("FFmpeg, paketlenmiş (MEIPASS) yolda bulundu.")
-                 
-        elif os.path.exists(os.path.join(TARGET_BIN_PATH, "ffmpeg.exe")):
-            found = True
-            print(f"FFmpeg '{TARGET_BIN_PATH}' içinde bulundu.")
+        """ Konum tool_locator'da bir kez çözülür; pencere açılışları yeniden dosya sistemi taraması yapmaz. """
+        found = get_tool_locator().is_available()
         
         if not found:
             print("FFmpeg bulunamadı.")
@@ -1104,7 +1355,7 @@ class DownloaderApp(QWidget):
         self.ffmpeg_thread.progress_signal.connect(self.update_ffmpeg_progress)
         self.ffmpeg_thread.finished_signal.connect(self.finish_ffmpeg_download)
         
-        self.progress_dialog.canceled.connect(self.ffmpeg_thread.terminate) 
+        self.progress_dialog.canceled.connect(self.ffmpeg_thread.cancel) 
         self.ffmpeg_thread.start()
 
     @Slot(int, str)
@@ -1255,28 +1506,7 @@ class DownloaderApp(QWidget):
         fade_out.start()
 
     def get_current_language_code(self):
-        try:
-            lang_index = settings_manager.get_setting(KEY_LANGUAGE_INDEX)
-            
-            lang_list = ["", "türkçe", "english", "español", "deutsch", "français", "italiano", "português", "русский", "عربي", "中文"]
-            selected_language = lang_list[lang_index].lower()
-            
-            language_code = {
-                "türkçe": "tr",
-                "english": "en",
-                "español": "es",
-                "deutsch": "de",
-                "français": "fr",
-                "italiano": "it",
-                "português": "pt",
-                "русский": "ru",
-                "عربي": "ar",
-                "中文": "zh"
-            }.get(selected_language, "tr") 
-            return language_code
-        except (IndexError, KeyError, Exception) as e:
-            print(f"Dil ayarı okunurken hata: {e}. Varsayılan 'tr' kullanılıyor.")
-            return "tr" 
+        return current_language_code()
 
     def change_language(self):
         language_code = self.get_current_language_code()
@@ -1313,6 +1543,7 @@ class DownloaderApp(QWidget):
         self.options_group.setTitle(lang.get("group_options", "Download Options"))
 
         self.validate_button.setText(lang.get("validate", "Validate"))
+        self.bulk_button.setText(lang.get("bulk_add_button", "Bulk Add"))
         self.download_button.setText(lang.get("download", "Download"))
         self.url_label.setText(lang.get("url_label", "URL:"))
         self.folder_label.setText(lang.get("folder_label", "Download Folder:"))
@@ -1358,31 +1589,11 @@ class DownloaderApp(QWidget):
         self.validate_button.setEnabled(False) 
         current_lang_code = self.get_current_language_code()
         lang = LANGUAGES[current_lang_code]
-        if self.service == "youtube":
-            regex = r"(https?://)?(www\.)?(youtube\.com/watch\?v=|youtu\.be/|youtube\.com/playlist\?list=|music\.youtube\.com/watch\?v=)"
-            error_msg = lang.get("youtube_invalid_url", "Geçersiz YouTube URL'si!")
-        elif self.service == "twitter":
-            regex = r"(https?://)?(www\.)?(twitter\.com|x\.com)/(.+?)/status/(\d+)"
-            error_msg = lang.get("twitter_invalid_url", "Geçersiz Twitter (X) URL'si!")
-        elif self.service == "facebook":
-            regex = r"(https?://)?(www\.)?(facebook\.com|fb\.watch)/(watch|video\.php|.+/videos|reel)(.+)"
-            error_msg = lang.get("facebook_invalid_url", "Geçersiz Facebook URL'si!")
-        elif self.service == "tiktok":
-            regex = r"(https?://)?(www\.)?(tiktok\.com/(@.+/video|\d+)|vm\.tiktok\.com/([a-zA-Z0-9]+))"
-            error_msg = lang.get("tiktok_invalid_url", "Geçersiz TikTok URL'si!")
-        elif self.service == "instagram":
-            regex = r"(https?://)?(www\.)?(instagram\.com)/(p|reel|tv)/([^/?#&]+)"
-            error_msg = lang.get("instagram_invalid_url", "Geçersiz Instagram URL'si!")
-        elif self.service == "soundcloud":
-            regex = r"(https?://)?(www\.)?(soundcloud\.com)/(.+)"
-            error_msg = lang.get("soundcloud_invalid_url", "Geçersiz SoundCloud URL'si!")
-        elif self.service == "reddit":
-            regex = r"(https?://)?(www\.)?(reddit\.com)/r/([^/]+)/comments/([^/?#&]+)"
-            error_msg = lang.get("reddit_invalid_url", "Geçersiz Reddit URL'si!")
+        if self.service in url_classifier.SERVICES:
+            error_msg = lang.get(f"{self.service}_invalid_url", "Geçersiz URL!")
         else:
-            regex = r"http" 
             error_msg = "Bilinmeyen servis."
-        match = re.search(regex, url)
+        match = url_classifier.is_valid(url, self.service)
         if match:
             self.fetch_video_info(url) 
             if self.service == "youtube":
@@ -1397,14 +1608,20 @@ class DownloaderApp(QWidget):
             return
         
     def fetch_video_info(self, url):
-        def fetch_info():
-            video_info = self.get_video_info(url) 
-            self.video_info_signal.emit(video_info)
-        thread = threading.Thread(target=fetch_info)
-        thread.start()
+        """ Bilgiyi paylaşılan havuzda alır; bu pencerenin önceki (artık geçersiz) isteklerinin sonucu gösterilmez. """
+        get_fetch_executor().request(self, url, self.get_video_info, self.video_info_signal.emit, group=self.service)
 
     def get_video_info(self, url):                          
         try:
+            is_playlist_url = self.service == "youtube" and ("playlist?list=" in url or "&list=" in url)
+            metadata_kind = "playlist" if is_playlist_url else "video"
+            metadata_cache = get_metadata_cache()
+            if metadata_cache is not None:
+                cached_info = metadata_cache.get(url, metadata_kind)
+                if cached_info:
+                    logger.info(f"Video bilgisi disk önbelleğinden alındı: {url}")
+                    return cached_info
+
             ydl_opts = {
                 'quiet': True,
                 'extract_flat': False, 
@@ -1417,13 +1634,19 @@ class DownloaderApp(QWidget):
                 print(f"Bilgi alınırken kullanılan çerez: {cookie_path}")
                 ydl_opts['cookiefile'] = cookie_path
 
-            if self.service == "youtube":
-                if "playlist?list=" in url or "&list=" in url:
-                    ydl_opts['noplaylist'] = False
-                    ydl_opts['extract_flat'] = True
+            if is_playlist_url:
+                ydl_opts['noplaylist'] = False
+                ydl_opts['extract_flat'] = True
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info_dict = ydl.extract_info(url, download=False)
+            with get_ydl_pool().acquire(ydl_opts) as ydl:
+                if is_playlist_url:
+                    info_dict = ydl.extract_info(url, download=False)
+                    get_info_cache().put(url, info_dict, flat=True)
+                else:
+                    # İşlenmemiş sonuç önbelleğe alınır; indirme bunu kendi format seçimiyle yeniden işler.
+                    raw_info = ydl.extract_info(url, download=False, process=False)
+                    get_info_cache().put(url, raw_info)
+                    info_dict = ydl.process_ie_result(raw_info, download=False)
                 
                 title = info_dict.get('title', 'Başlık Bulunamadı')
                 thumbnail = info_dict.get('thumbnail')
@@ -1445,8 +1668,10 @@ class DownloaderApp(QWidget):
                                 ydl_video_opts['noplaylist'] = True
                                 ydl_video_opts['extract_flat'] = False
                                 
-                                with yt_dlp.YoutubeDL(ydl_video_opts) as ydl_video:
-                                    video_info_dict = ydl_video.extract_info(first_video_url, download=False)
+                                with get_ydl_pool().acquire(ydl_video_opts) as ydl_video:
+                                    raw_video_info = ydl_video.extract_info(first_video_url, download=False, process=False)
+                                    get_info_cache().put(first_video_url, raw_video_info)
+                                    video_info_dict = ydl_video.process_ie_result(raw_video_info, download=False)
                                     title = info_dict.get('title', 'Playlist Başlığı') 
                                     thumbnail = video_info_dict.get('thumbnail', info_dict.get('thumbnail'))
                                     for f in video_info_dict.get('formats', []):
@@ -1477,7 +1702,7 @@ class DownloaderApp(QWidget):
                 if not quality_list: 
                      quality_list = ["N/A"] 
 
-                return {
+                video_info = {
                     'title': title,
                     'thumbnail': thumbnail,
                     'quality_list': quality_list,
@@ -1485,6 +1710,9 @@ class DownloaderApp(QWidget):
                     'duration': duration,
                     'views': views_str
                 }
+                if metadata_cache is not None:
+                    metadata_cache.put(url, video_info, metadata_kind)
+                return video_info
         except Exception as e:
             print(f"Bilgi alınırken hata: {e}")
             return {"error": str(e)}
@@ -1524,6 +1752,7 @@ class DownloaderApp(QWidget):
         if thumbnail_url:
             self.show_thumbnail(thumbnail_url)
         else:
+            self.current_thumbnail_url = None
             self.thumbnail_label.clear()
 
         self.progress_bar.setValue(0) 
@@ -1574,26 +1803,22 @@ class DownloaderApp(QWidget):
         self.zoom_anim = zoom_anim
 
     def show_thumbnail(self, thumbnail_url):
-        try:
-            response = requests.get(thumbnail_url, timeout=10)
-            if response.status_code == 200:
-                image_data = response.content
-                pixmap = QPixmap()
-                if pixmap.loadFromData(image_data):
-                    scaled_pixmap = pixmap.scaled(
-                        self.thumbnail_label.size(),
-                        Qt.KeepAspectRatio,
-                        Qt.SmoothTransformation
-                    )
-                    self.thumbnail_label.setPixmap(scaled_pixmap)
-                    self.thumbnail_label.setAlignment(Qt.AlignCenter)
-                    
-                else:
-                    self.thumbnail_label.setText("Görsel yüklenemedi")
-            else:
-                self.thumbnail_label.setText(f"HTTP Hatası: {response.status_code}")
-        except Exception as e:
-            self.thumbnail_label.setText(f"Hata: {str(e)}")
+        """ Küçük resmi arka planda yükletir; sonuç on_thumbnail_ready / on_thumbnail_failed ile gelir. """
+        self.current_thumbnail_url = thumbnail_url
+        self.thumbnail_loader.load(thumbnail_url, self.thumbnail_label.size())
+
+    @Slot(str, QImage)
+    def on_thumbnail_ready(self, thumbnail_url, image):
+        if thumbnail_url != self.current_thumbnail_url:
+            return
+        self.thumbnail_label.setPixmap(QPixmap.fromImage(image))
+        self.thumbnail_label.setAlignment(Qt.AlignCenter)
+
+    @Slot(str, str)
+    def on_thumbnail_failed(self, thumbnail_url, message):
+        if thumbnail_url != self.current_thumbnail_url:
+            return
+        self.thumbnail_label.setText(message)
 
     def start_zoom_animation(self):
         self.setFixedSize(780, 580)
@@ -1605,16 +1830,8 @@ class DownloaderApp(QWidget):
         zoom_anim.start()
         self.zoom_anim = zoom_anim
 
-    def start_download(self):
-        if hasattr(self, 'download_thread') and self.download_thread.isRunning():
-            lang_code = self.get_current_language_code()
-            lang = LANGUAGES.get(lang_code, LANGUAGES["en"])
-            QMessageBox.warning(self, 
-                lang.get("download_error", "Hata"), 
-                "Zaten devam eden bir indirme var. Lütfen bitmesini bekleyin."
-            )
-            return
-        url = self.url_entry.text().strip()
+    def build_job_options(self, url, download_type_key=None):
+        """ Penceredeki seçeneklerden bir kuyruk işi için DownloadThread seçeneklerini oluşturur. """
         folder = self.folder_entry.text().strip()
         current_lang_code = self.get_current_language_code()
         lang = LANGUAGES[current_lang_code]
@@ -1622,8 +1839,9 @@ class DownloaderApp(QWidget):
             quality = self.quality_combo.currentText()
             video_format = self.list_type_combo.currentText()
             output_format = self.format_combo.currentText()
-            download_type_text = self.download_type_combo.currentText()
-            download_type_key = "playlist" if download_type_text == lang["type_playlist"] else "video"
+            if download_type_key is None:
+                download_type_text = self.download_type_combo.currentText()
+                download_type_key = "playlist" if download_type_text == lang["type_playlist"] else "video"
             download_subs = self.subtitle_checkbox.isChecked()
             sub_langs = self.subtitle_lang_entry.text().strip()
         elif self.service == "soundcloud": 
@@ -1640,26 +1858,147 @@ class DownloaderApp(QWidget):
             download_type_key = "video"
             download_subs = False
             sub_langs = ""
+        return {
+            'url': url,
+            'download_folder': folder,
+            'quality': quality,
+            'video_format': video_format,
+            'output_format': output_format,
+            'download_type_key': download_type_key,
+            'language_code': current_lang_code,
+            'download_subs': download_subs,
+            'sub_langs': sub_langs,
+            'cookie_file_path': self.cookie_file_path,
+            'playlist_workers': settings_manager.get_setting(KEY_PLAYLIST_WORKERS),
+            'keep_partial_files': settings_manager.get_setting(KEY_KEEP_PARTIAL_FILES),
+            'use_archive': settings_manager.get_setting(KEY_USE_DOWNLOAD_ARCHIVE),
+        }
+
+    def start_download(self):
+        url = self.url_entry.text().strip()
+        lang = LANGUAGES[self.get_current_language_code()]
         if not url:
             QMessageBox.warning(self, "Hata", "Lütfen geçerli bir URL giriniz!")
             return
-        self.download_button.setEnabled(False)
-        self.download_button.setText(lang.get("download_starting", "Download starting..."))
         try:
-            self.download_thread = DownloadThread(
-                url, folder, quality, video_format, output_format, 
-                download_type_key, current_lang_code, download_subs, 
-                sub_langs, self.cookie_file_path 
-            )
-            self.download_thread.progress_signal.connect(self.update_progress)
-            self.download_thread.finished_signal.connect(self.download_finished)
-            self.download_thread.start()
+            job_id = self.download_queue.submit(self.service, self.build_job_options(url))
+            self.my_jobs.add(job_id)
+            if job_id not in self.download_queue.active:
+                self.progress_bar.setValue(0)
+                self.progress_bar.setFormat(
+                    lang.get("download_queued", "🕒 Added to the queue (#{job_id}).").format(job_id=job_id)
+                )
             self.show_cancel_button()  
         except Exception as e:
-            self.download_button.setEnabled(True)
-            self.download_button.setText(lang.get("download", "Download"))
             QMessageBox.critical(self, "Hata", f"İndirme başlatılamadı: {e}")
 
+    def show_bulk_dialog(self):
+        lang = LANGUAGES[self.get_current_language_code()]
+        dialog = BulkUrlDialog(lang, parent=self)
+        if dialog.exec() != QDialog.Accepted:
+            return
+        self.start_bulk_import(dialog.urls())
+
+    def start_bulk_import(self, urls):
+        """
+        URL'ler tek geçişte sınıflandırılır; bu servise ait olanların bilgisi sınırlı havuzda sırayla çıkarılır
+        ve her biri hazır olduğu anda kuyruğa eklenir (önceki indirmeler sonrakilerin çıkarılmasını beklemez).
+        """
+        lang = LANGUAGES[self.get_current_language_code()]
+        accepted = [url for url, service in url_classifier.classify_many(urls) if service == self.service]
+        skipped = len(urls) - len(accepted)
+        if settings_manager.get_setting(KEY_USE_DOWNLOAD_ARCHIVE):
+            archive = get_download_archive()
+            not_downloaded = [url for url in accepted if not archive.contains_url(url)]
+            if len(not_downloaded) != len(accepted):
+                logger.info(f"Toplu içe aktarma: {len(accepted) - len(not_downloaded)} URL zaten indirilmiş, atlandı.")
+            skipped += len(accepted) - len(not_downloaded)
+            accepted = not_downloaded
+        if skipped:
+            QMessageBox.information(self, self.bulk_button.text(),
+                lang.get("bulk_skipped", "{skipped} URL(s) were skipped (another service, invalid or already downloaded).").format(skipped=skipped))
+        if not accepted:
+            return
+
+        self.stop_bulk_import()
+        self.bulk_importer = BulkImporter(accepted, self.get_video_info, group=self.service,
+                                          backlog=self.download_queue.pending_count, parent=self)
+        self.download_queue.job_started_signal.connect(self.bulk_importer.resume)
+        self.bulk_importer.entry_ready.connect(self.on_bulk_entry_ready)
+        self.bulk_importer.entry_failed.connect(self.on_bulk_entry_failed)
+        self.bulk_importer.progress.connect(self.on_bulk_progress)
+        self.bulk_importer.finished.connect(self.on_bulk_finished)
+        self.bulk_importer.start()
+
+    def stop_bulk_import(self):
+        """ Süren toplu içe aktarmayı durdurur; sinyalleri ayrılır, yeni iş kuyruğa eklenmez. """
+        if not self.bulk_importer:
+            return
+        importer, self.bulk_importer = self.bulk_importer, None
+        importer.cancel()
+        self.download_queue.job_started_signal.disconnect(importer.resume)
+        importer.entry_ready.disconnect(self.on_bulk_entry_ready)
+        importer.entry_failed.disconnect(self.on_bulk_entry_failed)
+        importer.progress.disconnect(self.on_bulk_progress)
+        importer.finished.disconnect(self.on_bulk_finished)
+        importer.deleteLater()
+
+    @Slot(str, object)
+    def on_bulk_entry_ready(self, url, info):
+        if self.sender() is not self.bulk_importer:
+            return
+        try:
+            job_id = self.download_queue.submit(self.service, self.build_job_options(url))
+            self.my_jobs.add(job_id)
+            self.bulk_jobs[job_id] = url
+            self.show_cancel_button()
+        except Exception as e:
+            logger.error(f"Toplu içe aktarma: iş kuyruğa eklenemedi ({url}): {e}")
+            self.bulk_failures.append(f"{url}: {e}")
+
+    @Slot(str, str)
+    def on_bulk_entry_failed(self, url, error):
+        if self.sender() is not self.bulk_importer:
+            return
+        self.bulk_failures.append(f"{url}: {error}")
+
+    @Slot(int, int)
+    def on_bulk_finished(self, ready, failed):
+        if self.sender() is not self.bulk_importer:
+            return
+        self.stop_bulk_import()
+        if not self.bulk_jobs:
+            self.show_bulk_summary()
+
+    def show_bulk_summary(self):
+        """ Toplu içe aktarmanın tüm işleri bitince tek bir özet gösterir (iş başına ayrı pencere açılmaz). """
+        lang = LANGUAGES[self.get_current_language_code()]
+        completed, failures = self.bulk_completed, self.bulk_failures
+        self.bulk_completed, self.bulk_failures = 0, []
+        summary = lang.get("bulk_summary", "Bulk import finished: {completed} downloaded, {failed} failed.").format(
+            completed=completed, failed=len(failures))
+        self.progress_bar.setFormat(summary)
+        if failures:
+            details = "\n".join(failures[:self.BULK_SUMMARY_MAX_FAILURES])
+            if len(failures) > self.BULK_SUMMARY_MAX_FAILURES:
+                details += f"\n... (+{len(failures) - self.BULK_SUMMARY_MAX_FAILURES})"
+            QMessageBox.warning(self, self.bulk_button.text(), f"{summary}\n\n{details}")
+        else:
+            self.progress_bar.setValue(100)
+            QMessageBox.information(self, self.bulk_button.text(), summary)
+        if not self.my_jobs:
+            self.hide_cancel_button()
+
+    @Slot(int, int, int)
+    def on_bulk_progress(self, ready, failed, total):
+        if self.sender() is not self.bulk_importer:
+            return
+        lang = LANGUAGES[self.get_current_language_code()]
+        self.progress_bar.setFormat(
+            lang.get("bulk_progress", "📋 Bulk: {ready}/{total} queued, {failed} failed").format(
+                ready=ready, failed=failed, total=total)
+        )
+
     def show_settings_dialog(self):
         dialog = SettingsDialog(parent=self)
         dialog.exec()
@@ -1716,14 +2055,13 @@ class DownloaderApp(QWidget):
     def cancel_download(self):
         current_lang_code = self.get_current_language_code()
         lang = LANGUAGES[current_lang_code]
-        if hasattr(self, 'download_thread') and self.download_thread.isRunning():
-            try:
-                self.download_thread.terminate()
-                self.download_thread.wait()
-            except Exception as e:
-                print(f"Thread sonlandırılırken hata: {e}")
-            self.download_button.setEnabled(True)
-            self.download_button.setText(lang.get("download", "Download"))
+        self.stop_bulk_import()
+        self.bulk_jobs.clear()
+        self.bulk_completed, self.bulk_failures = 0, []
+        if self.my_jobs:
+            for job_id in list(self.my_jobs):
+                self.download_queue.cancel(job_id)
+            self.my_jobs.clear()
             self.progress_bar.setValue(0)
             self.progress_bar.setFormat(lang.get("download_canceled", "Download canceled."))
             if hasattr(self, 'cancel_button'):
@@ -1731,6 +2069,52 @@ class DownloaderApp(QWidget):
                 self.cancel_button.setText(lang.get("download_canceled", "Download canceled."))
             QMessageBox.information(self, "İptal", lang.get("download_canceled", "Download canceled."))
 
+    def queue_status_text(self):
+        lang = LANGUAGES.get(self.get_current_language_code(), LANGUAGES["en"])
+        active = sum(1 for job_id in self.my_jobs if job_id in self.download_queue.active)
+        pending = len(self.my_jobs) - active
+        text = lang.get("queue_status", "Active: {active} | Queued: {pending}").format(active=active, pending=pending)
+        if self.queue_eta is not None:
+            text += " | " + lang.get("queue_eta", "⏳ Queue: {eta}").format(eta=format_eta(self.queue_eta))
+        return text
+
+    @Slot(dict)
+    def update_queue_estimate(self, estimate):
+        self.queue_eta = estimate.get('eta')
+
+    @Slot(object)
+    def update_jobs_progress(self, snapshots):
+        mine = [(job_id, snapshot) for job_id, snapshot in snapshots.items() if job_id in self.my_jobs]
+        if not mine:
+            return
+        job_id, snapshot = max(mine, key=lambda item: item[1].get('updated_at', 0))
+        percent, status = format_progress(snapshot, self.get_current_language_code())
+        if len(self.my_jobs) > 1:
+            status = f"**[#{job_id}]** {self.queue_status_text()}\n{status}"
+        self.update_progress(percent, status)
+
+    @Slot(int, str)
+    def job_finished(self, job_id, status):
+        if job_id not in self.my_jobs:
+            return
+        self.my_jobs.discard(job_id)
+        is_error = "❌" in status or "error" in status.lower() or "hata" in status.lower()
+        if job_id in self.bulk_jobs:
+            url = self.bulk_jobs.pop(job_id)
+            if is_error:
+                self.bulk_failures.append(f"{url}: {status.splitlines()[0]}")
+            else:
+                self.bulk_completed += 1
+            if self.bulk_jobs or self.bulk_importer:
+                self.progress_bar.setFormat(f"{'❌' if is_error else '✅'} **[#{job_id}]** {self.queue_status_text()}")
+            else:
+                self.show_bulk_summary()
+            return
+        if self.my_jobs and not is_error:
+            self.progress_bar.setFormat(f"✅ **[#{job_id}]** {self.queue_status_text()}")
+            return
+        self.download_finished(status)
+
     @Slot(int, str)
     def update_progress(self, percent, status):
         self.progress_bar.setValue(percent)
@@ -1740,8 +2124,6 @@ class DownloaderApp(QWidget):
     def download_finished(self, status):
         current_lang_code = self.get_current_language_code()
         lang = LANGUAGES[current_lang_code]
-        self.download_button.setEnabled(True)
-        self.download_button.setText(lang.get("download", "Download"))
         if isinstance(status, str):
             if "✅" in status or "completed" in status.lower() or "tamamlandı" in status.lower():
                 self.progress_bar.setValue(100)
@@ -1752,6 +2134,10 @@ class DownloaderApp(QWidget):
                 QMessageBox.critical(self, "Hata", status)
             else:
                 QMessageBox.information(self, "Bilgi", status)
+        if not self.my_jobs and not self.bulk_importer:
+            self.hide_cancel_button()
+
+    def hide_cancel_button(self):
         if hasattr(self, 'cancel_button'):
             opacity_effect = QGraphicsOpacityEffect(self.cancel_button)
             self.cancel_button.setGraphicsEffect(opacity_effect)
@@ -1772,17 +2158,78 @@ class DownloaderApp(QWidget):
             self.save_settings()
 
 class ShimmerProgressBar(QProgressBar):
+    """
+    Yuvarlatılmış, parıltı animasyonlu ilerleme çubuğu.
+    Animasyon yalnızca çubuk görünürken ve ilerleme 0 ile maksimum arasındayken çalışır.
+    Tema renkleri stil değiştiğinde bir kez, metin düzeni ise metin / genişlik değiştiğinde yeniden hesaplanır.
+    """
+    SHIMMER_INTERVAL_MS = 25
+    SHIMMER_WIDTH = 120
+    RADIUS = 12
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.shimmer_offset = 0
         self.timer = QTimer(self)
+        self.timer.setInterval(self.SHIMMER_INTERVAL_MS)
         self.timer.timeout.connect(self.update_shimmer)
-        self.timer.start(25)
         self.setTextVisible(True)
         self.setFont(QFont("Segoe UI", 10, QFont.Bold))
         self.custom_text = ""
+        self._layout_key = None
+        self._base_gradient = None
+        self._base_gradient_key = None
+        self._shimmer_gradient = QLinearGradient(0, 0, self.SHIMMER_WIDTH, 0)
+        self._shimmer_gradient.setColorAt(0.0, QColor(255, 255, 255, 0))
+        self._shimmer_gradient.setColorAt(0.5, QColor(255, 255, 255, 120))
+        self._shimmer_gradient.setColorAt(1.0, QColor(255, 255, 255, 0))
+        self._resolve_theme()
+        self.valueChanged.connect(self._update_animation_state)
+
+    def _resolve_theme(self):
+        light = "background-color: #D3D3D3" in self.styleSheet()
+        if light:
+            self._background = QColor(211, 211, 211)
+            self._border = QPen(QColor(180, 180, 180), 1.5)
+            self._fill_start, self._fill_end = QColor(0, 120, 255), QColor(0, 80, 200)
+            self._text_color = QColor(0, 0, 0)
+        else:
+            self._background = QColor(40, 40, 40)
+            self._border = QPen(QColor(60, 60, 60), 1.5)
+            self._fill_start, self._fill_end = QColor(255, 60, 60), QColor(200, 0, 0)
+            self._text_color = QColor(255, 255, 255)
+        self._base_gradient_key = None
+        self._layout_key = None
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.StyleChange:
+            self._resolve_theme()
+        super().changeEvent(event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._update_animation_state()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.timer.stop()
+
+    def is_animating(self):
+        return self.timer.isActive()
+
+    @Slot()
+    def _update_animation_state(self):
+        busy = self.minimum() < self.value() < self.maximum()
+        if busy and self.isVisible():
+            if not self.timer.isActive():
+                self.timer.start()
+        elif self.timer.isActive():
+            self.timer.stop()
+            self.update()
 
     def setFormat(self, text):
+        if text == self.custom_text:
+            return
         self.custom_text = text
         self.update() 
 
@@ -1795,53 +2242,53 @@ class ShimmerProgressBar(QProgressBar):
             self.shimmer_offset = -150
         self.update()
 
+    def _layout_text(self, width):
+        """ Markdown benzeri metni yalnızca metin, genişlik veya renk değiştiğinde yeniden düzenler. """
+        key = (self.custom_text, width, self._text_color.rgb())
+        text_doc = self.document()
+        if key != self._layout_key:
+            html_text = self.custom_text.replace("**", "<b>").replace("</b>", "</b>", 1).replace("**", "</b>")
+            html_text = html_text.replace("\n", "<br>") 
+            text_doc.setHtml(f"<div style='color: {self._text_color.name()}; text-align: center;'>{html_text}</div>")
+            text_doc.setTextWidth(width)
+            self._layout_key = key
+        return text_doc
+
     def paintEvent(self, event):
         painter = QPainter(self)
         rect = self.rect()
-        radius = 12
+        radius = self.RADIUS
         painter.setRenderHint(QPainter.Antialiasing)
-        painter.setBrush(QColor(40, 40, 40))
-        painter.setPen(QPen(QColor(60, 60, 60), 1.5))
-        style = self.styleSheet()
-        if "background-color: #D3D3D3" in style: 
-             painter.setBrush(QColor(211, 211, 211))
-             painter.setPen(QPen(QColor(180, 180, 180), 1.5))
+        painter.setBrush(self._background)
+        painter.setPen(self._border)
         painter.drawRoundedRect(rect, radius, radius)
+
         progress_ratio = self.value() / self.maximum() if self.maximum() > 0 else 0
         filled_width = int(progress_ratio * rect.width())
-        filled_rect = QRectF(rect.left(), rect.top(), filled_width, rect.height())
-        base_color_start = QColor(255, 60, 60)
-        base_color_end = QColor(200, 0, 0)
-        if "background-color: #D3D3D3" in style: 
-             base_color_start = QColor(0, 120, 255)
-             base_color_end = QColor(0, 80, 200)
-        base_gradient = QLinearGradient(rect.left(), rect.top(), rect.right(), rect.bottom())
-        base_gradient.setColorAt(0.0, base_color_start)
-        base_gradient.setColorAt(1.0, base_color_end)
-        painter.setBrush(base_gradient)
-        painter.setPen(Qt.NoPen)
-        painter.drawRoundedRect(filled_rect, radius, radius)
-        shimmer_width = 120
-        gradient = QLinearGradient(self.shimmer_offset, 0, self.shimmer_offset + shimmer_width, 0)
-        gradient.setColorAt(0.0, QColor(255, 255, 255, 0))
-        gradient.setColorAt(0.5, QColor(255, 255, 255, 120))
-        gradient.setColorAt(1.0, QColor(255, 255, 255, 0))
-        painter.setBrush(gradient)
-        painter.drawRoundedRect(filled_rect, radius, radius)
-        text_color = QColor(255, 255, 255) 
-        if "background-color: #D3D3D3" in style: 
-             text_color = QColor(0, 0, 0) 
-        painter.setPen(text_color)
-        text_rect = rect.adjusted(5, 0, -5, 0)
-        text_doc = self.document()
-        html_text = self.text().replace("**", "<b>").replace("</b>", "</b>", 1).replace("**", "</b>")
-        html_text = html_text.replace("\n", "<br>") 
-        text_doc.setHtml(f"<div style='color: {text_color.name()}; text-align: center;'>{html_text}</div>")
-        text_doc.setTextWidth(text_rect.width())
-        painter.save()
-        painter.translate(text_rect.left(), text_rect.top() + (text_rect.height() - text_doc.size().height()) / 2)
-        text_doc.drawContents(painter)
-        painter.restore()
+        if filled_width > 0:
+            filled_rect = QRectF(rect.left(), rect.top(), filled_width, rect.height())
+            if self._base_gradient_key != rect.size():
+                self._base_gradient = QLinearGradient(rect.left(), rect.top(), rect.right(), rect.bottom())
+                self._base_gradient.setColorAt(0.0, self._fill_start)
+                self._base_gradient.setColorAt(1.0, self._fill_end)
+                self._base_gradient_key = rect.size()
+            painter.setBrush(self._base_gradient)
+            painter.setPen(Qt.NoPen)
+            painter.drawRoundedRect(filled_rect, radius, radius)
+
+            if self.timer.isActive():
+                self._shimmer_gradient.setStart(self.shimmer_offset, 0)
+                self._shimmer_gradient.setFinalStop(self.shimmer_offset + self.SHIMMER_WIDTH, 0)
+                painter.setBrush(self._shimmer_gradient)
+                painter.drawRoundedRect(filled_rect, radius, radius)
+
+        if self.custom_text:
+            text_rect = rect.adjusted(5, 0, -5, 0)
+            text_doc = self._layout_text(text_rect.width())
+            painter.save()
+            painter.translate(text_rect.left(), text_rect.top() + (text_rect.height() - text_doc.size().height()) / 2)
+            text_doc.drawContents(painter)
+            painter.restore()
 
     def document(self):
         if not hasattr(self, '_document'):
@@ -1849,74 +2296,17 @@ class ShimmerProgressBar(QProgressBar):
             self._document.setDefaultFont(self.font())
         return self._document
 
-class VideoSplashScreen(QWidget):
-    finished = Signal()
-
-    def __init__(self, video_path):
-        super().__init__()
-        
-        self.setWindowFlags(
-            Qt.FramelessWindowHint | 
-            Qt.WindowStaysOnTopHint | 
-            Qt.Tool
-        )
-        self.setAttribute(Qt.WA_TranslucentBackground)
-        self.setAttribute(Qt.WA_DeleteOnClose)
-
-        self.setStyleSheet("background: transparent;")
-
-        self.current_frame = QImage()
-
-        self.player = QMediaPlayer(self)
-        self.sink = QVideoSink(self)
-        self.player.setVideoSink(self.sink) 
-
-        self.sink.videoFrameChanged.connect(self.on_frame_changed)
-
-        video_file_url = QUrl.fromLocalFile(os.path.abspath(video_path))
-        self.player.setSource(video_file_url)
-
-        self.player.playbackStateChanged.connect(self.on_state_changed)
-        
-        self.player.play()
-
-    @Slot(QVideoFrame)
-    def on_frame_changed(self, frame):
-        if frame.isValid():
-            self.current_frame = frame.toImage().copy()
-            self.update() 
-
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        
-        if not self.current_frame.isNull():
-            target_rect = self.rect()
-            img = self.current_frame.scaled(
-                target_rect.size(), 
-                Qt.KeepAspectRatio, 
-                Qt.SmoothTransformation
-            )
-            
-            x = (target_rect.width() - img.width()) / 2
-            y = (target_rect.height() - img.height()) / 2
-            
-            painter.drawImage(int(x), int(y), img)
-        else:
-            painter.fillRect(self.rect(), Qt.transparent)
-
-    @Slot(QMediaPlayer.PlaybackState)
-    def on_state_changed(self, state):
-        if state == QMediaPlayer.PlaybackState.StoppedState:
-            self.finished.emit()
-
 if __name__ == '__main__':
     try:
         app = QApplication(sys.argv)
                 
-        video_splash_path = resource_path("assets/giris.mp4")
+        # '--no-splash' veya ayarlardaki seçenek açılış animasyonunu tamamen atlar.
+        splash = None
+        if "--no-splash" not in sys.argv[1:] and settings_manager.get_setting(KEY_SHOW_SPLASH):
+            from splash_screen import create_splash
+            splash = create_splash(resource_path("assets/giris.mp4"), resource_path("assets/logo.png"))
 
-        if not os.path.exists(video_splash_path):
-            print(f"Hata: Splash video dosyası bulunamadı: {video_splash_path}")
+        if splash is None:
             selection_window = ServiceSelectionScreen()
             screen_geometry = app.primaryScreen().availableGeometry()
             selection_window.move(
@@ -1924,9 +2314,6 @@ if __name__ == '__main__':
                 (screen_geometry.height() - selection_window.height()) // 2
             )
         else:
-            global splash 
-            splash = VideoSplashScreen(video_splash_path)
-            
             screen = app.primaryScreen()
             screen_geometry = screen.availableGeometry()
             
@@ -1949,11 +2336,11 @@ if __name__ == '__main__':
                     (screen_geometry.width() - selection_window.width()) // 2,
                     (screen_geometry.height() - selection_window.height()) // 2
                 )
-                if 'splash' in globals():
-                    splash.close()
+                splash.close()
             
             splash.finished.connect(show_selection_window)
 
+        app.aboutToQuit.connect(settings_manager.flush)
         sys.exit(app.exec())
         
     except Exception as e:
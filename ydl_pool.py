@@ -0,0 +1,120 @@
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from logger_setup import logger
+
+class YoutubeDLPool:
+    """
+    Bilgi çıkarma için uzun ömürlü, seçeneklere göre anahtarlanmış YoutubeDL örnekleri.
+    Her YoutubeDL kurulumu extractor'ları, çerez kavanozunu ve seçenekleri baştan hazırlar;
+    havuz aynı seçeneklerle yapılan çağrılarda bu maliyeti bir kez öder.
+    - Bir örnek aynı anda tek bir iş parçacığına verilir (YoutubeDL iş parçacığı güvenli değildir).
+    - Anahtar seçeneklerdir (çerez dosyasının yolu dahil). Çerez dosyası sonradan değişmişse (ör. bir indirme
+      kapanırken çerezleri kaydetti) örnek atılmaz, çerez kavanozu dosyadan yeniden yüklenir.
+    - clear() (ör. çerez yolu ayarı değişince) tüm örnekleri yeniler.
+    - Hata veren örnek havuza geri konmaz.
+    Kancalar ve çıktı şablonu gibi işe özgü seçenekler içeren indirme örnekleri havuzlanmaz.
+    """
+
+    def __init__(self, max_idle_per_key=3, max_keys=8):
+        self.max_idle_per_key = max_idle_per_key
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._idle = OrderedDict()
+        self._generation = 0
+
+    @staticmethod
+    def _key(options):
+        return repr(sorted(options.items()))
+
+    @staticmethod
+    def _cookie_stamp(options):
+        cookie_file = options.get('cookiefile')
+        try:
+            return os.path.getmtime(cookie_file) if cookie_file else None
+        except OSError:
+            return None
+
+    def _refresh_cookies(self, ydl):
+        """ Çerez kavanozunu dosyadan yeniden yükler; başarısız olursa False döner (örnek yenilenmeli). """
+        try:
+            ydl.cookiejar.clear()
+            ydl.cookiejar.load()
+            return True
+        except Exception as e:
+            logger.warning(f"Havuzdaki YoutubeDL çerezleri yenilenemedi: {e}")
+            return False
+
+    @contextmanager
+    def acquire(self, options):
+        key = self._key(options)
+        cookie_stamp = self._cookie_stamp(options)
+        ydl = None
+        with self._lock:
+            generation = self._generation
+            instances = self._idle.get(key)
+            if instances:
+                ydl, loaded_stamp = instances.pop()
+                self._idle.move_to_end(key)
+        if ydl is not None and loaded_stamp != cookie_stamp and not self._refresh_cookies(ydl):
+            self._close(ydl)
+            ydl = None
+        if ydl is None:
+            import yt_dlp
+            ydl = yt_dlp.YoutubeDL(dict(options))
+
+        try:
+            yield ydl
+        except BaseException:
+            self._close(ydl)
+            raise
+        self._release(key, generation, ydl, cookie_stamp)
+
+    def _release(self, key, generation, ydl, cookie_stamp):
+        to_close = []
+        with self._lock:
+            if generation != self._generation:
+                to_close.append(ydl)
+            else:
+                instances = self._idle.setdefault(key, [])
+                self._idle.move_to_end(key)
+                if len(instances) < self.max_idle_per_key:
+                    instances.append((ydl, cookie_stamp))
+                else:
+                    to_close.append(ydl)
+                while len(self._idle) > self.max_keys:
+                    _, evicted = self._idle.popitem(last=False)
+                    to_close.extend(instance for instance, _ in evicted)
+        for instance in to_close:
+            self._close(instance)
+
+    def clear(self):
+        """ Ayarlar veya çerezler değiştiğinde çağrılır; boştaki örnekler kapatılır, kullanımdakiler dönünce kapatılır. """
+        with self._lock:
+            self._generation += 1
+            instances = [ydl for idle in self._idle.values() for ydl, _ in idle]
+            self._idle.clear()
+        for ydl in instances:
+            self._close(ydl)
+        if instances:
+            logger.info(f"YoutubeDL havuzu yenilendi ({len(instances)} örnek kapatıldı).")
+
+    @staticmethod
+    def _close(ydl):
+        try:
+            ydl.close()
+        except Exception as e:
+            logger.warning(f"YoutubeDL örneği kapatılamadı: {e}")
+
+
+_ydl_pool = None
+_ydl_pool_lock = threading.Lock()
+
+def get_ydl_pool():
+    global _ydl_pool
+    with _ydl_pool_lock:
+        if _ydl_pool is None:
+            _ydl_pool = YoutubeDLPool()
+        return _ydl_pool